@@ -0,0 +1,254 @@
+import os
+import sys
+import csv
+import json
+import math
+import time
+import argparse
+import contextlib
+import statistics
+import multiprocessing
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from headless import HeadlessSession # Sets the dummy SDL drivers before pygame loads
+import game_state
+import main as game_main
+import entities.hive
+import systems.sim
+from entities.flower import FLOWER_DATA
+from game_state import GAME_DAY_SECONDS
+
+# Scripted player: grows a farm up to max_hives, keeps flowers around each
+# hive, harvests and sells on a fixed interval and buys upgrades it can afford
+DEFAULT_POLICY = {
+    "max_hives": 6,
+    "flowers_per_hive": 6,
+    "flower_type": "Clover",
+    "action_interval": 10.0, # Game seconds between policy decisions
+    "buy_upgrades": True,
+    "upgrade_reserve": 40, # Money kept back when buying upgrades
+}
+
+# Balance knobs a run can override (values are restored after each run)
+OVERRIDE_KEYS = ("hive_cost", "kid_spawn_chance", "upgrade_initial_cost", "upgrade_cost_per_level", "flower_data")
+
+METRICS = ("honey_harvested", "money_earned", "money", "flowers_lost", "hives", "flowers", "upgrade_level")
+
+# Playable area used for placement slots (keeps clear of the HUD bars)
+HIVE_GRID_ORIGIN = (110, 110)
+HIVE_GRID_STEP = 170
+HIVE_GRID_COLUMNS = 5
+FLOWER_RING_RADIUS = 80
+
+
+@contextlib.contextmanager
+def balance_overrides(overrides):
+    """Temporarily patches the tunable economy constants in this process."""
+    overrides = overrides or {}
+    unknown = set(overrides) - set(OVERRIDE_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown balance overrides: {sorted(unknown)}")
+
+    main_hive_cost, sim_kid_chance, upgrade_initial, upgrade_step, flower_data = (
+        game_main.HIVE_COST, systems.sim.KID_SPAWN_CHANCE_PER_SECOND,
+        game_state.UPGRADE_INITIAL_COST, game_state.UPGRADE_COST_PER_LEVEL,
+        {name: dict(data) for name, data in FLOWER_DATA.items()},
+    )
+    try:
+        if "hive_cost" in overrides:
+            game_main.HIVE_COST = game_state.HIVE_COST = entities.hive.HIVE_COST = overrides["hive_cost"]
+        if "kid_spawn_chance" in overrides:
+            systems.sim.KID_SPAWN_CHANCE_PER_SECOND = overrides["kid_spawn_chance"]
+        if "upgrade_initial_cost" in overrides:
+            game_state.UPGRADE_INITIAL_COST = overrides["upgrade_initial_cost"]
+        if "upgrade_cost_per_level" in overrides:
+            game_state.UPGRADE_COST_PER_LEVEL = overrides["upgrade_cost_per_level"]
+        for name, changes in overrides.get("flower_data", {}).items():
+            FLOWER_DATA[name].update(changes)
+        yield
+    finally:
+        game_main.HIVE_COST = game_state.HIVE_COST = entities.hive.HIVE_COST = main_hive_cost
+        systems.sim.KID_SPAWN_CHANCE_PER_SECOND = sim_kid_chance
+        game_state.UPGRADE_INITIAL_COST = upgrade_initial
+        game_state.UPGRADE_COST_PER_LEVEL = upgrade_step
+        for name, data in flower_data.items():
+            FLOWER_DATA[name].clear()
+            FLOWER_DATA[name].update(data)
+
+
+class ScriptedPolicy:
+    """Deterministic placement/harvest/sell strategy driven by a policy dict."""
+
+    def __init__(self, policy):
+        self.policy = dict(DEFAULT_POLICY, **(policy or {}))
+        self.next_slot = 0
+
+    def _hive_slot(self, index):
+        col, row = index % HIVE_GRID_COLUMNS, index // HIVE_GRID_COLUMNS
+        return (HIVE_GRID_ORIGIN[0] + col * HIVE_GRID_STEP, HIVE_GRID_ORIGIN[1] + row * HIVE_GRID_STEP)
+
+    def act(self, session, day_stats):
+        gs = session.game_state
+        policy = self.policy
+
+        # Harvest and sell first so the money is available for building
+        honey_before = gs.honey
+        session.harvest_all()
+        day_stats["honey_harvested"] += gs.honey - honey_before
+        day_stats["money_earned"] += session.sell_honey()
+
+        # Flowers around existing hives before expanding
+        flower_cost = FLOWER_DATA[policy["flower_type"]]["cost"]
+        for hive in gs.hives:
+            while len(hive.nearby_flowers) < policy["flowers_per_hive"] and gs.money >= flower_cost:
+                angle = len(hive.nearby_flowers) * 2 * math.pi / policy["flowers_per_hive"]
+                pos = (hive.pos.x + FLOWER_RING_RADIUS * math.cos(angle), hive.pos.y + FLOWER_RING_RADIUS * math.sin(angle))
+                if session.plant_flower(policy["flower_type"], pos) is None:
+                    break # Slot blocked (outside the world or too close to another flower)
+
+        if len(gs.hives) < policy["max_hives"] and gs.money >= game_main.HIVE_COST:
+            while self.next_slot < policy["max_hives"] * 2: # Skip blocked slots, but not forever
+                pos = self._hive_slot(self.next_slot)
+                self.next_slot += 1
+                if session.place_hive(pos) is not None:
+                    break
+
+        if policy["buy_upgrades"] and gs.money >= gs.get_upgrade_cost() + policy["upgrade_reserve"]:
+            with session._output():
+                gs.purchase_upgrade()
+
+
+def run_one(job):
+    """Runs one seeded game for N days in this process; returns per-day rows."""
+    run_index, seed, days, policy, overrides, bee_engine = job
+    with balance_overrides(overrides):
+        session = HeadlessSession(bee_engine=bee_engine, seed=seed)
+        player = ScriptedPolicy(policy)
+        interval = player.policy["action_interval"]
+        steps_per_day = max(1, int(round(GAME_DAY_SECONDS / interval)))
+
+        rows = []
+        for day in range(1, days + 1):
+            wilted_before = session.simulator.flowers_wilted
+            day_stats = {"honey_harvested": 0.0, "money_earned": 0.0}
+            for _ in range(steps_per_day):
+                player.act(session, day_stats)
+                session.run_seconds(GAME_DAY_SECONDS / steps_per_day)
+            gs = session.game_state
+            rows.append(dict(
+                day_stats, run=run_index, seed=seed, day=day, money=gs.money,
+                flowers_lost=session.simulator.flowers_wilted - wilted_before,
+                hives=len(gs.hives), flowers=len(gs.flowers), upgrade_level=gs.production_upgrade_level,
+            ))
+    return rows
+
+
+class DayTable:
+    """Incrementally aggregates per-day metrics across runs."""
+
+    def __init__(self):
+        self.values = {} # (day, metric) -> list of values
+        self.runs = 0
+
+    def add_run(self, rows):
+        self.runs += 1
+        for row in rows:
+            for metric in METRICS:
+                self.values.setdefault((row["day"], metric), []).append(row[metric])
+
+    def rows(self):
+        days = sorted({day for day, _ in self.values})
+        table = []
+        for day in days:
+            for metric in METRICS:
+                values = sorted(self.values[(day, metric)])
+                table.append({
+                    "day": day, "metric": metric, "runs": len(values),
+                    "mean": statistics.fmean(values),
+                    "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+                    "p10": values[int(0.1 * (len(values) - 1))],
+                    "median": statistics.median(values),
+                    "p90": values[int(0.9 * (len(values) - 1))],
+                })
+        return table
+
+
+def run_batch(runs, days, seed=0, policy=None, overrides=None, bee_engine="object", workers=None, on_run=None):
+    """Runs `runs` independent games across a process pool; returns a DayTable.
+
+    on_run(rows, done) is called in the parent as each run finishes.
+    """
+    jobs = [(i, seed + i, days, policy, overrides, bee_engine) for i in range(runs)]
+    table = DayTable()
+    workers = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(processes=workers) as pool:
+        for rows in pool.imap_unordered(run_one, jobs):
+            table.add_run(rows)
+            if on_run:
+                on_run(rows, table.runs)
+    return table
+
+
+def _parse_assignments(pairs):
+    """Parses key=value pairs; values are JSON when possible, else strings."""
+    result = {}
+    for pair in pairs or []:
+        key, _, value = pair.partition("=")
+        try:
+            result[key] = json.loads(value)
+        except json.JSONDecodeError:
+            result[key] = value
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo economy balancing across a process pool.")
+    parser.add_argument("--runs", type=int, default=32)
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0, help="Base seed; run i uses seed + i")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: every core)")
+    parser.add_argument("--swarm", action="store_true", help="Use the batched NumPy bee engine")
+    parser.add_argument("--policy", nargs="*", metavar="KEY=VALUE", help=f"Policy settings, e.g. max_hives=8 ({', '.join(DEFAULT_POLICY)})")
+    parser.add_argument("--set", nargs="*", metavar="KEY=VALUE", dest="overrides",
+                        help=f"Balance overrides, e.g. hive_cost=25 ({', '.join(OVERRIDE_KEYS)})")
+    parser.add_argument("--csv", help="Write the aggregated table to this CSV file")
+    parser.add_argument("--raw-csv", help="Write every per-run, per-day row to this CSV file")
+    args = parser.parse_args(argv)
+
+    policy = _parse_assignments(args.policy)
+    overrides = _parse_assignments(args.overrides)
+    raw_rows = []
+    start = time.perf_counter()
+
+    def on_run(rows, done):
+        raw_rows.extend(rows)
+        elapsed = time.perf_counter() - start
+        print(f"[{done}/{args.runs}] run {rows[0]['run']} done, "
+              f"{done * args.days / elapsed * 60:.0f} simulated days/min", file=sys.stderr)
+
+    table = run_batch(args.runs, args.days, args.seed, policy, overrides,
+                      "swarm" if args.swarm else "object", args.workers, on_run)
+
+    fields = ["day", "metric", "runs", "mean", "stdev", "p10", "median", "p90"]
+    rows = table.rows()
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.raw_csv:
+        with open(args.raw_csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["run", "seed", "day"] + list(METRICS))
+            writer.writeheader()
+            writer.writerows(sorted(raw_rows, key=lambda r: (r["run"], r["day"])))
+
+    print(f"{'day':>4} {'metric':<16} {'mean':>10} {'stdev':>10} {'p10':>10} {'median':>10} {'p90':>10}")
+    for row in rows:
+        print(f"{row['day']:>4} {row['metric']:<16} {row['mean']:>10.2f} {row['stdev']:>10.2f} "
+              f"{row['p10']:>10.2f} {row['median']:>10.2f} {row['p90']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
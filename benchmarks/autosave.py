@@ -0,0 +1,142 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import contextlib
+import statistics
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_dir)
+
+import pygame
+from systems.sim import SIM_TICK_SECONDS
+from systems.save import StateCapture, encode_snapshot
+from systems.autosave import Autosaver
+from headless import DiscardOutput
+from benchmarks.hot_paths import build_garden, DEFAULT_SEED
+
+AUTOSAVE_BENCH_FORMAT_VERSION = 2
+DEFAULT_HIVES = 2000 # With 5 bees each and the flowers: 112k entities
+DEFAULT_FLOWERS = 100000
+SAMPLES = 9
+FRAME_SECONDS = 1.0 / 60
+FRAME_BUDGET_MS = FRAME_SECONDS * 1000 # Main-thread autosave frames over this fail the run
+PACED_FRAMES = 60 # Frames timed around each autosave (the save is submitted on the first)
+# Autosaves timed; the budget check takes the median one, since single frames
+# on a busy machine spike past the budget with no autosave at all
+AUTOSAVE_TRIALS = 5
+
+
+def _median_ms(operation, samples=SAMPLES):
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+
+def paced_frames(simulator, autosaver):
+    """Main-thread work (ms) per frame of a 60 FPS loop, with one autosave submitted on the first frame.
+
+    Each frame runs one sim tick, then sleeps out the rest of the frame
+    like the game's clock does; the autosave worker encodes meanwhile.
+    Also returns how many frames the capture took to be queued (0: no autosave).
+    """
+    simulator.autosaver = autosaver
+    work = []
+    capture_frames = 0
+    deadline = time.perf_counter()
+    for frame in range(PACED_FRAMES):
+        start = time.perf_counter()
+        if frame == 0 and autosaver is not None:
+            autosaver.submit(simulator.game_state, simulator) # At a tick boundary, like the day rollover
+        simulator.tick(SIM_TICK_SECONDS) # Copies dormant chunks as they catch up
+        work.append((time.perf_counter() - start) * 1000)
+        if autosaver is not None and (frame == 0 or autosaver.capture is not None):
+            capture_frames = frame + 1
+        deadline += FRAME_SECONDS
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+    simulator.autosaver = None
+    return work, capture_frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures what an autosave costs the main thread at a fixed garden size.")
+    parser.add_argument("--hives", type=int, default=DEFAULT_HIVES)
+    parser.add_argument("--flowers", type=int, default=DEFAULT_FLOWERS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", "-o", help="Write JSON results here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    with contextlib.redirect_stdout(DiscardOutput()): # The game's print() chatter
+        gs, simulator = build_garden(args.hives, args.flowers, args.seed, spread="world")
+        for _ in range(120): # Bees out of their hives
+            simulator.tick(SIM_TICK_SECONDS)
+        entities = len(gs.hives) + len(gs.flowers) + len(gs.bees) + len(gs.kids)
+
+        # The part of a capture that runs inside the rollover tick (dormant chunks are copied over the next ticks)
+        capture_ms, capture_max_ms = _median_ms(lambda: StateCapture(gs, simulator))
+        snapshot = StateCapture(gs, simulator).finish()
+        encode_ms, _ = _median_ms(lambda: encode_snapshot(snapshot))
+
+        autosaver = Autosaver(os.path.join(repo_dir, "benchmark_autosave.phs")) # Idle through the plain frames, like a game's first day
+        plain, _ = paced_frames(simulator, None)
+        trials = [paced_frames(simulator, autosaver) for _ in range(AUTOSAVE_TRIALS)] # The worker is idle again by the next
+        autosaver.close()
+        os.remove(autosaver.path)
+
+    submits = [work[0] for work, _ in trials]
+    worst = [max(work[:capture_frames]) for work, capture_frames in trials] # Submit frame and the frames copying dormant chunks
+    later = [ms for work, _ in trials for ms in work[1:]]
+    worst_ms = statistics.median(worst)
+    results = {
+        "entities": entities,
+        "capture_ms": capture_ms, "capture_max_ms": capture_max_ms, # Main thread, in the rollover tick
+        "encode_ms": encode_ms, # Worker thread
+        "frame_ms_plain": {"median": statistics.median(plain), "max": max(plain)},
+        "frame_ms_saving": {"submit": statistics.median(submits), "submit_max": max(submits),
+                            "capture_frames": max(capture_frames for _, capture_frames in trials),
+                            "capture_worst": worst_ms, "capture_worst_max": max(worst),
+                            "median": statistics.median(later), "max": max(later)},
+        "frame_budget_ms": FRAME_BUDGET_MS,
+        "within_budget": worst_ms <= FRAME_BUDGET_MS,
+    }
+    saving = results["frame_ms_saving"]
+    print(f"{entities} entities: capture {capture_ms:.1f} ms (max {capture_max_ms:.1f}) on the main thread, "
+          f"encode {encode_ms:.1f} ms on the worker", file=sys.stderr)
+    print(f"frame work: plain median {results['frame_ms_plain']['median']:.2f} max {results['frame_ms_plain']['max']:.2f} ms; "
+          f"with autosave ({AUTOSAVE_TRIALS} trials): submit frame {saving['submit']:.2f} ms (max {saving['submit_max']:.2f}), "
+          f"worst of {saving['capture_frames']} capture frames {worst_ms:.2f} ms (max {saving['capture_worst_max']:.2f}), "
+          f"later frames median {saving['median']:.2f} max {saving['max']:.2f} ms", file=sys.stderr)
+
+    report = {
+        "format": AUTOSAVE_BENCH_FORMAT_VERSION,
+        "meta": {
+            "seed": args.seed, "hives": args.hives, "flowers": args.flowers,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "pygame": pygame.version.ver,
+            "machine": platform.machine(), "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if not results["within_budget"]:
+        print(f"FAIL: the median autosave's worst frame took {worst_ms:.2f} ms of main-thread work, "
+              f"over the {FRAME_BUDGET_MS:.1f} ms frame budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
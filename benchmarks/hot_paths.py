@@ -0,0 +1,205 @@
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import contextlib
+import statistics
+
+# Offscreen: dummy SDL drivers, no window, no audio device
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_dir)
+
+import pygame
+from game_state import GameState, GameMode, SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from entities.hive import Hive
+from entities.bee import Bee
+from entities.flower import Flower
+from systems.sim import Simulator, SIM_TICK_SECONDS
+from systems.render import Renderer, AssetManager
+from main import check_placement_validity
+from headless import DiscardOutput
+from ui import hud
+
+BENCHMARK_FORMAT_VERSION = 1
+DEFAULT_SEED = 1234
+# name -> (hives, flowers, spread); every hive gets its usual HIVE_CAPACITY (5) bees.
+# "screen" packs the garden into the first screen (all of it in view), "world" spreads it over the whole world
+SCENARIOS = {
+    "small": (10, 100, "screen"),
+    "medium": (100, 2000, "screen"),
+    "large": (1000, 5000, "screen"),
+    "huge": (1000, 20000, "screen"),
+    "world": (2000, 50000, "world"),
+}
+# Run in this order: sim_tick goes last because it is the only one that changes the garden,
+# so the others always measure the exact post-warmup state whatever the sample counts
+OPERATIONS = ("draw_gameplay", "draw_hud", "placement_validity", "sim_tick")
+FLOWER_TYPES = ("Clover", "Lavender", "Sunflower") # Types with sprites in assets/
+WARMUP_TICKS = 120 # Lets bees spread out of their hives before timing
+PLACEMENT_PROBES = 200 # Positions checked per placement_validity sample
+MIN_SAMPLES = 5
+MAX_SAMPLES = 200
+TARGET_SECONDS = 1.0 # Per operation; sampling stops at whichever limit comes first
+
+
+def build_garden(hives, flowers, seed, bee_engine="object", spread="screen"):
+    """Synthetic garden at a fixed scale; the same seed always gives the same layout.
+
+    Entities are added directly (no costs, no spacing rules) so any scale fits
+    the area: the first screen (clear of the HUD bars) or the whole world.
+    The camera stays at the world's top-left corner.
+    """
+    layout = random.Random(seed)
+    gs = GameState(seed=seed)
+    gs.game_mode = GameMode.GAMEPLAY
+    gs.selected_action = "select"
+    if spread == "world":
+        play_area = (20, 20, WORLD_WIDTH - 20, WORLD_HEIGHT - 20)
+    else:
+        play_area = (20, 60, SCREEN_WIDTH - 20, SCREEN_HEIGHT - 100)
+    for _ in range(hives):
+        hive = Hive((layout.uniform(play_area[0], play_area[2]), layout.uniform(play_area[1], play_area[3])))
+        gs.add_hive(hive)
+        for _ in range(hive.max_bees):
+            gs.add_bee(Bee(hive))
+    for _ in range(flowers):
+        pos = (layout.uniform(play_area[0], play_area[2]), layout.uniform(play_area[1], play_area[3]))
+        gs.add_flower(Flower(pos, layout.choice(FLOWER_TYPES)))
+    simulator = Simulator(gs, bee_engine=bee_engine)
+    return gs, simulator
+
+
+def _sample(operation):
+    """Times operation() repeatedly; returns per-call milliseconds."""
+    samples = []
+    deadline = time.perf_counter() + TARGET_SECONDS
+    while len(samples) < MAX_SAMPLES and (len(samples) < MIN_SAMPLES or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "samples": len(ordered),
+        "min_ms": ordered[0],
+        "median_ms": statistics.median(ordered),
+        "mean_ms": statistics.fmean(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, 95 * len(ordered) // 100)],
+    }
+
+
+def run_scenario(name, seed=DEFAULT_SEED, bee_engine="object", operations=OPERATIONS):
+    """Builds one scenario and times each operation separately. Returns result rows."""
+    hives, flowers, spread = SCENARIOS[name]
+    screen = pygame.display.get_surface()
+    asset_manager = AssetManager()
+    renderer = Renderer(GameState(seed=seed), asset_manager) # Loads sprites/fonts and the entities' shared sprites
+    gs, simulator = build_garden(hives, flowers, seed, bee_engine, spread)
+    renderer.game_state = gs
+
+    for _ in range(WARMUP_TICKS):
+        simulator.tick(SIM_TICK_SECONDS)
+
+    probes = random.Random(seed + 1)
+    positions = [(probes.uniform(0, SCREEN_WIDTH), probes.uniform(0, SCREEN_HEIGHT)) for _ in range(PLACEMENT_PROBES)]
+    actions = ["place_hive", "place_flower_clover"] * (PLACEMENT_PROBES // 2)
+
+    def placement():
+        for action, pos in zip(actions, positions):
+            check_placement_validity(gs, action, pos)
+
+    timed = {
+        "sim_tick": lambda: simulator.tick(SIM_TICK_SECONDS),
+        "draw_gameplay": lambda: renderer.draw_gameplay(screen),
+        "draw_hud": lambda: hud.draw_hud(screen, asset_manager, gs),
+        "placement_validity": placement,
+    }
+    rows = []
+    for operation in sorted(operations, key=OPERATIONS.index):
+        stats = _summarize(_sample(timed[operation]))
+        if operation == "placement_validity": # Report per check, not per batch of probes
+            stats = {k: (v / PLACEMENT_PROBES if k.endswith("_ms") else v) for k, v in stats.items()}
+        rows.append(dict(scenario=name, operation=operation, hives=len(gs.hives), flowers=len(gs.flowers),
+                         bees=len(gs.bees), **stats))
+    return rows
+
+
+def compare(results, baseline, threshold):
+    """Median-vs-baseline ratios per (scenario, operation); returns the list of regressions."""
+    old = {(r["scenario"], r["operation"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"{'scenario':<8} {'operation':<20} {'baseline':>10} {'now':>10} {'change':>8}", file=sys.stderr)
+    for row in results:
+        before = old.get((row["scenario"], row["operation"]))
+        if before is None:
+            continue
+        change = row["median_ms"] / before["median_ms"] - 1 if before["median_ms"] else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{row['scenario']:<8} {row['operation']:<20} {before['median_ms']:>10.4f} {row['median_ms']:>10.4f} "
+              f"{change:>+7.1%}{flag}", file=sys.stderr)
+        if flag:
+            regressions.append((row["scenario"], row["operation"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times the sim and render hot paths on fixed synthetic gardens.")
+    parser.add_argument("--scenarios", nargs="*", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--operations", nargs="*", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--swarm", action="store_true", help="Use the batched NumPy bee engine")
+    parser.add_argument("--output", "-o", help="Write JSON results here (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON from an earlier run to compare medians against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Slowdown that counts as a regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    os.chdir(repo_dir) # Asset paths are relative to the repo root
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    bee_engine = "swarm" if args.swarm else "object"
+
+    results = []
+    with contextlib.redirect_stdout(DiscardOutput()): # The game's print() chatter
+        for name in args.scenarios:
+            results.extend(run_scenario(name, args.seed, bee_engine, args.operations))
+            for row in results[-len(args.operations):]:
+                print(f"{row['scenario']:<8} {row['operation']:<20} median {row['median_ms']:9.4f} ms  "
+                      f"p95 {row['p95_ms']:9.4f} ms  ({row['samples']} samples)", file=sys.stderr)
+
+    report = {
+        "format": BENCHMARK_FORMAT_VERSION,
+        "meta": {
+            "seed": args.seed, "bee_engine": bee_engine,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "pygame": pygame.version.ver,
+            "machine": platform.machine(), "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
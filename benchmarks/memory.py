@@ -0,0 +1,142 @@
+import os
+import gc
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_dir)
+
+import pygame
+from game_state import GameState, SCREEN_WIDTH, SCREEN_HEIGHT
+from entities.hive import Hive
+from entities.bee import Bee
+from entities.flower import Flower
+from entities.kid import Kid
+
+MEMORY_FORMAT_VERSION = 1
+DEFAULT_SEED = 1234
+# kind -> entities built per measurement
+COUNTS = {
+    "flower": 100000,
+    "hive": 10000,
+    "bee": 50000,
+    "kid": 10000,
+}
+
+
+def _traced_bytes(build):
+    """Bytes allocated by build() that are still alive afterwards (its result is kept while measuring)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def measure_kind(kind, count, seed=DEFAULT_SEED):
+    """Bytes per entity for one kind: the bare objects, and resident in a GameState.
+
+    Resident adds the GameState bookkeeping each entity costs: its list
+    slot, registry entry, spatial index entry and hive roster slot.
+    """
+    rng = random.Random(seed)
+    positions = [(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)) for _ in range(count)]
+    gs = GameState(seed=seed)
+    home = Hive((SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
+    gs.add_hive(home)
+    make = {
+        "flower": lambda pos: Flower(pos, "Clover"),
+        "hive": lambda pos: Hive(pos),
+        "bee": lambda pos: Bee(home),
+        "kid": lambda pos: Kid(gs.hives, rng),
+    }[kind]
+    add = {"flower": gs.add_flower, "hive": gs.add_hive, "bee": gs.add_bee, "kid": gs.add_kid}[kind]
+
+    def build_resident():
+        for pos in positions:
+            add(make(pos))
+        gs.new_bees.clear() # Only held until the simulator's next tick
+        return gs
+
+    objects = _traced_bytes(lambda: [make(pos) for pos in positions]) # Includes one list slot each
+    resident = _traced_bytes(build_resident)
+    return {
+        "kind": kind, "count": count,
+        "object_bytes": objects / count,
+        "resident_bytes": resident / count,
+        "resident_mb": resident / 2 ** 20,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Resident bytes per entity vs baseline; returns the list of regressions."""
+    old = {r["kind"]: r for r in baseline["results"]}
+    regressions = []
+    print(f"{'kind':<8} {'baseline B':>11} {'now B':>9} {'change':>8}", file=sys.stderr)
+    for row in results:
+        before = old.get(row["kind"])
+        if before is None:
+            continue
+        change = row["resident_bytes"] / before["resident_bytes"] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{row['kind']:<8} {before['resident_bytes']:>11.0f} {row['resident_bytes']:>9.0f} {change:>+7.1%}{flag}",
+              file=sys.stderr)
+        if flag:
+            regressions.append((row["kind"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures bytes per entity (bare objects and resident in a GameState).")
+    parser.add_argument("--kinds", nargs="*", default=list(COUNTS), choices=list(COUNTS))
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplies every entity count")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", "-o", help="Write JSON results here (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.05, help="Growth that counts as a regression (0.05 = 5%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for kind in args.kinds:
+        row = measure_kind(kind, max(1, int(COUNTS[kind] * args.scale)), args.seed)
+        results.append(row)
+        print(f"{kind:<8} x{row['count']:<7} object {row['object_bytes']:6.0f} B  resident {row['resident_bytes']:6.0f} B"
+              f"  ({row['resident_mb']:.1f} MB)", file=sys.stderr)
+
+    report = {
+        "format": MEMORY_FORMAT_VERSION,
+        "meta": {
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "pygame": pygame.version.ver,
+            "machine": platform.machine(), "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
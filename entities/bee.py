@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 
 # Bee States
@@ -9,82 +8,164 @@ class BeeState:
     FORAGING = 2    # At flower, gathering nectar/pollen
     RETURNING = 3   # Flying back to hive
 
+BEE_SIZE = (16, 16) # Example size
+IDLE_LAUNCH_RATE = 0.603 # Launches per second per idle bee (the old 1% chance per 60 Hz tick)
+FORAGE_TIME_RANGE = (2.0, 4.0) # Seconds spent at a flower
+FLOWER_SEARCH_RADIUS = 200
+ARRIVAL_DISTANCE = 5
+
 class Bee:
-    def __init__(self, hive, asset_manager):
+    __slots__ = ("hive", "eid", "alive", "dense_index", "rect", "pos", "prev_pos", "state",
+                 "target_flower", "forage_timer", "speed", "wake_time", "sched_seq")
+    image = None # One sprite shared by every bee, set by load_sprites() (None when headless)
+
+    @classmethod
+    def load_sprites(cls, asset_manager):
+        cls.image = asset_manager.get_scaled_sprite('bee', BEE_SIZE)
+
+    def __init__(self, hive):
         self.hive = hive # The hive this bee belongs to
-        self.asset_manager = asset_manager
-        self.image = self.asset_manager.get_sprite('bee') # Get pre-loaded sprite
-        self.image = pygame.transform.scale(self.image, (16, 16)) # Example size
-        self.rect = self.image.get_rect(center=hive.rect.center)
+        self.eid = None # Generational ID, assigned when added to the GameState (systems.registry)
+        self.alive = False # True from add until removal; a False target is a stale reference
+        self.dense_index = -1 # Position in its GameState list
+        self.rect = pygame.Rect((0, 0), BEE_SIZE)
+        self.rect.center = hive.rect.center
         self.pos = pygame.Vector2(self.rect.center) # Use Vector2 for movement
+        self.prev_pos = (self.pos.x, self.pos.y) # Position at the previous sim tick, for render interpolation
 
         self.state = BeeState.IDLE
         self.target_flower = None
         self.forage_timer = 0.0
         self.speed = 80 # Pixels per second
-        self.wander_target = None
+        # Set by systems.sim.BeeScheduler: absolute GameState.sim_time of the next
+        # wake-up (None while flying), and the order it was scheduled in (None: not scheduled)
+        self.wake_time = None
+        self.sched_seq = None
 
-    def find_flower(self, flowers):
+    def find_flower(self, flower_index, rng):
         """Finds a nearby flower that isn't targeted by too many other bees."""
-        nearby_flowers = [f for f in flowers if self.pos.distance_to(f.pos) < 200 and f.can_be_pollinated()] # Example range
+        nearby_flowers = [f for f in flower_index.query_radius(self.pos, FLOWER_SEARCH_RADIUS) if f.can_be_pollinated()]
         if not nearby_flowers:
             return None
 
         # Basic: pick a random nearby flower for now
-        return random.choice(nearby_flowers) if nearby_flowers else None
+        return rng.choice(nearby_flowers) if nearby_flowers else None
 
-    def update(self, dt, flowers):
-        if self.state == BeeState.IDLE:
-            # Decide to fly out? Add delay?
-            if random.random() < 0.01: # Chance to start flying out
-                 self.target_flower = self.find_flower(flowers)
-                 if self.target_flower:
-                     self.state = BeeState.FLYING_OUT
-                 else: # No flowers nearby, maybe wander briefly then return to idle
-                     pass
-
-        elif self.state == BeeState.FLYING_OUT:
-            if self.target_flower and self.target_flower in flowers: # Check if flower still exists
+    def launch(self, game_state):
+        """Idle bee's launch time came up: pick a flower. Returns True if it took off."""
+        self.target_flower = self.find_flower(game_state.flower_index, game_state.rng)
+        if self.target_flower:
+            self.state = BeeState.FLYING_OUT
+            return True
+        return False # No flowers nearby, stay in the hive
+
+    def finish_foraging(self):
+        if self.target_flower:
+            self.target_flower.remove_pollinator(self) # Notify flower we're done
+        self.state = BeeState.RETURNING
+        self.target_flower = None # Clear target
+
+    def dematerialize(self):
+        """Folds the bee back into its hive while the hive is off-screen (systems.sim level of detail)."""
+        if self.state == BeeState.FORAGING and self.target_flower:
+            self.target_flower.remove_pollinator(self)
+        self.state = BeeState.IDLE
+        self.target_flower = None
+        self.forage_timer = 0.0
+        self.pos = pygame.Vector2(self.hive.rect.center)
+        self.rect.center = self.pos
+        self.prev_pos = (self.pos.x, self.pos.y)
+        self.wake_time = None
+        self.sched_seq = None # Cancels any pending wake-up or flight
+
+    def rematerialize(self, game_state):
+        """Puts a dematerialized bee at a random point of its forage cycle.
+
+        The cycle (wait in the hive, fly out, forage, fly back) is sampled in
+        proportion to the expected time spent in each part, so a hive coming
+        back into view looks like it was simulated all along. The caller
+        hands the bee to the bee engine afterwards.
+        """
+        rng = game_state.rng
+        flower = self.find_flower(game_state.flower_index, rng)
+        if flower is None:
+            return # Nothing in range: it would be waiting in the hive anyway
+        home = pygame.Vector2(self.hive.rect.center)
+        trip = max(home.distance_to(flower.pos) / self.speed, 1e-6)
+        waiting = 1.0 / IDLE_LAUNCH_RATE
+        foraging = sum(FORAGE_TIME_RANGE) / 2
+        phase = rng.uniform(0.0, waiting + trip + foraging + trip)
+        if phase < waiting:
+            return
+        phase -= waiting
+        if phase < trip:
+            self.state = BeeState.FLYING_OUT
+            self.target_flower = flower
+            self.pos = home.lerp(flower.pos, phase / trip)
+        elif phase < trip + foraging:
+            self.state = BeeState.FORAGING
+            self.target_flower = flower
+            self.pos = pygame.Vector2(flower.pos)
+            self.forage_timer = trip + foraging - phase # Time left at the flower
+            flower.add_pollinator(self)
+        else:
+            self.state = BeeState.RETURNING
+            self.pos = pygame.Vector2(flower.pos).lerp(home, min((phase - trip - foraging) / trip, 1.0))
+        self.rect.center = self.pos
+        self.prev_pos = (self.pos.x, self.pos.y)
+
+    def fly(self, dt, game_state):
+        """Moves a flying bee one tick. Returns True once it lands (at its flower or back home)."""
+        self.prev_pos = (self.pos.x, self.pos.y)
+        landed = False
+        if self.state == BeeState.FLYING_OUT:
+            if self.target_flower and self.target_flower.alive: # Flower not wilted or removed (O(1))
                 direction = (self.target_flower.pos - self.pos)
-                if direction.length() < 5: # Reached flower
-                    self.pos = self.target_flower.pos
+                if direction.length() < ARRIVAL_DISTANCE: # Reached flower
+                    self.pos = pygame.Vector2(self.target_flower.pos) # Copy, don't alias the flower's vector
                     self.state = BeeState.FORAGING
-                    self.forage_timer = random.uniform(2.0, 4.0) # Time to forage
+                    self.forage_timer = game_state.rng.uniform(*FORAGE_TIME_RANGE) # Time to forage
                     self.target_flower.add_pollinator(self) # Notify flower
+                    landed = True
                 else:
                     self.pos += direction.normalize() * self.speed * dt
-                    self.rect.center = self.pos
             else: # Target flower disappeared or was invalid
                 self.state = BeeState.RETURNING # Go back home
 
-        elif self.state == BeeState.FORAGING:
-            self.forage_timer -= dt
-            if self.forage_timer <= 0:
-                if self.target_flower:
-                    self.target_flower.remove_pollinator(self) # Notify flower we're done
-                self.state = BeeState.RETURNING
-                self.target_flower = None # Clear target
-
         elif self.state == BeeState.RETURNING:
             direction = (pygame.Vector2(self.hive.rect.center) - self.pos)
-            if direction.length() < 5: # Reached hive
+            if direction.length() < ARRIVAL_DISTANCE: # Reached hive
                 self.pos = pygame.Vector2(self.hive.rect.center)
                 self.state = BeeState.IDLE
                 self.hive.receive_bee(self) # Notify hive bee returned (carrying resources)
+                landed = True
             else:
                 self.pos += direction.normalize() * self.speed * dt
-                self.rect.center = self.pos
 
-        # Keep bee within screen bounds (basic) - might need refinement
-        self.pos.x = max(0, min(self.pos.x, SCREEN_WIDTH))
-        self.pos.y = max(0, min(self.pos.y, SCREEN_HEIGHT))
+        # No bounds clamp: bees only fly between their hive and flowers, which are placed inside the world
         self.rect.center = self.pos
+        return landed
 
+    def interpolated_rect(self, alpha):
+        """Rect at the position blended between the last two sim ticks (alpha in 0..1)."""
+        px, py = self.prev_pos
+        if alpha >= 1.0 or (px == self.pos.x and py == self.pos.y): # Stationary (foraging) bees skip the copy
+            return self.rect
+        rect = self.rect.copy()
+        rect.center = (px + (self.pos.x - px) * alpha, py + (self.pos.y - py) * alpha)
+        return rect
 
-    def draw(self, screen):
+    def draw_bounds(self):
+        """Covers every interpolated position between the last two ticks."""
+        return self.rect.union(self.interpolated_rect(0.0))
+
+    def draw_key(self, alpha=1.0):
+        if self.state == BeeState.IDLE:
+            return False # Idle bees are hidden in the hive
+        moving = self.prev_pos != (self.pos.x, self.pos.y)
+        return (True, alpha if moving else None)
+
+    def draw(self, screen, alpha=1.0):
         # Don't draw if idle inside hive (or make it look like it's inside)
         if self.state != BeeState.IDLE:
-            screen.blit(self.image, self.rect)
-
-# Need Screen Dimensions available - either pass GameState or constants
-from game_state import SCREEN_WIDTH, SCREEN_HEIGHT
\ No newline at end of file
+            screen.blit(self.image, self.interpolated_rect(alpha))
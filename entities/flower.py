@@ -10,13 +10,33 @@ FLOWER_DATA = {
 }
 
 WATERING_HEAL_AMOUNT = 50 # Amount health restored by watering
+MIN_POLLINATION_HEALTH = 10 # Bees only visit flowers above this health (both bee engines)
+FLOWER_SIZE = (32, 32) # Example size
+MIN_FADE_ALPHA = 50 # Most faded a dying flower gets
+FADE_BUCKETS = 32 # Distinct fade levels; each is a cached pre-faded surface
+HEALTH_BAR_BACKGROUND = (50, 50, 50)
 
 class Flower:
-    def __init__(self, pos, flower_type, asset_manager):
+    __slots__ = ("eid", "alive", "dense_index", "type", "cost", "max_health", "health", "wilting_rate",
+                 "rect", "pos", "is_wilting", "pollinators")
+    sprites = {} # Flower type -> shared sprites by fade bucket (last: unfaded), set by load_sprites()
+
+    @classmethod
+    def load_sprites(cls, asset_manager):
+        """Pre-fades every type's sprite once; all flowers draw from these (None where a sprite is missing)."""
+        cls.sprites = {}
+        for flower_type, data in FLOWER_DATA.items():
+            faded = [asset_manager.get_scaled_sprite(data["sprite"], FLOWER_SIZE, alpha=int(bucket * 255 / (FADE_BUCKETS - 1)))
+                     for bucket in range(FADE_BUCKETS - 1)]
+            cls.sprites[flower_type] = faded + [asset_manager.get_scaled_sprite(data["sprite"], FLOWER_SIZE)]
+
+    def __init__(self, pos, flower_type):
         if flower_type not in FLOWER_DATA:
             raise ValueError(f"Unknown flower type: {flower_type}")
 
-        self.asset_manager = asset_manager
+        self.eid = None # Generational ID, assigned when added to the GameState (systems.registry)
+        self.alive = False # True from add until removal; a False target is a stale reference
+        self.dense_index = -1 # Position in its GameState list
         self.type = flower_type
         data = FLOWER_DATA[self.type]
 
@@ -24,15 +44,13 @@ class Flower:
         self.max_health = data["health"]
         self.health = self.max_health
         self.wilting_rate = data["wilting_rate"] # Health lost per second
-        self.sprite_name = data["sprite"]
 
-        self.image = self.asset_manager.get_sprite(self.sprite_name)
-        self.image = pygame.transform.scale(self.image, (32, 32)) # Example size
-        self.rect = self.image.get_rect(center=pos)
+        self.rect = pygame.Rect((0, 0), FLOWER_SIZE)
+        self.rect.center = pos
         self.pos = pygame.Vector2(pos)
 
         self.is_wilting = True # Starts losing health immediately
-        self.pollinators = set() # Bees currently visiting this flower
+        self.pollinators = None # Set of bees visiting this flower, only while there are any
 
     def update(self, dt):
         if self.is_wilting:
@@ -50,31 +68,55 @@ class Flower:
 
     def can_be_pollinated(self):
         # Can bees visit this flower? Check health, maybe max pollinators?
-        return self.health > 10 # Example: Needs some health left
+        return self.health > MIN_POLLINATION_HEALTH
 
     def add_pollinator(self, bee):
+        if self.pollinators is None:
+            self.pollinators = set()
         self.pollinators.add(bee)
 
     def remove_pollinator(self, bee):
-        self.pollinators.discard(bee)
+        if self.pollinators:
+            self.pollinators.discard(bee)
+            if not self.pollinators:
+                self.pollinators = None
+
+    def _fade_bucket(self):
+        alpha = max(MIN_FADE_ALPHA, 255 * (self.health / self.max_health)) # Fade effect
+        return round(alpha * (FADE_BUCKETS - 1) / 255)
+
+    def get_faded_image(self):
+        """Returns the shared pre-faded sprite for the current health (no per-frame copy)."""
+        return Flower.sprites[self.type][self._fade_bucket()]
+
+    def draw_bounds(self):
+        """Screen area draw() can touch, including the health bar above."""
+        return self.rect.inflate(0, 12)
+
+    def draw_key(self, alpha=1.0):
+        """Changes whenever draw() output would change (fade level, bar width)."""
+        if self.health >= self.max_health * 0.9:
+            return (self._fade_bucket(), None)
+        return (self._fade_bucket(), int(self.rect.width * 0.8 * self.health / self.max_health))
+
+    def health_bar(self):
+        """(background rect, fill rect, fill color) of the health bar, or None when it's hidden."""
+        if self.health >= self.max_health * 0.9: # Only show if not full
+            return None
+        health_ratio = self.health / self.max_health
+        bar_width = self.rect.width * 0.8
+        bar_height = 4
+        bar_x = self.rect.centerx - bar_width / 2
+        bar_y = self.rect.top - bar_height - 2
+        health_color = (0, 200, 0) if health_ratio > 0.5 else ((255, 255, 0) if health_ratio > 0.2 else (200, 0, 0))
+        return (bar_x, bar_y, bar_width, bar_height), (bar_x, bar_y, bar_width * health_ratio, bar_height), health_color
 
     def draw(self, screen):
+        """Draws just this flower (the renderer batches whole layers instead)."""
         # Adjust appearance based on health? (e.g., slightly faded when low)
-        alpha = int(max(50, 255 * (self.health / self.max_health))) # Fade effect
-        temp_image = self.image.copy()
-        temp_image.set_alpha(alpha)
-        screen.blit(temp_image, self.rect)
-
-        # Draw health indicator (optional)
-        if self.health < self.max_health * 0.9: # Only show if not full
-            health_ratio = self.health / self.max_health
-            bar_width = self.rect.width * 0.8
-            bar_height = 4
-            bar_x = self.rect.centerx - bar_width / 2
-            bar_y = self.rect.top - bar_height - 2
-
-            # Background of health bar
-            pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-            # Foreground (current health)
-            health_color = (0, 200, 0) if health_ratio > 0.5 else ((255, 255, 0) if health_ratio > 0.2 else (200, 0, 0))
-            pygame.draw.rect(screen, health_color, (bar_x, bar_y, bar_width * health_ratio, bar_height))
\ No newline at end of file
+        screen.blit(self.get_faded_image(), self.rect)
+        bar = self.health_bar()
+        if bar:
+            background, fill, color = bar
+            pygame.draw.rect(screen, HEALTH_BAR_BACKGROUND, background)
+            pygame.draw.rect(screen, color, fill)
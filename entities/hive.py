@@ -4,26 +4,46 @@ from entities.bee import Bee # Import Bee to create them
 HIVE_COST = 20
 HIVE_CAPACITY = 5
 HONEY_THRESHOLD = 10 # Amount needed to harvest
+HIVE_SIZE = (64, 64) # Example size
+HONEY_BAR_COLOR = (255, 193, 7) # Amber
 
 class Hive:
-    def __init__(self, pos, asset_manager):
-        self.asset_manager = asset_manager
-        self.image = self.asset_manager.get_sprite('hive') # Get pre-loaded sprite
-        self.image = pygame.transform.scale(self.image, (64, 64)) # Example size
-        self.rect = self.image.get_rect(center=pos)
+    __slots__ = ("eid", "alive", "dense_index", "rect", "pos", "honey", "wax", "pollen", "max_bees", "bees",
+                 "nearby_flowers", "production_timer")
+    image = None # One sprite shared by every hive, set by load_sprites() (None when headless)
+
+    @classmethod
+    def load_sprites(cls, asset_manager):
+        cls.image = asset_manager.get_scaled_sprite('hive', HIVE_SIZE)
+
+    def __init__(self, pos):
+        self.eid = None # Generational ID, assigned when added to the GameState (systems.registry)
+        self.alive = False # True from add until removal; a False target is a stale reference
+        self.dense_index = -1 # Position in its GameState list
+        self.rect = pygame.Rect((0, 0), HIVE_SIZE)
+        self.rect.center = pos
         self.pos = pygame.Vector2(pos)
 
         self.honey = 0.0
         self.wax = 0.0
         self.pollen = 0.0
         self.max_bees = HIVE_CAPACITY
-        # Associated bees are managed in GameState.bees, filtered by hive reference
+        self.bees = [] # This hive's roster, kept current by GameState.add_bee/remove_bee
+
+        # Flowers within range, kept current by GameState add/remove events
+        self.nearby_flowers = set()
 
         self.production_timer = 0.0 # Timer for resource generation ticks
 
-    def get_associated_bees(self, all_bees):
+    def get_associated_bees(self):
         """Returns a list of bees belonging to this hive."""
-        return [bee for bee in all_bees if bee.hive == self]
+        return list(self.bees)
+
+    def add_nearby_flower(self, flower):
+        self.nearby_flowers.add(flower)
+
+    def remove_nearby_flower(self, flower):
+        self.nearby_flowers.discard(flower)
 
     def update(self, dt, game_state):
         # Production logic based on nearby flowers and active bees
@@ -33,15 +53,8 @@ class Hive:
         base_rate = game_state.get_base_production_rate() # Per second
         production_this_frame = 0
 
-        # Simple check: Any flowers nearby? (Refine distance/efficiency later)
-        nearby_flowers = False
-        for flower in game_state.flowers:
-             distance = self.pos.distance_to(flower.pos)
-             if distance < 150: # Example range for hive influence
-                 nearby_flowers = True
-                 break # At least one flower is enough for this simple model
-
-        if nearby_flowers:
+        # Simple check: Any flowers nearby? At least one flower is enough for this simple model
+        if self.nearby_flowers: # Maintained incrementally, no rescan
              # Production occurs even if bees aren't literally returning *this* frame
              # Assumes bees are generally working if flowers are available
              production_this_frame = base_rate * dt
@@ -81,17 +94,24 @@ class Hive:
             return True
         return False
 
+    def draw_bounds(self):
+        """Screen area draw() can touch, including the honey bar below."""
+        return self.rect.inflate(0, 14)
+
+    def draw_key(self, alpha=1.0):
+        """Changes whenever draw() output would change (honey bar width)."""
+        return int(self.rect.width * min(1.0, self.honey / HONEY_THRESHOLD))
+
+    def honey_bar(self):
+        """Rect of the honey level indicator under the hive, or None while it's empty."""
+        if self.honey <= 0:
+            return None
+        fill_ratio = min(1.0, self.honey / HONEY_THRESHOLD)
+        return pygame.Rect(self.rect.left, self.rect.bottom + 2, self.rect.width * fill_ratio, 5)
+
     def draw(self, screen):
+        """Draws just this hive (the renderer batches whole layers instead)."""
         screen.blit(self.image, self.rect)
-        # Draw resource level indicator (e.g., a simple bar)
-        if self.honey > 0:
-            fill_ratio = min(1.0, self.honey / HONEY_THRESHOLD)
-            indicator_height = 5
-            indicator_width = self.rect.width * fill_ratio
-            indicator_rect = pygame.Rect(
-                self.rect.left,
-                self.rect.bottom + 2,
-                indicator_width,
-                indicator_height
-            )
-            pygame.draw.rect(screen, (255, 193, 7), indicator_rect) # Amber color
\ No newline at end of file
+        bar = self.honey_bar()
+        if bar is not None:
+            pygame.draw.rect(screen, HONEY_BAR_COLOR, bar)
\ No newline at end of file
@@ -1,11 +1,12 @@
 import pygame
-import random
 import math
-from game_state import SCREEN_WIDTH, SCREEN_HEIGHT # For spawn positions
+from game_state import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT # For spawn positions
 
 KID_SPEED = 60 # Pixels per second
 KID_DESPAWN_TIME = 5.0 # Seconds before despawning if not clicked
 KID_STEAL_AMOUNT = 5 # Amount of honey stolen
+KID_SIZE = (40, 50) # Example size
+KID_SPAWN_AREA = (SCREEN_WIDTH, SCREEN_HEIGHT) # Kids walk in from the edges of an area this size around a hive
 
 class KidState:
     SPAWNING = 0
@@ -14,13 +15,23 @@ class KidState:
     FLEEING = 3 # Clicked by player
 
 class Kid:
-    def __init__(self, asset_manager, hives):
-        self.asset_manager = asset_manager
-        self.image = self.asset_manager.get_sprite('kid')
-        self.image = pygame.transform.scale(self.image, (40, 50)) # Example size
+    __slots__ = ("eid", "alive", "dense_index", "pos", "rect", "prev_pos", "state", "target_hive", "speed",
+                 "despawn_timer", "flee_timer")
+    image = None # One sprite shared by every kid, set by load_sprites() (None when headless)
 
-        self.pos = self._get_spawn_pos()
-        self.rect = self.image.get_rect(center=self.pos)
+    @classmethod
+    def load_sprites(cls, asset_manager):
+        cls.image = asset_manager.get_scaled_sprite('kid', KID_SIZE)
+
+    def __init__(self, hives, rng):
+        self.eid = None # Generational ID, assigned when added to the GameState (systems.registry)
+        self.alive = False # True from add until removal; a False target is a stale reference
+        self.dense_index = -1 # Position in its GameState list
+
+        self.pos = self._get_spawn_pos(hives, rng) # rng: GameState.rng, so spawns replay with the seed
+        self.rect = pygame.Rect((0, 0), KID_SIZE)
+        self.rect.center = self.pos
+        self.prev_pos = (self.pos.x, self.pos.y) # Position at the previous sim tick, for render interpolation
 
         self.state = KidState.SPAWNING
         self.target_hive = self._find_target_hive(hives)
@@ -28,27 +39,31 @@ class Kid:
         self.despawn_timer = KID_DESPAWN_TIME
         self.flee_timer = 0.0 # How long to flee after being clicked
 
-    def _get_spawn_pos(self):
-        """Gets a random spawn position around the edges."""
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
+    def _get_spawn_pos(self, hives, rng):
+        """Gets a random spawn position around the edges of a screen-sized area around one of the hives."""
+        area = pygame.Rect((0, 0), KID_SPAWN_AREA)
+        if hives:
+            area.center = rng.choice(hives).pos
+        area.clamp_ip(pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)) # Top-left of the world without hives
+        edge = rng.choice(['top', 'bottom', 'left', 'right'])
         margin = 50 # Distance from edge
         if edge == 'top':
-            return pygame.Vector2(random.randint(margin, SCREEN_WIDTH - margin), margin)
+            return pygame.Vector2(rng.randint(area.left + margin, area.right - margin), area.top + margin)
         elif edge == 'bottom':
-            return pygame.Vector2(random.randint(margin, SCREEN_WIDTH - margin), SCREEN_HEIGHT - margin)
+            return pygame.Vector2(rng.randint(area.left + margin, area.right - margin), area.bottom - margin)
         elif edge == 'left':
-            return pygame.Vector2(margin, random.randint(margin, SCREEN_HEIGHT - margin))
+            return pygame.Vector2(area.left + margin, rng.randint(area.top + margin, area.bottom - margin))
         else: # right
-            return pygame.Vector2(SCREEN_WIDTH - margin, random.randint(margin, SCREEN_HEIGHT - margin))
+            return pygame.Vector2(area.right - margin, rng.randint(area.top + margin, area.bottom - margin))
 
     def _find_target_hive(self, hives):
         """Finds the nearest hive to target."""
         if not hives:
             return None
-        hives.sort(key=lambda h: self.pos.distance_to(h.pos))
-        return hives[0]
+        return min(hives, key=lambda h: self.pos.distance_to(h.pos)) # Don't reorder GameState.hives
 
     def update(self, dt, game_state):
+        self.prev_pos = (self.pos.x, self.pos.y)
         self.despawn_timer -= dt
 
         if self.state == KidState.SPAWNING:
@@ -63,7 +78,7 @@ class Kid:
 
 
         if self.state == KidState.MOVING_TO_HIVE:
-            if self.target_hive not in game_state.hives: # Target hive removed?
+            if self.target_hive is None or not self.target_hive.alive: # Target hive removed (or lost in a save)?
                 self.target_hive = self._find_target_hive(game_state.hives) # Find new one
                 if not self.target_hive:
                     self.state = KidState.FLEEING # Flee if no hives left
@@ -73,7 +88,8 @@ class Kid:
 
             direction = (self.target_hive.pos - self.pos)
             if direction.length() < 10: # Reached hive vicinity
-                self.pos = self.target_hive.pos # Snap roughly to target
+                self.pos = pygame.Vector2(self.target_hive.pos) # Snap roughly to target (copy, don't alias)
+                self.rect.center = self.pos
                 self.state = KidState.STEALING
                 # Add logic for actual stealing here or in sim.py
                 print(f"Kid reached hive {self.target_hive.rect.center}!")
@@ -103,25 +119,25 @@ class Kid:
              pass
 
         elif self.state == KidState.FLEEING:
-            # Move away from center of screen or just off edge?
-            # Simple: move towards spawn edge
-            # Better: move directly away from the hive it targeted? Or away from player click?
-            flee_direction = (self.pos - pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)).normalize()
-            if flee_direction.length() == 0: # Avoid division by zero if perfectly centered
+            # Run directly away from the hive it targeted (standing on it: away from the middle of the garden)
+            flee_direction = self.pos - self.target_hive.pos if self.target_hive else pygame.Vector2()
+            if flee_direction.length_squared() == 0:
+                 flee_direction = self.pos - pygame.Vector2(WORLD_WIDTH / 2, WORLD_HEIGHT / 2)
+            if flee_direction.length_squared() == 0: # Avoid normalizing a zero vector if perfectly centered
                  flee_direction = pygame.Vector2(1, 0)
-            self.pos += flee_direction * self.speed * 1.5 * dt # Flee faster
+            self.pos += flee_direction.normalize() * self.speed * 1.5 * dt # Flee faster
             self.rect.center = self.pos
             self.flee_timer -= dt
-            if self.flee_timer <= 0 or not (0 < self.rect.centerx < SCREEN_WIDTH and 0 < self.rect.centery < SCREEN_HEIGHT):
-                 # Remove kid if flee timer runs out or it goes off-screen
-                 if self in game_state.kids: # Check if already removed
+            if self.flee_timer <= 0 or not (0 < self.rect.centerx < WORLD_WIDTH and 0 < self.rect.centery < WORLD_HEIGHT):
+                 # Remove kid if flee timer runs out or it leaves the garden
+                 if self.alive: # Check if already removed
                       game_state.remove_entity(self)
                  return # Stop processing
 
 
         # Check for despawn timer if not fleeing (fleeing handles its own removal)
         if self.state != KidState.FLEEING and self.despawn_timer <= 0:
-             if self in game_state.kids: # Check if not already removed (e.g. by click)
+             if self.alive: # Check if not already removed (e.g. by click)
                  print("Kid got bored and left.")
                  game_state.remove_entity(self)
 
@@ -133,5 +149,22 @@ class Kid:
         self.despawn_timer = 3.0 # Ensure it gets removed
 
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
\ No newline at end of file
+    def interpolated_rect(self, alpha):
+        """Rect at the position blended between the last two sim ticks (alpha in 0..1)."""
+        if alpha >= 1.0:
+            return self.rect
+        px, py = self.prev_pos
+        rect = self.rect.copy()
+        rect.center = (px + (self.pos.x - px) * alpha, py + (self.pos.y - py) * alpha)
+        return rect
+
+    def draw_bounds(self):
+        """Covers every interpolated position between the last two ticks."""
+        return self.rect.union(self.interpolated_rect(0.0))
+
+    def draw_key(self, alpha=1.0):
+        moving = self.prev_pos != (self.pos.x, self.pos.y)
+        return alpha if moving else None # Appearance never changes, only position
+
+    def draw(self, screen, alpha=1.0):
+        screen.blit(self.image, self.interpolated_rect(alpha))
\ No newline at end of file
@@ -1,5 +1,14 @@
 import pygame
+import random
 from enum import Enum
+from systems.spatial import SpatialHash
+from systems.registry import EntityRegistry, EntityList
+from systems.world import ChunkMap, Camera
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, only the swarm engine draws from np_rng
+    np = None
 
 # Game Modes Enum
 class GameMode(Enum):
@@ -11,9 +20,15 @@ class GameMode(Enum):
 # Constants
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
+WORLD_WIDTH = SCREEN_WIDTH * 8 # The garden scrolls; the screen is a camera onto it
+WORLD_HEIGHT = SCREEN_HEIGHT * 8
 FPS = 60
 GAME_DAY_SECONDS = 60 # Real seconds for one game day
 HIVE_COST = 20 # Cost to place a new hive
+HIVE_FLOWER_RANGE = 150 # Flowers closer than this count as "near" a hive
+HONEY_PRICE = 1.50 # $ per unit of honey (adjust)
+UPGRADE_INITIAL_COST = 75 # Cost of the first production upgrade
+UPGRADE_COST_PER_LEVEL = 50 # Added to the cost for each level bought
 
 # Colors (example)
 WHITE = (255, 255, 255)
@@ -26,11 +41,19 @@ BLUE = (33, 150, 243)
 
 # --- Game State Class ---
 class GameState:
-    def __init__(self):
+    def __init__(self, seed=None):
         # Core Variables
         self.game_mode = GameMode.INTRO
         self.running = True
         self.delta_time = 0.0 # Time since last frame in seconds
+        self.interpolation_alpha = 1.0 # How far rendering is between the last two sim ticks (0..1)
+
+        # Randomness: all entities and systems draw from these, so one seed replays a run exactly
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32) # Still recorded, so any run can be reproduced
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed) if np is not None else None
 
         # Audio State
         self.music_enabled = True
@@ -43,15 +66,27 @@ class GameState:
         self.pollen = 0.0
 
         # Time & Season
-        self.game_time_seconds = 0.0 # Seconds elapsed in current game day
+        self.day_ticks = 0 # Sim ticks elapsed in the current game day (the day clock)
+        self.game_time_seconds = 0.0 # Seconds elapsed in current game day, derived from day_ticks
         self.day_count = 1
         self.current_season = "Spring" # Could be enum: Spring, Summer, Autumn, Winter
+        self.sim_time = 0.0 # Total simulated seconds; bee wake-up times are on this clock
+
+        # Entities: dense lists (O(1) membership and removal, order not kept on removal)
+        # and generational IDs for every live entity
+        self.registry = EntityRegistry()
+        self.hives = EntityList()
+        self.flowers = EntityList()
+        self.bees = EntityList()
+        self.kids = EntityList()
+        self.new_bees = [] # Added since the last sim tick, waiting for the simulator to schedule them
 
-        # Entities (Lists to hold active game objects)
-        self.hives = []
-        self.flowers = []
-        self.bees = []
-        self.kids = []
+        # Spatial indexes for radius queries (bees, hives, placement)
+        self.flower_index = SpatialHash()
+        self.hive_index = SpatialHash()
+        # Chunks own the placed hives and flowers, so drawing only visits what's in view
+        self.chunks = ChunkMap()
+        self.camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (WORLD_WIDTH, WORLD_HEIGHT))
 
         # UI State
         self.active_instruction_tab = "Basics" # For instruction screen
@@ -64,9 +99,10 @@ class GameState:
         self.production_upgrade_level = 0
         self.production_rate_multiplier = 1.0 # Base multiplier
 
-        # Mouse state
+        # Mouse state (screen coordinates; camera.screen_to_world() maps them into the garden)
         self.mouse_pos = (0, 0)
         self.mouse_pressed = [False, False, False] # Left, Middle, Right
+        self.scroll_keys = set() # Camera scroll keys currently held down
 
         # Miscellaneous Flags
         self.needs_redraw = True # Flag to force redraw when state changes significantly
@@ -84,9 +120,7 @@ class GameState:
 
     def get_upgrade_cost(self):
         """Calculates the cost of the next production upgrade."""
-        initial_cost = 75
-        increase_per_level = 50
-        return initial_cost + (self.production_upgrade_level * increase_per_level)
+        return UPGRADE_INITIAL_COST + (self.production_upgrade_level * UPGRADE_COST_PER_LEVEL)
 
     def purchase_upgrade(self):
         """Attempts to purchase the production upgrade."""
@@ -100,31 +134,97 @@ class GameState:
             print(f"Not enough money for upgrade. Need ${cost}, have ${self.money}.")
             return False
 
+    def sell_honey(self):
+        """Sells all stored honey at HONEY_PRICE. Returns the earnings."""
+        amount = self.honey
+        if amount > 0:
+            earnings = amount * HONEY_PRICE
+            self.money += earnings
+            self.honey = 0
+            print(f"Sold {amount:.2f} honey for ${earnings:.2f}")
+            return earnings
+        else:
+            print("No honey to sell.")
+            return 0
+
+    def get_entity(self, eid):
+        """The live entity with this ID, or None once it has been removed."""
+        return self.registry.get(eid)
+
     def add_hive(self, hive):
+        self.registry.register(hive)
         self.hives.append(hive)
+        self.hive_index.insert(hive, hive.pos)
+        self.chunks.add_hive(hive)
+        for flower in self.flower_index.query_radius(hive.pos, HIVE_FLOWER_RANGE):
+            hive.add_nearby_flower(flower)
 
     def add_flower(self, flower):
+        self.registry.register(flower)
         self.flowers.append(flower)
+        self.flower_index.insert(flower, flower.pos)
+        self.chunks.add_flower(flower)
+        for hive in self.hive_index.query_radius(flower.pos, HIVE_FLOWER_RANGE):
+            hive.add_nearby_flower(flower)
+
+    def remove_flower(self, flower):
+        """Drops a flower from the list, the index and nearby hives' counts (no refund)."""
+        self.flowers.remove(flower)
+        self.registry.release(flower) # Bees still targeting it see flower.alive == False
+        self.flower_index.remove(flower)
+        self.chunks.remove_flower(flower)
+        for hive in self.hive_index.query_radius(flower.pos, HIVE_FLOWER_RANGE):
+            hive.remove_nearby_flower(flower)
 
     def add_bee(self, bee):
+        """Adds a bee to the game and to its hive's roster (the hive -> bees index)."""
+        self.registry.register(bee)
         self.bees.append(bee)
+        bee.hive.bees.append(bee)
+        self.new_bees.append(bee)
+
+    def remove_bee(self, bee):
+        self.bees.remove(bee)
+        bee.hive.bees.remove(bee) # Roster is at most a hive's capacity
+        self.registry.release(bee) # Also drops it from new_bees: the simulator skips dead bees
+        bee.sched_seq = None # Cancels its pending wake-up in the simulator
 
     def add_kid(self, kid):
+        self.registry.register(kid)
         self.kids.append(kid)
 
+    def remove_kid(self, kid):
+        self.kids.remove(kid)
+        self.registry.release(kid)
+
+    def clear_entities(self):
+        """Removes every entity (before a restore); references to them all go stale."""
+        for bee in self.bees:
+            bee.sched_seq = None # Cancels their wake-ups, in case a simulator still holds them
+        for entities in (self.hives, self.flowers, self.bees, self.kids):
+            for entity in entities:
+                self.registry.release(entity)
+            entities.clear()
+        self.new_bees.clear()
+        self.flower_index.clear()
+        self.hive_index.clear()
+        self.chunks.clear()
+
     def remove_entity(self, entity_to_remove):
         """Removes a given entity (hive, flower, kid) from the game state lists."""
         if entity_to_remove in self.hives:
-            # Handle bees associated with this hive if necessary
-            bees_to_remove = [bee for bee in self.bees if bee.hive == entity_to_remove]
-            for bee in bees_to_remove:
-                self.bees.remove(bee)
+            # Its bees go too: O(roster), without scanning GameState.bees
+            for bee in list(entity_to_remove.bees):
+                self.remove_bee(bee)
             self.hives.remove(entity_to_remove)
+            self.registry.release(entity_to_remove)
+            self.hive_index.remove(entity_to_remove)
+            self.chunks.remove_hive(entity_to_remove)
             self.money += 10 # 50% refund for $20 hive
             print("Hive removed.")
             return True
         elif entity_to_remove in self.flowers:
-            self.flowers.remove(entity_to_remove)
+            self.remove_flower(entity_to_remove)
             # Refund based on original cost (needs flower type info)
             # Example: Assuming flower object has 'cost' attribute
             if hasattr(entity_to_remove, 'cost'):
@@ -132,11 +232,11 @@ class GameState:
             print("Flower removed.")
             return True
         elif entity_to_remove in self.kids:
-            self.kids.remove(entity_to_remove)
+            self.remove_kid(entity_to_remove)
             print("Kid removed (chased away).")
             return True
         elif entity_to_remove in self.bees: # Should usually be handled by hive removal
-             self.bees.remove(entity_to_remove)
+             self.remove_bee(entity_to_remove)
              return True
         return False
 
@@ -0,0 +1,142 @@
+import os
+import sys
+import math
+import time
+import argparse
+import contextlib
+
+# No window, no audio device, no pygame banner: only Rect/Vector2 math is used
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from game_state import GameState, GameMode, GAME_DAY_SECONDS
+from systems.sim import Simulator, SIM_TICK_SECONDS
+from main import check_placement_validity, place_hive, plant_flower
+from systems.save import save_game, load_game
+
+
+class DiscardOutput:
+    """stdout sink for the game's print() chatter (used with contextlib.redirect_stdout)."""
+
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+
+class HeadlessSession:
+    """GameState + Simulator with no display, audio or sprites.
+
+    No Renderer is created, so no sprites are ever loaded (entity classes'
+    shared images stay None); the simulation runs in fixed ticks as fast as the CPU allows.
+    """
+
+    def __init__(self, bee_engine="object", quiet=True, seed=None, lod=True):
+        self.game_state = GameState(seed=seed)
+        self.game_state.game_mode = GameMode.GAMEPLAY
+        self.game_state.selected_action = "select"
+        self.simulator = Simulator(self.game_state, bee_engine=bee_engine, lod=lod)
+        self.quiet = quiet # Swallow the game's print() chatter (it dominates run time)
+        self.ticks = 0
+
+    def _output(self):
+        if self.quiet:
+            return contextlib.redirect_stdout(DiscardOutput())
+        return contextlib.nullcontext()
+
+    def place_hive(self, pos):
+        """Places a hive like a player click would. Returns the hive or None."""
+        with self._output():
+            if not check_placement_validity(self.game_state, "place_hive", pos):
+                return None
+            return place_hive(self.game_state, pos)
+
+    def plant_flower(self, flower_type, pos):
+        """Plants a flower like a player click would. Returns the flower or None."""
+        with self._output():
+            action = f"place_flower_{flower_type.lower()}"
+            if not check_placement_validity(self.game_state, action, pos):
+                return None
+            return plant_flower(self.game_state, flower_type, pos)
+
+    def harvest_all(self):
+        """Harvests every hive that is full enough. Returns how many were harvested."""
+        with self._output():
+            return sum(1 for hive in self.game_state.hives if hive.harvest(self.game_state))
+
+    def sell_honey(self):
+        with self._output():
+            return self.game_state.sell_honey()
+
+    def save(self, path):
+        """Writes a checkpoint. Returns the size in bytes."""
+        return save_game(path, self.game_state, self.simulator)
+
+    def load(self, path):
+        """Fast-forwards to a checkpoint; the run continues exactly as if it had never stopped."""
+        load_game(path, self.game_state, self.simulator)
+
+    def run_ticks(self, ticks):
+        with self._output():
+            tick = self.simulator.tick
+            for _ in range(ticks):
+                tick(SIM_TICK_SECONDS)
+        self.ticks += ticks
+
+    def run_seconds(self, seconds):
+        self.run_ticks(int(round(seconds / SIM_TICK_SECONDS)))
+
+    def run_days(self, days):
+        self.run_seconds(days * GAME_DAY_SECONDS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the PixelHive simulation with no display or audio.")
+    parser.add_argument("--days", type=float, default=1.0, help="Simulated game days to run")
+    parser.add_argument("--hives", type=int, default=4, help="Hives to place on a grid before running")
+    parser.add_argument("--flowers", type=int, default=40, help="Clover to plant around them")
+    parser.add_argument("--swarm", action="store_true", help="Use the batched NumPy bee engine")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: random, printed at the end)")
+    parser.add_argument("--no-lod", action="store_true", help="Simulate the whole world in full, not just around the camera")
+    parser.add_argument("--resume", metavar="PATH", help="Start from a checkpoint instead of a fresh layout")
+    parser.add_argument("--checkpoint", metavar="PATH", help="Write a checkpoint here when the run ends")
+    parser.add_argument("--verbose", action="store_true", help="Show the game's console output")
+    args = parser.parse_args(argv)
+
+    session = HeadlessSession(bee_engine="swarm" if args.swarm else "object", quiet=not args.verbose, seed=args.seed,
+                              lod=not args.no_lod)
+    gs = session.game_state
+    if args.resume:
+        session.load(args.resume)
+    else:
+        gs.money = 10 ** 9 # Setup isn't meant to be limited by the economy
+
+        # Simple deterministic layout: hives on a grid, flowers in rings around them
+        for i in range(args.hives):
+            session.place_hive((120 + (i % 6) * 150, 120 + (i // 6) * 150))
+        for i in range(args.flowers):
+            hive_pos = gs.hives[i % len(gs.hives)].pos if gs.hives else (512, 384)
+            ring = 60 + (i // max(1, len(gs.hives))) % 3 * 20
+            angle = i * 2.399963 # Golden angle spreads flowers evenly
+            session.plant_flower("Clover", (hive_pos[0] + ring * math.cos(angle), hive_pos[1] + ring * math.sin(angle)))
+        gs.money = 100
+
+    start = time.perf_counter()
+    session.run_days(args.days)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {args.days:g} day(s), {session.ticks} ticks in {elapsed:.2f}s "
+          f"({session.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    print(f"Seed {gs.seed}. Day {gs.day_count}: hives={len(gs.hives)} flowers={len(gs.flowers)} bees={len(gs.bees)} "
+          f"hive honey={sum(h.honey for h in gs.hives):.1f}")
+    if args.checkpoint:
+        print(f"Checkpoint: {args.checkpoint} ({session.save(args.checkpoint)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
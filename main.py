@@ -7,17 +7,31 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
-from game_state import GameState, GameMode, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, HIVE_COST, WHITE, BLACK, RED, GREEN
-from entities.hive import Hive, HONEY_THRESHOLD
-from entities.flower import Flower, FLOWER_DATA
+from game_state import GameState, GameMode, SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, FPS, HIVE_COST, WHITE, BLACK, RED, GREEN
+from entities.hive import Hive, HONEY_THRESHOLD, HIVE_SIZE
+from entities.flower import Flower, FLOWER_DATA, FLOWER_SIZE
 from entities.bee import Bee # Import Bee
 from systems.sim import Simulator
 from systems.render import Renderer, AssetManager
+from systems.save import save_game, load_game, SaveFormatError, DEFAULT_SAVE_PATH
+from systems.autosave import Autosaver, AUTOSAVE_PATH
+from systems.recording import InputRecorder
+from systems.profiler import profiler
 from ui import menu, hud # Import UI modules for click handling
 
+CAMERA_SCROLL_SPEED = 600 # Pixels per second while a scroll key is held
+SCROLL_KEYS = { # Arrow keys or WASD move the camera over the garden
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+}
+# Farthest a hive or flower rect reaches from its position (its chunk is the one under its position)
+PICK_MARGIN = max(HIVE_SIZE + FLOWER_SIZE) // 2
+
 # --- Helper Functions ---
 def check_placement_validity(game_state, item_type, pos):
-    """Checks if placing an item at pos is valid (e.g., not overlapping)."""
+    """Checks if placing an item at pos (world coordinates) is valid (e.g., not overlapping)."""
     new_rect_size = (0, 0)
     min_distance = 0 # Minimum distance to other objects of same/conflicting type
 
@@ -33,33 +47,81 @@ def check_placement_validity(game_state, item_type, pos):
     new_rect = pygame.Rect(0, 0, *new_rect_size)
     new_rect.center = pos
 
-    # 1. Check screen bounds (allow some margin)
+    # 1. Check world bounds (allow some margin); the HUD is checked on screen by over_hud()
     margin = 10
-    if not (margin < new_rect.left and new_rect.right < SCREEN_WIDTH - margin and \
-            margin < new_rect.top and new_rect.bottom < SCREEN_HEIGHT - 80 - margin): # Avoid HUD area
+    if not (margin < new_rect.left and new_rect.right < WORLD_WIDTH - margin and \
+            margin < new_rect.top and new_rect.bottom < WORLD_HEIGHT - margin):
         return False
 
     # 2. Check proximity to other objects
-    entities_to_check = []
     if item_type == "place_hive":
-        entities_to_check = game_state.hives
+         if game_state.hive_index.any_within(pos, min_distance): # Grid lookup, not a scan of every hive
+             return False
     elif item_type.startswith("place_flower_"):
-         entities_to_check = game_state.flowers
-    # Add checks against other types if needed (e.g., can't place on hive)
-
-    for entity in entities_to_check:
-         distance = pygame.Vector2(pos).distance_to(entity.pos)
-         if distance < min_distance:
+         if game_state.flower_index.any_within(pos, min_distance): # Grid lookup, not a full scan
              return False
+    # Add checks against other types if needed (e.g., can't place on hive)
 
     # Add more checks if needed (e.g., terrain type in future)
 
     return True
 
 
+def entity_at(game_state, pos):
+    """The hive (checked first) or flower whose rect covers pos (world coordinates), or None.
+
+    Only the chunks near pos are searched. Among overlapping entities the
+    first in GameState list order wins.
+    """
+    near = game_state.chunks.chunks_in(pygame.Rect(pos[0] - PICK_MARGIN, pos[1] - PICK_MARGIN,
+                                                   2 * PICK_MARGIN + 1, 2 * PICK_MARGIN + 1))
+    for kind in ("hives", "flowers"):
+        hits = [entity for chunk in near for entity in getattr(chunk, kind) if entity.rect.collidepoint(pos)]
+        if hits:
+            return min(hits, key=lambda entity: entity.dense_index)
+    return None
+
+
+def over_hud(screen_pos):
+    """True where the HUD bars cover the garden; nothing is placed under them."""
+    return screen_pos[1] < hud.TOP_BAR_HEIGHT or screen_pos[1] >= SCREEN_HEIGHT - hud.BOTTOM_BAR_HEIGHT
+
+
+def place_hive(game_state, pos):
+    """Buys a hive with its initial bees at pos (validity is checked by the caller)."""
+    cost = HIVE_COST
+    if game_state.money < cost:
+        print("Not enough money to place hive!")
+        return None
+    game_state.money -= cost
+    new_hive = Hive(pos)
+    game_state.add_hive(new_hive)
+    # Add initial bees for the hive
+    for _ in range(new_hive.max_bees):
+        new_bee = Bee(new_hive)
+        game_state.add_bee(new_bee)
+    print(f"Placed Hive. Cost: ${cost}")
+    return new_hive
+
+
+def plant_flower(game_state, flower_type_key, pos):
+    """Buys and plants a flower at pos (validity is checked by the caller)."""
+    if flower_type_key not in FLOWER_DATA:
+        return None
+    cost = FLOWER_DATA[flower_type_key]["cost"]
+    if game_state.money < cost:
+        print(f"Not enough money for {flower_type_key}!")
+        return None
+    game_state.money -= cost
+    new_flower = Flower(pos, flower_type_key)
+    game_state.add_flower(new_flower)
+    print(f"Planted {flower_type_key}. Cost: ${cost}")
+    return new_flower
+
+
 # --- Main Game Class ---
 class Game:
-    def __init__(self):
+    def __init__(self, bee_engine="object", dirty_rects=False, seed=None, save_files=True, record_path=None, profile_path=None):
         pygame.init()
         pygame.mixer.init()  # Initialize the sound system
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -75,49 +137,100 @@ class Game:
             print(f"Could not load or play the music: {e}")
 
         self.asset_manager = AssetManager() # Manage sprites, fonts, sounds
-        self.game_state = GameState()
-        # Pass asset_manager to Renderer, Simulator, and potentially entities if they load assets directly
-        self.renderer = Renderer(self.game_state, self.asset_manager)
-        self.simulator = Simulator(self.game_state, self.asset_manager)
+        self.game_state = GameState(seed=seed)
+        print(f"Game seed: {self.game_state.seed}")
+        # The Renderer loads sprites and hands each entity class its shared surfaces
+        self.renderer = Renderer(self.game_state, self.asset_manager, dirty_rects=dirty_rects)
+        self.simulator = Simulator(self.game_state, bee_engine=bee_engine)
+
+        # Replays run with save_files=False: no autosave, quicksave or quickload
+        self.save_files = save_files
+        self.autosaver = None
+        if save_files:
+            self.autosaver = Autosaver() # Writes AUTOSAVE_PATH each new game day, off the main thread
+            self.simulator.autosaver = self.autosaver
+
+        # Optional input recording, for replay.py
+        self.recorder = InputRecorder(record_path, self.game_state.seed, bee_engine) if record_path else None
+
+        # Frame profiler: F3 toggles the overlay; with profile_path it runs all game and exports at exit
+        self.profile_path = profile_path
+        if profile_path:
+            profiler.keep_enabled = profiler.enabled = True
 
 
     def run(self):
         while self.game_state.running:
             # --- Calculate Delta Time ---
             # dt is time elapsed since last frame in seconds. Crucial for frame-rate independent movement/physics.
-            self.game_state.delta_time = self.clock.tick(FPS) / 1000.0
-
-            # --- Event Handling ---
-            self.handle_events()
+            dt = self.clock.tick(FPS) / 1000.0
+            profiler.begin_frame() # Frame work starts after the FPS wait
 
-            # --- Game Logic / Simulation ---
-            # Only run simulation if in gameplay mode (or maybe market?)
-            if self.game_state.game_mode in [GameMode.GAMEPLAY, GameMode.MARKET]:
-                 self.simulator.tick(self.game_state.delta_time)
+            # --- Input ---
+            events = pygame.event.get()
+            mouse_pos = pygame.mouse.get_pos()
+            mouse_pressed = pygame.mouse.get_pressed() # [Left, Middle, Right]
+            if self.recorder:
+                self.recorder.record_frame(dt, mouse_pos, mouse_pressed, events)
 
-            # --- Update Placement Preview ---
-            if self.game_state.show_placement_preview and self.game_state.selected_action:
-                 self.game_state.placement_preview_pos = self.game_state.mouse_pos
-                 self.game_state.placement_valid = check_placement_validity(
-                     self.game_state,
-                     self.game_state.selected_action,
-                     self.game_state.placement_preview_pos
-                 )
+            # --- Events + Simulation ---
+            self.update(dt, events, mouse_pos, mouse_pressed)
 
             # --- Rendering ---
-            self.renderer.draw(self.screen)
+            dirty = self.renderer.draw(self.screen)
 
             # --- Update Display ---
-            pygame.display.flip()
+            with profiler.section("flip"):
+                if dirty is None:
+                    pygame.display.flip()
+                elif dirty: # Dirty-rect mode: present only what changed, skip unchanged frames
+                    pygame.display.update(dirty)
+            profiler.end_frame(self.game_state)
 
         self.quit_game()
 
-    def handle_events(self):
+    def update(self, dt, events, mouse_pos, mouse_pressed):
+        """Runs one frame's input and simulation. Live play and replays both go through here."""
+        self.game_state.delta_time = dt
+
+        # --- Event Handling ---
+        with profiler.section("events"):
+            self.handle_events(events, mouse_pos, mouse_pressed)
+
+        # --- Camera (held scroll keys) ---
+        if self.game_state.game_mode == GameMode.GAMEPLAY and self.game_state.scroll_keys:
+            self.scroll_camera(dt)
+
+        # --- Game Logic / Simulation ---
+        # Only run simulation if in gameplay mode (or maybe market?)
+        # Fixed-size ticks: a slow frame runs a few ticks instead of one huge dt
+        if self.game_state.game_mode in [GameMode.GAMEPLAY, GameMode.MARKET]:
+             self.simulator.advance(self.game_state.delta_time)
+
+        # --- Update Placement Preview ---
+        if self.game_state.show_placement_preview and self.game_state.selected_action:
+             self.game_state.placement_preview_pos = self.game_state.mouse_pos # Drawn on screen, checked in the world
+             with profiler.section("placement"):
+                 self.game_state.placement_valid = not over_hud(self.game_state.mouse_pos) and check_placement_validity(
+                     self.game_state,
+                     self.game_state.selected_action,
+                     self.game_state.camera.screen_to_world(self.game_state.placement_preview_pos)
+                 )
+
+    def scroll_camera(self, dt):
+        """Moves the camera by the held scroll keys (opposite keys cancel out)."""
+        gs = self.game_state
+        dx = sum(SCROLL_KEYS[key][0] for key in gs.scroll_keys)
+        dy = sum(SCROLL_KEYS[key][1] for key in gs.scroll_keys)
+        if dx or dy:
+            gs.camera.scroll(dx * CAMERA_SCROLL_SPEED * dt, dy * CAMERA_SCROLL_SPEED * dt)
+
+    def handle_events(self, events, mouse_pos, mouse_pressed):
         gs = self.game_state # Shorthand
-        gs.mouse_pos = pygame.mouse.get_pos()
-        gs.mouse_pressed = pygame.mouse.get_pressed() # [Left, Middle, Right]
+        gs.mouse_pos = mouse_pos
+        gs.mouse_pressed = mouse_pressed # [Left, Middle, Right]
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 gs.running = False
             if event.type == pygame.KEYDOWN:
@@ -141,24 +254,45 @@ class Game:
                 elif event.key == pygame.K_PERIOD:  # '>' key increases volume
                     gs.set_music_volume(gs.music_volume + 0.1)
                     print(f"Volume: {int(gs.music_volume * 100)}%")
+                elif event.key in SCROLL_KEYS:  # Held down: the camera scrolls every frame until released
+                    gs.scroll_keys.add(event.key)
+                elif event.key == pygame.K_F3:  # Profiler overlay
+                    profiler.toggle_overlay()
+                elif event.key == pygame.K_F5 and gs.game_mode == GameMode.GAMEPLAY and self.save_files:  # Quicksave
+                    size = save_game(DEFAULT_SAVE_PATH, gs, self.simulator)
+                    print(f"Game saved to {DEFAULT_SAVE_PATH} ({size} bytes)")
+                elif event.key == pygame.K_F9 and gs.game_mode == GameMode.GAMEPLAY and self.save_files:  # Quickload (newest of quicksave/autosave)
+                    if self.recorder: # A replay starts from the seed and has no save to load: it would diverge
+                        print("Quickload is off while recording")
+                    else:
+                        saves = [path for path in (DEFAULT_SAVE_PATH, AUTOSAVE_PATH) if os.path.exists(path)]
+                        path = max(saves, key=os.path.getmtime, default=DEFAULT_SAVE_PATH)
+                        try:
+                            load_game(path, gs, self.simulator)
+                            print(f"Game loaded from {path} (day {gs.day_count})")
+                        except (OSError, SaveFormatError) as e:
+                            print(f"Could not load {path}: {e}")
+
+            if event.type == pygame.KEYUP:
+                gs.scroll_keys.discard(event.key)
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1: # Left mouse button
                     click_handled = False
                     # --- UI Click Handling (Priority) ---
                     if gs.game_mode == GameMode.INTRO:
-                        click_handled = menu.handle_intro_click(gs.mouse_pos)
+                        click_handled = menu.handle_intro_click(gs.mouse_pos, gs)
                     elif gs.game_mode == GameMode.INSTRUCTIONS:
-                        click_handled = menu.handle_instructions_click(gs.mouse_pos)
+                        click_handled = menu.handle_instructions_click(gs.mouse_pos, gs)
                     elif gs.game_mode == GameMode.MARKET:
                         # Market handles its own buttons first
-                        click_handled = menu.handle_market_click(gs.mouse_pos)
+                        click_handled = menu.handle_market_click(gs.mouse_pos, gs)
                         # Then check HUD buttons if market didn't handle it (e.g., closing market via HUD?)
                         if not click_handled:
-                             click_handled = hud.handle_hud_click(gs.mouse_pos)
+                             click_handled = hud.handle_hud_click(gs.mouse_pos, gs)
                     elif gs.game_mode == GameMode.GAMEPLAY:
                          # HUD buttons first
-                         click_handled = hud.handle_hud_click(gs.mouse_pos)
+                         click_handled = hud.handle_hud_click(gs.mouse_pos, gs)
 
 
                     # --- Gameplay Click Handling (If UI didn't handle it) ---
@@ -168,6 +302,8 @@ class Game:
 
     def handle_gameplay_click(self, mouse_pos):
         gs = self.game_state
+        screen_pos = mouse_pos
+        mouse_pos = gs.camera.screen_to_world(mouse_pos) # Entities live in world coordinates
 
         # --- Action based on selected tool ---
         action = gs.selected_action
@@ -181,54 +317,25 @@ class Game:
 
         # 2. Handle Placement Actions
         if action and action.startswith("place_"):
-            is_valid = check_placement_validity(gs, action, mouse_pos)
+            is_valid = not over_hud(screen_pos) and check_placement_validity(gs, action, mouse_pos)
             if is_valid:
-                cost = 0
                 if action == "place_hive":
-                    cost = HIVE_COST
-                    if gs.money >= cost:
-                         gs.money -= cost
-                         new_hive = Hive(mouse_pos, self.asset_manager)
-                         gs.add_hive(new_hive)
-                         # Add initial bees for the hive
-                         for _ in range(new_hive.max_bees):
-                             new_bee = Bee(new_hive, self.asset_manager)
-                             gs.add_bee(new_bee)
-                         print(f"Placed Hive. Cost: ${cost}")
-                         # Maybe deselect tool after placement? Optional.
-                         # gs.selected_action = "select"
-                         # gs.show_placement_preview = False
-                    else: print("Not enough money to place hive!")
+                    place_hive(gs, mouse_pos)
+                    # Maybe deselect tool after placement? Optional.
+                    # gs.selected_action = "select"
+                    # gs.show_placement_preview = False
 
                 elif action.startswith("place_flower_"):
                     flower_type_key = action.split("_")[-1].capitalize()
-                    if flower_type_key in FLOWER_DATA:
-                         cost = FLOWER_DATA[flower_type_key]["cost"]
-                         if gs.money >= cost:
-                             gs.money -= cost
-                             new_flower = Flower(mouse_pos, flower_type_key, self.asset_manager)
-                             gs.add_flower(new_flower)
-                             print(f"Planted {flower_type_key}. Cost: ${cost}")
-                             # Maybe deselect tool after placement?
-                         else: print(f"Not enough money for {flower_type_key}!")
+                    plant_flower(gs, flower_type_key, mouse_pos)
+                    # Maybe deselect tool after placement?
 
             else:
                  print("Invalid placement location.")
             return # Placement attempt handled
 
         # 3. Handle Interaction Actions (Water, Harvest, Remove, Select)
-        clicked_entity = None
-        # Check hives first (usually larger targets)
-        for hive in gs.hives:
-             if hive.rect.collidepoint(mouse_pos):
-                 clicked_entity = hive
-                 break
-        # Check flowers if no hive clicked
-        if not clicked_entity:
-             for flower in gs.flowers:
-                 if flower.rect.collidepoint(mouse_pos):
-                     clicked_entity = flower
-                     break
+        clicked_entity = entity_at(gs, mouse_pos) # Hives first (usually larger targets), then flowers
 
         if action == "water":
              if isinstance(clicked_entity, Flower):
@@ -260,6 +367,12 @@ class Game:
 
 
     def quit_game(self):
+        if self.profile_path:
+            profiler.export(self.profile_path)
+        if self.recorder:
+            self.recorder.close(self.game_state, self.simulator)
+        if self.autosaver:
+            self.autosaver.close() # Let a save in progress finish
         pygame.mixer.music.stop()  # Stop the music before quitting
         pygame.quit()
         sys.exit()
@@ -272,5 +385,16 @@ if __name__ == '__main__':
     # print("Current Working Dir:", os.getcwd())
     # print("Assets folder exists:", os.path.exists("assets"))
 
-    game = Game()
+    # Pass --swarm to run bees on the batched NumPy engine,
+    # --dirty-rects to only present changed screen areas (low-end machines),
+    # --seed N to replay the same garden (kid spawns, bee choices),
+    # --record PATH to log every frame's input for replay.py (a recording always starts from a new game on
+    #   its seed, so quickload is off while recording),
+    # --profile PATH to time every frame and write it to PATH (.csv or .json) at exit
+    bee_engine = "swarm" if "--swarm" in sys.argv else "object"
+    seed = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else None
+    record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv else None
+    profile_path = sys.argv[sys.argv.index("--profile") + 1] if "--profile" in sys.argv else None
+    game = Game(bee_engine=bee_engine, dirty_rects="--dirty-rects" in sys.argv, seed=seed,
+                record_path=record_path, profile_path=profile_path)
     game.run()
\ No newline at end of file
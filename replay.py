@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+# No window and no audio device; input comes from the recording
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from main import Game
+from systems.recording import Recording, state_digest
+from systems.profiler import profiler
+
+
+def replay(recording, render_all=False, quiet=True):
+    """Feeds a recording through Game.update as fast as possible.
+
+    Buttons only react to a click if the previous frame's draw marked them
+    hovered, so the frame before each click is rendered (to the dummy
+    display); every other frame skips rendering unless render_all is set.
+    Returns (game, frames replayed).
+    """
+    game = Game(bee_engine=recording.bee_engine, seed=recording.seed, save_files=False)
+    frames = recording.frames
+    output = open(os.devnull, "w") if quiet else None
+    replayed = 0
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        for i, (dt, mouse_pos, mouse_pressed, events, _) in enumerate(frames):
+            profiler.begin_frame()
+            game.update(dt, events, mouse_pos, mouse_pressed)
+            replayed += 1
+            if not game.game_state.running:
+                break
+            next_has_click = i + 1 < len(frames) and frames[i + 1][4]
+            if render_all or next_has_click:
+                game.renderer.draw(game.screen)
+            profiler.end_frame(game.game_state)
+    if output:
+        output.close()
+    return game, replayed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded PixelHive session (main.py --record PATH) headless.")
+    parser.add_argument("recording")
+    parser.add_argument("--render-all", action="store_true", help="Draw every frame (for render profiling)")
+    parser.add_argument("--profile", metavar="PATH", help="Time every replayed frame and write it to PATH (.csv or .json)")
+    parser.add_argument("--verbose", action="store_true", help="Show the game's console output")
+    args = parser.parse_args(argv)
+
+    recording = Recording(args.recording)
+    if args.profile:
+        profiler.keep_enabled = profiler.enabled = True
+    start = time.perf_counter()
+    game, frames = replay(recording, render_all=args.render_all, quiet=not args.verbose)
+    elapsed = time.perf_counter() - start
+
+    gs = game.game_state
+    digest = state_digest(gs, game.simulator)
+    print(f"Replayed {frames} frames in {elapsed:.2f}s ({frames / max(elapsed, 1e-9):.0f} frames/s), seed {recording.seed}")
+    print(f"Day {gs.day_count}: money=${gs.money:.2f} hives={len(gs.hives)} flowers={len(gs.flowers)} bees={len(gs.bees)}")
+    if args.profile:
+        profiler.export(args.profile)
+    if recording.expected_digest is None:
+        print("No final digest in the recording (the session didn't exit cleanly); nothing to verify.")
+    elif digest == recording.expected_digest:
+        print("Final state matches the recording.")
+    else:
+        print("MISMATCH: final state differs from the recorded session.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
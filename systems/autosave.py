@@ -0,0 +1,108 @@
+import queue
+import threading
+from systems.save import StateCapture, encode_snapshot, write_atomic
+from systems.sim import LOD_INTERVAL_TICKS
+
+AUTOSAVE_PATH = "autosave.phs"
+AUTOSAVE_QUEUE_SIZE = 2 # Snapshots waiting to be written; more than this and new ones are skipped
+
+
+class Autosaver:
+    """Writes snapshots from a worker thread so the main loop never waits on encoding or disk.
+
+    The main thread only copies the fields that change after placement: what
+    the next tick can change at submit(), each dormant chunk just before the
+    simulator catches it up (before_chunk_update()). The snapshot is queued
+    once every chunk is copied (end_tick()). Packing the records, the temp
+    file write and the rename all happen on the worker, which hands the GIL
+    back to the main thread between batches.
+    """
+
+    def __init__(self, path=AUTOSAVE_PATH, max_pending=AUTOSAVE_QUEUE_SIZE):
+        self.path = path
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.saves_written = 0
+        self.saves_skipped = 0
+        self.last_error = None
+        self.closing = False # Set by close(): the worker stops once the queue is empty
+        self.capture = None # StateCapture still copying dormant chunks
+        self.capture_ticks = 0
+        # Entity-list buffers for captures, cleared and handed back by the worker (see StateCapture)
+        self.spare_lists = queue.SimpleQueue()
+        self.spare_lists.put(([], [], [], [])) # Made now, so they've aged by the first day rollover
+        self.thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+        self.thread.start()
+
+    def submit(self, game_state, simulator=None):
+        """Starts capturing the state at this tick, to be written once copied. Never blocks; returns False if skipped."""
+        if self.capture is not None:
+            self._queue_capture()
+        if self.queue.full(): # Disk is behind: don't pay for a snapshot that can't be queued
+            self.saves_skipped += 1
+            print("Autosave skipped: previous saves are still being written.")
+            return False
+        try:
+            lists = self.spare_lists.get_nowait()
+        except queue.Empty: # The other buffers are in snapshots still being written
+            lists = None
+        self.capture = StateCapture(game_state, simulator, lists)
+        self.capture_ticks = 0
+        return True
+
+    def before_chunk_update(self, chunk):
+        """The simulator is about to catch up a dormant chunk: a capture in progress copies it first."""
+        if self.capture is not None:
+            self.capture.copy_chunk(chunk)
+
+    def end_tick(self):
+        """Queues the capture once every dormant chunk is copied. Called by the simulator after each tick.
+
+        Every dormant chunk catches up within LOD_INTERVAL_TICKS; ones
+        emptied or replaced (a restore) in the meantime never do, so
+        whatever is left then is copied as it is.
+        """
+        capture = self.capture
+        if capture is None:
+            return
+        self.capture_ticks += 1
+        if not capture.pending or self.capture_ticks > LOD_INTERVAL_TICKS:
+            self._queue_capture()
+
+    def _queue_capture(self):
+        snapshot = self.capture.finish()
+        self.capture = None
+        self.queue.put_nowait(snapshot) # Only the main thread puts, and submit() checked there was room
+
+    def _worker(self):
+        while True:
+            snapshot = self.queue.get()
+            try:
+                if snapshot is None: # Sentinel from close()
+                    return
+                write_atomic(self.path, encode_snapshot(snapshot, yield_gil=True))
+                self.saves_written += 1
+            except OSError as e:
+                self.last_error = e
+                print(f"Autosave to {self.path} failed: {e}")
+            finally:
+                self.queue.task_done()
+            lists = snapshot[1][0::2] # hives, flowers, bees, kids
+            for entities in lists:
+                entities.clear() # Drops the references, so removed entities can be freed
+            self.spare_lists.put(lists)
+            if self.closing and self.queue.empty(): # close() found the queue full and couldn't queue the sentinel
+                return
+
+    def close(self, timeout=5.0):
+        """Finishes any queued saves, then stops the worker. Waits at most timeout seconds; never raises."""
+        if self.thread.is_alive():
+            if self.capture is not None: # The game has stopped ticking: copy the rest now
+                self._queue_capture()
+            self.closing = True
+            try:
+                self.queue.put_nowait(None)
+            except queue.Full: # Saves still queued: the worker sees closing once it has written them
+                pass
+            self.thread.join(timeout)
+            if self.thread.is_alive(): # Slow disk; the previous autosave file stays intact (atomic rename)
+                print(f"Autosave still writing after {timeout:g}s; not waiting for it.")
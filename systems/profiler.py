@@ -0,0 +1,151 @@
+import csv
+import json
+import time
+import contextlib
+from collections import deque
+
+PROFILE_HISTORY_FRAMES = 1800 # Ring buffer length (30 s at 60 FPS); also what gets exported
+SUMMARY_REFRESH_SECONDS = 0.5 # Overlay percentiles are recomputed at most this often
+PERCENTILES = (50, 95, 99)
+# Display/export order; any other section names are appended after these
+PROFILE_SECTIONS = (
+    "frame", "events",
+    "sim.lod", "sim.flowers", "sim.hives", "sim.bees", "sim.kids", "sim.spawn",
+    "placement",
+    "render.background", "render.gameplay", "render.menus", "render.hud", "render.overlay",
+    "flip",
+)
+ENTITY_COUNTS = ("hives", "flowers", "bees", "kids")
+
+_DISABLED = contextlib.nullcontext() # Shared no-op returned by section() while off
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    """Per-frame section timings kept in a ring buffer.
+
+    Wrap code in `with profiler.section("name"):` (or chain lap() calls in
+    hot loops); repeated sections in one frame (e.g. several sim ticks) add
+    up. While disabled, section() hands back a shared no-op context and the
+    frame hooks return immediately.
+    """
+
+    def __init__(self, history=PROFILE_HISTORY_FRAMES):
+        self.enabled = False      # Collecting timings
+        self.show_overlay = False # Drawn by Renderer.draw_profiler_overlay
+        self.keep_enabled = False # Export requested: keep collecting with the overlay hidden
+        self.frames = deque(maxlen=history) # (section -> seconds, entity counts)
+        self.current = {}
+        self.frame_start = None # None: the current frame started before collection did
+        self.summary = {}
+        self.summary_version = 0 # Bumped whenever summary is recomputed
+        self.last_summary_time = 0.0
+
+    def section(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        current = self.current
+        current[name] = current.get(name, 0.0) + seconds
+
+    def lap(self, name, start):
+        """Adds the time since start to name (None: just start timing); returns now.
+
+        For hot loops: callers check `enabled` once and chain laps, which
+        costs nothing while the profiler is off.
+        """
+        now = time.perf_counter()
+        if name is not None:
+            self.add(name, now - start)
+        return now
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, game_state):
+        if not self.enabled:
+            return
+        if self.frame_start is None: # Turned on mid-frame (F3): this frame was only partly timed
+            self.current = {}
+            return
+        now = time.perf_counter()
+        self.current["frame"] = now - self.frame_start
+        counts = (len(game_state.hives), len(game_state.flowers), len(game_state.bees), len(game_state.kids))
+        self.frames.append((self.current, counts))
+        self.current = {}
+        if self.show_overlay and now - self.last_summary_time >= SUMMARY_REFRESH_SECONDS:
+            self.refresh_summary()
+            self.last_summary_time = now
+
+    def toggle_overlay(self):
+        was_enabled = self.enabled
+        self.show_overlay = not self.show_overlay
+        self.enabled = self.show_overlay or self.keep_enabled
+        if self.enabled and not was_enabled:
+            self.current = {}
+            self.frame_start = None # Skip the frame in progress; begin_frame starts the clock
+        if self.show_overlay:
+            self.last_summary_time = 0.0 # Show numbers as soon as a frame completes
+        print("Profiler overlay:", "On" if self.show_overlay else "Off")
+
+    def section_names(self):
+        seen = set()
+        for timings, _ in self.frames:
+            seen.update(timings)
+        return [name for name in PROFILE_SECTIONS if name in seen] + sorted(seen - set(PROFILE_SECTIONS))
+
+    def refresh_summary(self):
+        """Recomputes {section: {"p50", "p95", "p99", "mean"}} in ms, plus the latest entity counts."""
+        summary = {}
+        frame_count = len(self.frames)
+        for name in self.section_names():
+            values = sorted(timings.get(name, 0.0) * 1000 for timings, _ in self.frames) # Absent = 0 ms that frame
+            stats = {f"p{p}": values[min(frame_count - 1, p * frame_count // 100)] for p in PERCENTILES}
+            stats["mean"] = sum(values) / frame_count
+            summary[name] = stats
+        self.summary = {
+            "frames": frame_count,
+            "sections": summary,
+            "counts": dict(zip(ENTITY_COUNTS, self.frames[-1][1])) if self.frames else {},
+        }
+        self.summary_version += 1
+        return self.summary
+
+    def export(self, path):
+        """Writes the buffered frames: JSON (summary + frames) for .json, per-frame CSV otherwise."""
+        names = self.section_names()
+        rows = [
+            dict({name: round(timings.get(name, 0.0) * 1000, 4) for name in names}, **dict(zip(ENTITY_COUNTS, counts)))
+            for timings, counts in self.frames
+        ]
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"summary": self.refresh_summary(), "frames_ms": rows}, f, indent=1)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=names + list(ENTITY_COUNTS))
+                writer.writeheader()
+                writer.writerows(rows)
+        print(f"Profile of {len(rows)} frames written to {path}")
+
+
+# Shared instance used by the game loop, simulator and renderer
+profiler = FrameProfiler()
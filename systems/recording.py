@@ -0,0 +1,97 @@
+import json
+import hashlib
+import pygame
+from systems.save import encode_state
+
+# Recording file: JSON lines
+#   header  {"version", "seed", "bee_engine"}
+#   frames  [dt, mouse_x, mouse_y, mouse_buttons_bitmask, [event, ...]]
+#   footer  {"frames", "digest"}: digest of the final state, checked on replay
+# Events keep only what the handlers read: ["quit"], ["key", key], ["keyup", key], ["click", button, x, y]
+# Version 2 added "keyup" (camera scrolling); version 1 recordings still load.
+RECORDING_VERSION = 2
+
+
+class RecordingError(ValueError):
+    """Raised for unreadable or unsupported recordings."""
+
+
+def state_digest(game_state, simulator=None):
+    """Hash of the full simulation state; equal digests mean identical runs."""
+    return hashlib.sha256(encode_state(game_state, simulator)).hexdigest()
+
+
+def encode_event(event):
+    """Compact form of a pygame event, or None for events no handler reads."""
+    if event.type == pygame.QUIT:
+        return ["quit"]
+    if event.type == pygame.KEYDOWN:
+        return ["key", event.key]
+    if event.type == pygame.KEYUP:
+        return ["keyup", event.key]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return ["click", event.button, event.pos[0], event.pos[1]]
+    return None
+
+
+def decode_event(data):
+    kind = data[0]
+    if kind == "quit":
+        return pygame.event.Event(pygame.QUIT)
+    if kind == "key":
+        return pygame.event.Event(pygame.KEYDOWN, key=data[1])
+    if kind == "keyup":
+        return pygame.event.Event(pygame.KEYUP, key=data[1])
+    if kind == "click":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=data[1], pos=(data[2], data[3]))
+    raise RecordingError(f"Unknown event in recording: {data!r}")
+
+
+class InputRecorder:
+    """Streams each frame's input to a file while the game runs.
+
+    Only input is recorded, so a replay must start from the same state:
+    a new game on the recorded seed. Game disables quickload while recording.
+    """
+
+    def __init__(self, path, seed, bee_engine):
+        self.path = path
+        self.file = open(path, "w")
+        self.frames = 0
+        self.file.write(json.dumps({"version": RECORDING_VERSION, "seed": seed, "bee_engine": bee_engine}) + "\n")
+
+    def record_frame(self, dt, mouse_pos, mouse_pressed, events):
+        buttons = sum(1 << i for i, pressed in enumerate(mouse_pressed) if pressed)
+        encoded = [e for e in map(encode_event, events) if e is not None]
+        self.file.write(json.dumps([dt, mouse_pos[0], mouse_pos[1], buttons, encoded], separators=(",", ":")) + "\n")
+        self.frames += 1
+
+    def close(self, game_state, simulator=None):
+        """Writes the footer with the final state digest and closes the file."""
+        self.file.write(json.dumps({"frames": self.frames, "digest": state_digest(game_state, simulator)}) + "\n")
+        self.file.close()
+        print(f"Recorded {self.frames} frames to {self.path}")
+
+
+class Recording:
+    """A loaded recording: header fields, decoded frames and the expected digest."""
+
+    def __init__(self, path):
+        with open(path) as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or not isinstance(lines[0], dict) or lines[0].get("version") not in (1, RECORDING_VERSION):
+            raise RecordingError(f"{path} is not a version 1 or {RECORDING_VERSION} recording.")
+        header = lines[0]
+        self.seed = header["seed"]
+        self.bee_engine = header["bee_engine"]
+        footer = lines[-1] if len(lines) > 1 and isinstance(lines[-1], dict) else {}
+        self.expected_digest = footer.get("digest") # None if the game didn't exit cleanly
+
+        # (dt, mouse_pos, mouse_pressed, events, has_click)
+        self.frames = []
+        for dt, x, y, buttons, events in (line for line in lines[1:] if isinstance(line, list)):
+            self.frames.append((
+                dt, (x, y), tuple(bool(buttons & (1 << i)) for i in range(3)),
+                [decode_event(e) for e in events],
+                any(e[0] == "click" for e in events),
+            ))
@@ -0,0 +1,88 @@
+INDEX_BITS = 24 # Low bits of an ID: registry slot (16M live entities); the generation goes above
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityRegistry:
+    """Generational entity IDs with O(1) lookup.
+
+    An ID packs a slot and that slot's generation. Removing an entity bumps
+    the generation before the slot is reused, so an old ID stops resolving
+    instead of silently naming whatever took its place.
+    """
+
+    def __init__(self):
+        self.entities = []    # slot -> entity, None while free
+        self.generations = [] # slot -> generation of its current (or next) occupant
+        self.free_slots = []
+        self.count = 0
+
+    def register(self, entity):
+        """Gives entity a fresh ID and marks it alive. Returns the ID."""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.entities[slot] = entity
+        else:
+            slot = len(self.entities)
+            self.entities.append(entity)
+            self.generations.append(0)
+        entity.eid = (self.generations[slot] << INDEX_BITS) | slot
+        entity.alive = True
+        self.count += 1
+        return entity.eid
+
+    def release(self, entity):
+        """Marks entity dead; its ID (and any reference to it) is stale from now on."""
+        slot = entity.eid & INDEX_MASK
+        self.entities[slot] = None
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+        entity.alive = False
+        self.count -= 1
+
+    def get(self, eid):
+        """The live entity with this ID, or None if it has been removed."""
+        slot = eid & INDEX_MASK
+        if slot < len(self.generations) and self.generations[slot] == eid >> INDEX_BITS:
+            return self.entities[slot]
+        return None
+
+    def __len__(self):
+        return self.count
+
+
+class EntityList(list):
+    """Dense list of entities with O(1) membership, index() and remove().
+
+    Each entity stores its position (dense_index), so nothing scans the
+    list. remove() swaps the last entity into the gap, so order is not
+    preserved. Only append(), remove() and clear() keep positions right;
+    don't insert, sort or slice-assign.
+    """
+
+    def append(self, entity):
+        entity.dense_index = len(self)
+        super().append(entity)
+
+    def remove(self, entity):
+        i = entity.dense_index
+        if not (0 <= i < len(self) and self[i] is entity):
+            raise ValueError("EntityList.remove(x): x not in list")
+        last = self.pop()
+        if last is not entity:
+            self[i] = last
+            last.dense_index = i
+        entity.dense_index = -1
+
+    def clear(self):
+        for entity in self:
+            entity.dense_index = -1
+        super().clear()
+
+    def index(self, entity, *args):
+        if entity in self:
+            return entity.dense_index
+        raise ValueError("EntityList.index(x): x not in list")
+
+    def __contains__(self, entity):
+        i = getattr(entity, "dense_index", -1) # Works for None and foreign objects too
+        return 0 <= i < len(self) and self[i] is entity
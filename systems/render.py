@@ -1,5 +1,55 @@
 import pygame
-from game_state import GameMode, WHITE, BLACK # Import colors etc
+from collections import OrderedDict
+from game_state import GameMode, WHITE, BLACK, YELLOW # Import colors etc
+from systems.profiler import profiler, PERCENTILES, ENTITY_COUNTS
+from entities.bee import Bee, BeeState, BEE_SIZE, FLOWER_SEARCH_RADIUS
+from entities.flower import Flower, HEALTH_BAR_BACKGROUND
+from entities.hive import Hive, HONEY_BAR_COLOR
+from entities.kid import Kid
+
+MAX_SCALED_SPRITES = 256 # LRU bound on cached (name, size, alpha) variants, fits every flower fade level
+MAX_TEXT_SURFACES = 512 # LRU bound on cached rendered text surfaces
+MAX_DIRTY_RECTS = 400 # Beyond this a single full-screen update is cheaper
+PREVIEW_RADIUS = 50 # Placement preview circle, also bounds the preview sprite
+BACKGROUND_BLEND_STEPS = 10 # Cached day->night blend frames, full day and full night included
+PROFILER_OVERLAY_POS = (10, 50) # Top-left corner, just under the HUD top bar
+PROFILER_COLUMN_WIDTH = 70
+BAR_SURFACE_SIZE = (64, 8) # Solid color source for health/honey bars; covers the widest (a full hive bar)
+ENTITY_DRAW_MARGIN = 40 # Farthest a hive or flower (with its bar) draws from its position
+BEE_DRAW_MARGIN = FLOWER_SEARCH_RADIUS + BEE_SIZE[0] # Farthest a bee's sprite gets from its hive
+
+class TextCache:
+    """LRU cache of rendered text keyed by (font, text, antialias, color, background).
+
+    Static labels hit the cache every frame and dynamic counters only
+    re-render when their formatted text actually changes.
+    """
+    def __init__(self, max_size=MAX_TEXT_SURFACES):
+        self.max_size = max_size
+        self.surfaces = OrderedDict() # Oldest first
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments as font.render(); returns a shared read-only Surface."""
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key) # Mark as recently used
+            return surf
+
+        if background is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, background)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False) # Evict least recently used
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+# Shared by AssetManager and ui.menu.Button (buttons don't hold an AssetManager)
+text_cache = TextCache()
 
 # Basic Asset Manager (can be expanded)
 class AssetManager:
@@ -7,6 +57,8 @@ class AssetManager:
         self.sprites = {}
         self.fonts = {}
         self.sounds = {} # Later
+        self.scaled_sprites = OrderedDict() # (name, size, alpha) -> Surface, oldest first
+        self.text_cache = text_cache
 
     def load_sprite(self, name, path):
         try:
@@ -22,6 +74,34 @@ class AssetManager:
     def get_sprite(self, name):
         return self.sprites.get(name, None) # Return None if not found
 
+    def get_scaled_sprite(self, name, size, alpha=None):
+        """Returns a shared, pre-scaled copy of a sprite (None if not found).
+
+        Variants are scaled once and reused by every caller, so treat the
+        result as read-only (copy it before calling set_alpha etc).
+        """
+        key = (name, tuple(size), alpha)
+        cache = self.scaled_sprites
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key) # Mark as recently used
+            return image
+
+        base = self.get_sprite(name)
+        if base is None:
+            return None
+        image = pygame.transform.scale(base, key[1])
+        if alpha is not None:
+            image.set_alpha(alpha)
+        cache[key] = image
+        if len(cache) > MAX_SCALED_SPRITES:
+            cache.popitem(last=False) # Evict least recently used
+        return image
+
+    def render_text(self, font, text, antialias, color, background=None):
+        """Cached font.render() (see TextCache)."""
+        return self.text_cache.render(font, text, antialias, color, background)
+
     def load_font(self, name, path, size):
         key = f"{name}_{size}"
         try:
@@ -40,9 +120,28 @@ class AssetManager:
 
 # --- Renderer Class ---
 class Renderer:
-    def __init__(self, game_state, asset_manager):
+    def __init__(self, game_state, asset_manager, dirty_rects=False):
         self.game_state = game_state
         self.asset_manager = asset_manager
+
+        # Dirty-rect mode: draw() reports changed areas instead of expecting a flip
+        self.dirty_rects = dirty_rects
+        self._frame_key = None      # Mode/screen/background of the last presented frame
+        self._drawn_entities = {}   # entity -> (bounds, draw_key) as last presented
+        self._region_keys = {}      # UI region name -> signature as last presented
+
+        # Static background layers, rebuilt by set_screen_size()
+        self._screen_size = None
+        self._bg_day = None
+        self._bg_night = None
+        self._bg_frames = {}        # blend step -> pre-blended full-screen frame
+        self._dim_overlay = None
+        self._solids = {}           # color -> solid surface that bars are blitted from
+
+        # Profiler overlay, rebuilt when the profiler publishes a new summary
+        self._profiler_surface = None
+        self._profiler_version = None
+        self._profiler_key = (False, 0) # Overlay state as last presented (dirty-rect mode)
         # Pre-load common assets (optional, could load on demand)
         self._load_assets()
 
@@ -64,6 +163,9 @@ class Renderer:
         am.load_sprite('flower_lavender', 'assets/sprites/flower_lavender.png')
         am.load_sprite('flower_sunflower', 'assets/sprites/flower_sunflower.png')
         am.load_sprite('flower', 'assets/sprites/flower_sprite.png')
+        # Entities hold no surfaces of their own: each class shares one set
+        for entity_class in (Bee, Hive, Flower, Kid):
+            entity_class.load_sprites(am)
         # Background images are missing, will use fallback color
         # am.load_sprite('background_day', 'assets/sprites/background_day.png')
         # am.load_sprite('background_night', 'assets/sprites/background_night.png')
@@ -87,26 +189,49 @@ class Renderer:
 
 
     def draw(self, screen):
-        """Draw the entire game screen based on the current state."""
+        """Draw the entire game screen based on the current state.
+
+        Returns None in the default mode (caller flips the display). In
+        dirty-rect mode returns the list of rects that changed; an empty list
+        means nothing changed, nothing was drawn and the frame can be skipped.
+        """
+        if not self.dirty_rects:
+            self._draw_frame(screen)
+            return None
+
+        dirty = self.collect_dirty_rects(screen)
+        if dirty:
+            self._draw_frame(screen)
+        return dirty
+
+    def _draw_frame(self, screen):
         gs = self.game_state
 
         # --- Draw Background ---
-        self.draw_background(screen)
+        with profiler.section("render.background"):
+            self.draw_background(screen)
 
         # --- Draw based on Game Mode ---
         if gs.game_mode == GameMode.INTRO:
-            self.menu_renderer.draw_intro_screen(screen, self.asset_manager, gs)
+            with profiler.section("render.menus"):
+                self.menu_renderer.draw_intro_screen(screen, self.asset_manager, gs)
         elif gs.game_mode == GameMode.INSTRUCTIONS:
-            self.menu_renderer.draw_instructions_screen(screen, self.asset_manager, gs)
+            with profiler.section("render.menus"):
+                self.menu_renderer.draw_instructions_screen(screen, self.asset_manager, gs)
         elif gs.game_mode == GameMode.GAMEPLAY:
-            self.draw_gameplay(screen)
-            self.hud_renderer.draw_hud(screen, self.asset_manager, gs) # Draw HUD on top
+            with profiler.section("render.gameplay"):
+                self.draw_gameplay(screen)
+            with profiler.section("render.hud"):
+                self.hud_renderer.draw_hud(screen, self.asset_manager, gs) # Draw HUD on top
         elif gs.game_mode == GameMode.MARKET:
             # Draw gameplay elements slightly dimmed?
-            self.draw_gameplay(screen, dimmed=True)
-            self.menu_renderer.draw_market_screen(screen, self.asset_manager, gs)
+            with profiler.section("render.gameplay"):
+                self.draw_gameplay(screen, dimmed=True)
+            with profiler.section("render.menus"):
+                self.menu_renderer.draw_market_screen(screen, self.asset_manager, gs)
             # Maybe draw HUD too? Or hide it in market?
-            self.hud_renderer.draw_hud(screen, self.asset_manager, gs)
+            with profiler.section("render.hud"):
+                self.hud_renderer.draw_hud(screen, self.asset_manager, gs)
 
 
         # --- Draw Placement Preview (if active) ---
@@ -114,6 +239,11 @@ class Renderer:
              self.draw_placement_preview(screen, gs.selected_action, gs.placement_preview_pos, gs.placement_valid)
 
 
+        # --- Profiler overlay (F3) ---
+        if profiler.show_overlay:
+            with profiler.section("render.overlay"):
+                self.draw_profiler_overlay(screen)
+
         # --- Draw Mouse Cursor (optional custom cursor) ---
         # pygame.mouse.set_visible(False) # Hide default cursor
         # cursor_img = self.asset_manager.get_sprite('cursor_hand')
@@ -123,67 +253,261 @@ class Renderer:
         # pygame.display.flip()
 
 
-    def draw_background(self, screen):
-        """Draws the background, potentially interpolated between day/night."""
-        time_ratio = self.game_state.get_time_of_day_ratio() # 0.0 to 1.0
-
-        # Simple switch for now, can interpolate later
+    def collect_dirty_rects(self, screen):
+        """Diffs the current state against the last presented frame."""
+        gs = self.game_state
+        screen_rect = screen.get_rect()
+
+        frame_key = (gs.game_mode, screen_rect.size, self._background_step(), gs.camera.offset())
+        overlay_key = (profiler.show_overlay, profiler.summary_version)
+        if overlay_key != self._profiler_key:
+            self._profiler_key = overlay_key
+            frame_key = None # Overlay shown, hidden or refreshed (twice a second at most): repaint everything
+        if frame_key != self._frame_key:
+            # Mode switch, resize, scroll or background fade: repaint everything
+            self._frame_key = frame_key
+            self._region_keys = {}
+            self._drawn_entities = {}
+            self._diff_gameplay(screen_rect)
+            return [screen_rect]
+
+        if gs.game_mode in (GameMode.INTRO, GameMode.INSTRUCTIONS):
+            # Static screens: only hover or tab/upgrade changes need a new frame
+            layout = (self.menu_renderer.intro_layout if gs.game_mode == GameMode.INTRO
+                      else self.menu_renderer.instructions_layout)
+            key = (gs.active_instruction_tab, gs.production_upgrade_level, layout.hover_key(gs.mouse_pos))
+            if self._region_changed("menu", key):
+                return [screen_rect]
+            return []
+
+        dirty = self._diff_gameplay(screen_rect)
+        if len(dirty) > MAX_DIRTY_RECTS:
+            return [screen_rect]
+        return dirty
+
+    def _region_changed(self, name, key):
+        changed = self._region_keys.get(name, self) != key # self: sentinel for "never seen"
+        self._region_keys[name] = key
+        return changed
+
+    def _diff_gameplay(self, screen_rect):
+        """Old and new bounds of every entity, preview and UI region that changed."""
+        gs = self.game_state
+        dirty = []
+
+        alpha = gs.interpolation_alpha
+        previous = self._drawn_entities
+        current = {}
+        for entities in self.visible_entities():
+            for entity in entities:
+                bounds = entity.draw_bounds()
+                entry = (tuple(bounds), entity.draw_key(alpha))
+                current[entity] = entry
+                old = previous.get(entity)
+                if old != entry:
+                    dirty.append(bounds)
+                    if old is not None:
+                        dirty.append(pygame.Rect(old[0]))
+        for entity, (old_bounds, _) in previous.items():
+            if entity not in current: # Removed (or left the view) since last frame
+                dirty.append(pygame.Rect(old_bounds))
+        self._drawn_entities = current
+        ox, oy = gs.camera.offset() # Entity bounds are in the world, the rest is on screen
+        dirty = [rect.move(-ox, -oy) for rect in dirty]
+
+        # Placement preview: old and new positions
+        preview = None
+        if gs.game_mode == GameMode.GAMEPLAY and gs.show_placement_preview and gs.selected_action:
+            preview = (gs.selected_action, tuple(gs.placement_preview_pos), gs.placement_valid)
+        old_preview = self._region_keys.get("preview")
+        if self._region_changed("preview", preview):
+            for key in (old_preview, preview):
+                if key:
+                    x, y = key[1]
+                    dirty.append(pygame.Rect(x - PREVIEW_RADIUS, y - PREVIEW_RADIUS, PREVIEW_RADIUS * 2, PREVIEW_RADIUS * 2))
+
+        # UI regions report themselves only when their contents change
+        hud = self.hud_renderer
+        if self._region_changed("top_bar", hud.top_bar_key(gs)):
+            dirty.append(pygame.Rect(0, 0, screen_rect.width, hud.TOP_BAR_HEIGHT))
+        band_height = hud.BOTTOM_BAR_HEIGHT + hud.TOOLTIP_HEIGHT
+        if self._region_changed("bottom_bar", (hud.hud_layout.key, hud.hud_layout.hover_key(gs.mouse_pos))):
+            dirty.append(pygame.Rect(0, screen_rect.height - band_height, screen_rect.width, band_height))
+        if gs.game_mode == GameMode.MARKET:
+            market = self.menu_renderer.market_layout
+            key = (market.key, f"{gs.honey:.2f}", market.hover_key(gs.mouse_pos))
+            if self._region_changed("market", key) and "panel_rect" in market.data:
+                dirty.append(market.data["panel_rect"])
+
+        return [rect.clip(screen_rect) for rect in dirty]
+
+    def _background_alpha(self):
+        """Night overlay alpha for the current time of day."""
+        time_ratio = self.game_state.get_time_of_day_ratio()
+        if 0.25 <= time_ratio < 0.75: # Daytime
+            return 0 # Fully day
+        # Crude transition - fades night in/out over dawn/dusk periods
+        if time_ratio >= 0.75: # Dusk transition
+            alpha = min(255, int(255 * (time_ratio - 0.75) / 0.15)) # Fade in over 0.15 duration
+        else: # Dawn transition
+            alpha = min(255, int(255 * (0.25 - time_ratio) / 0.15)) # Fade out over 0.15 duration
+        return max(0, min(255, alpha)) # Clamp alpha
+
+    def _background_step(self):
+        """Index of the cached blend frame for the current time (None without a day image)."""
+        if self.asset_manager.get_sprite('background_day') is None:
+            return None
+        return round(self._background_alpha() * (BACKGROUND_BLEND_STEPS - 1) / 255)
+
+    def set_screen_size(self, size):
+        """Scales the static background layers once for a screen size."""
+        self._screen_size = tuple(size)
+        self._bg_frames = {}
         day_img = self.asset_manager.get_sprite('background_day')
         night_img = self.asset_manager.get_sprite('background_night')
-
-        if day_img is None: # Fallback if image failed to load
-            screen.fill((135, 206, 250)) # Sky blue
-            return
         if night_img is None:
             night_img = day_img # Use day image if night is missing
-
-        # Scale background to fit screen (if needed)
-        bg_day_scaled = pygame.transform.scale(day_img, (screen.get_width(), screen.get_height()))
-        bg_night_scaled = pygame.transform.scale(night_img, (screen.get_width(), screen.get_height()))
-
-        # Determine alpha for blending (e.g., night fades in during evening)
-        # Day: 0.25 - 0.75, Night: 0.75 - 0.25 (wrapping around midnight)
-        if 0.25 <= time_ratio < 0.75: # Daytime
-             alpha = 0 # Fully day
-             screen.blit(bg_day_scaled, (0, 0))
-        else: # Nighttime (or transition)
-            # Crude transition - fades night in/out over dawn/dusk periods
-            if time_ratio >= 0.75: # Dusk transition
-                 alpha = min(255, int(255 * (time_ratio - 0.75) / 0.15)) # Fade in over 0.15 duration
-            else: # Dawn transition
-                 alpha = min(255, int(255 * (0.25 - time_ratio) / 0.15)) # Fade out over 0.15 duration
-            alpha = max(0, min(255, alpha)) # Clamp alpha
-
-            screen.blit(bg_day_scaled, (0,0))
+        self._bg_day = pygame.transform.scale(day_img, self._screen_size) if day_img else None
+        self._bg_night = pygame.transform.scale(night_img, self._screen_size) if night_img else None
+
+        self._dim_overlay = pygame.Surface(self._screen_size, pygame.SRCALPHA)
+        self._dim_overlay.fill((0, 0, 0, 128)) # Black with 50% opacity
+
+    def _background_frame(self, step):
+        """Day image with the night image blended in at the given step (built on first use)."""
+        frame = self._bg_frames.get(step)
+        if frame is None:
+            frame = self._bg_day.copy()
+            alpha = round(step * 255 / (BACKGROUND_BLEND_STEPS - 1))
             if alpha > 0:
-                night_overlay = bg_night_scaled.copy()
-                night_overlay.set_alpha(alpha)
-                screen.blit(night_overlay, (0,0))
+                self._bg_night.set_alpha(alpha)
+                frame.blit(self._bg_night, (0, 0))
+                self._bg_night.set_alpha(None)
+            self._bg_frames[step] = frame
+        return frame
 
+    def draw_background(self, screen):
+        """Draws the background, potentially interpolated between day/night."""
+        if screen.get_size() != self._screen_size:
+            self.set_screen_size(screen.get_size())
 
-    def draw_gameplay(self, screen, dimmed=False):
-        """Draws all the active game entities."""
-        gs = self.game_state
+        if self._bg_day is None: # Fallback if image failed to load
+            screen.fill((135, 206, 250)) # Sky blue
+            return
 
-        # Draw in order: flowers first, then hives, then bees/kids on top
-        for flower in gs.flowers:
-            flower.draw(screen)
+        # Day: 0.25 - 0.75, Night: 0.75 - 0.25 (wrapping around midnight)
+        # Dusk/dawn fades use pre-blended frames, so this is one blit at any time of day
+        screen.blit(self._background_frame(self._background_step()), (0, 0))
 
-        for hive in gs.hives:
-            hive.draw(screen)
 
-        for bee in gs.bees:
-            bee.draw(screen)
+    def visible_entities(self):
+        """(flowers, hives, bees, kids) that can show in the camera view, in draw order.
 
-        for kid in gs.kids:
-            kid.draw(screen)
+        Hives and flowers come from the chunks overlapping the view and bees
+        from the rosters of hives close enough to fly into it; the rest of
+        the world is never visited.
+        """
+        gs = self.game_state
+        view = gs.camera.view_rect()
+        chunks = gs.chunks
+        flowers = []
+        hives = []
+        for chunk in chunks.chunks_in(view.inflate(2 * ENTITY_DRAW_MARGIN, 2 * ENTITY_DRAW_MARGIN)):
+            flowers.extend(chunk.flowers)
+            hives.extend(chunk.hives)
+        bees = []
+        for chunk in chunks.chunks_in(view.inflate(2 * BEE_DRAW_MARGIN, 2 * BEE_DRAW_MARGIN)):
+            for hive in chunk.hives:
+                bees.extend(hive.bees)
+        kids = [kid for kid in gs.kids if view.colliderect(kid.draw_bounds())] # A few at most
+        return flowers, hives, bees, kids
+
+    def draw_gameplay(self, screen, dimmed=False):
+        """Draws the entities in view: one blits() call per layer, then one per bar pass."""
+        gs = self.game_state
+        blits = screen.blits
+        flowers, hives, bees, kids = self.visible_entities()
+        ox, oy = gs.camera.offset() # World -> screen
+
+        # Draw in order: flowers first, then hives, then bees/kids on top.
+        # Each layer's bars go over that whole layer.
+        blits([(flower.get_faded_image(), flower.rect.move(-ox, -oy)) for flower in flowers], doreturn=False)
+        health_bars = [bar for bar in [flower.health_bar() for flower in flowers] if bar is not None]
+        if health_bars:
+            blits(self._bar_blits([(background, HEALTH_BAR_BACKGROUND) for background, _, _ in health_bars], ox, oy), doreturn=False)
+            blits(self._bar_blits([(fill, color) for _, fill, color in health_bars], ox, oy), doreturn=False)
+
+        image = Hive.image
+        blits([(image, hive.rect.move(-ox, -oy)) for hive in hives], doreturn=False)
+        honey_bars = [bar for bar in [hive.honey_bar() for hive in hives] if bar is not None]
+        if honey_bars:
+            blits(self._bar_blits([(bar, HONEY_BAR_COLOR) for bar in honey_bars], ox, oy), doreturn=False)
+
+        # Moving entities are drawn between their last two sim positions
+        alpha = gs.interpolation_alpha
+        idle = BeeState.IDLE # Idle bees are hidden in the hive
+        image = Bee.image
+        blits([(image, bee.interpolated_rect(alpha).move(-ox, -oy)) for bee in bees if bee.state != idle], doreturn=False)
+        image = Kid.image
+        blits([(image, kid.interpolated_rect(alpha).move(-ox, -oy)) for kid in kids], doreturn=False)
 
         if dimmed:
             # Draw a semi-transparent overlay if needed (e.g., for market screen)
-            overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128)) # Black with 50% opacity
-            screen.blit(overlay, (0, 0))
-
+            if screen.get_size() != self._screen_size:
+                self.set_screen_size(screen.get_size())
+            screen.blit(self._dim_overlay, (0, 0)) # Cached, built once per screen size
+
+
+    def _solid(self, color):
+        """Shared opaque surface of one color; bars are blitted from its top-left corner."""
+        surface = self._solids.get(color)
+        if surface is None:
+            surface = pygame.Surface(BAR_SURFACE_SIZE)
+            surface.fill(color)
+            self._solids[color] = surface
+        return surface
+
+    def _bar_blits(self, bars, ox=0, oy=0):
+        """(source, dest, area) items filling each (rect, color) bar, the same pixels as pygame.draw.rect.
+
+        Bars are in world coordinates; ox, oy is the camera offset.
+        """
+        solids = self._solids
+        items = []
+        for (x, y, width, height), color in bars:
+            source = solids.get(color)
+            if source is None:
+                source = self._solid(color)
+            items.append((source, (x - ox, y - oy), (0, 0, width, height)))
+        return items
+
+    def draw_profiler_overlay(self, screen):
+        """Per-section p50/p95/p99 (ms) and entity counts from the profiler's latest summary."""
+        if self._profiler_version != profiler.summary_version:
+            self._profiler_version = profiler.summary_version
+            self._profiler_surface = self._build_profiler_surface(profiler.summary)
+        screen.blit(self._profiler_surface, PROFILER_OVERLAY_POS)
+
+    def _build_profiler_surface(self, summary):
+        font = self.asset_manager.get_font('comfortaa', 18)
+        sections = summary.get("sections", {})
+        header = ["ms"] + [f"p{p}" for p in PERCENTILES]
+        rows = [header] + [[name] + [f"{stats[f'p{p}']:.2f}" for p in PERCENTILES] for name, stats in sections.items()]
+        counts = summary.get("counts", {})
+        footer = "  ".join(f"{name} {counts.get(name, 0)}" for name in ENTITY_COUNTS) if counts else "collecting..."
+
+        line_height = font.get_linesize()
+        name_width = max(font.size(row[0])[0] for row in rows) + 15
+        width = name_width + PROFILER_COLUMN_WIDTH * len(PERCENTILES) + 10
+        surface = pygame.Surface((width, line_height * (len(rows) + 1) + 10), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for row_index, row in enumerate(rows):
+            y = 5 + row_index * line_height
+            for col, text in enumerate(row):
+                x = 5 if col == 0 else name_width + (col - 1) * PROFILER_COLUMN_WIDTH
+                surface.blit(font.render(text, True, YELLOW if row_index == 0 else WHITE), (x, y))
+        surface.blit(font.render(footer, True, YELLOW), (5, 5 + len(rows) * line_height))
+        return surface
 
     def draw_placement_preview(self, screen, item_type, pos, is_valid):
         """Draws a ghost image of the item being placed."""
@@ -201,14 +525,12 @@ class Renderer:
                  scale = (32, 32)
 
         if sprite_name:
-             image = self.asset_manager.get_sprite(sprite_name)
+             image = self.asset_manager.get_scaled_sprite(sprite_name, scale, alpha=150) # Semi-transparent, cached
              if image:
-                 image = pygame.transform.scale(image, scale)
-                 image.set_alpha(150) # Make it semi-transparent
                  rect = image.get_rect(center=pos)
 
                  # Draw placement radius/indicator? (Optional)
-                 radius = 50 # Example radius to check for conflicts
+                 radius = PREVIEW_RADIUS # Same radius as the dirty rect in _diff_gameplay
                  color = (0, 255, 0, 100) if is_valid else (255, 0, 0, 100) # Green/Red tint based on validity
                  # Draw rect background for visibility
                  pygame.draw.rect(screen, color, rect, 2 if not is_valid else 0) # Border if invalid
@@ -0,0 +1,348 @@
+import os
+import json
+import time
+import struct
+from operator import attrgetter
+from itertools import islice, count
+from entities.hive import Hive
+from entities.flower import Flower, FLOWER_DATA
+from entities.bee import Bee, BeeState
+from entities.kid import Kid
+from systems.sim import SIM_TICK_SECONDS
+
+# File layout (little-endian):
+#   header   MAGIC, version u16, meta length u32
+#   meta     UTF-8 JSON: resources, clocks, upgrades, RNG states, simulator timers, dormant chunks
+#   sections hives, flowers, bees, kids: count u32 then one packed record per entity
+# Cross-references (bee -> hive, bee -> flower, kid -> hive) are list indices, -1 for none
+# (every bee has a hive: removing a hive removes its bees).
+# Version 2 added the bee scheduler fields (sim_time, per-bee wake_time/sched_seq); version 1 still loads.
+SAVE_MAGIC = b"PHSV"
+SAVE_VERSION = 2
+DEFAULT_SAVE_PATH = "savegame.phs"
+
+_HEADER = struct.Struct("<4sHI")
+_COUNT = struct.Struct("<I")
+# x, y, honey, wax, pollen, production_timer, max_bees
+_HIVE = struct.Struct("<ddddddH")
+# type index, x, y, health, is_wilting
+_FLOWER = struct.Struct("<BdddB")
+# hive index, target flower index, state, x, y, prev x, prev y, forage_timer, speed,
+# wake_time (-1: none), sched_seq (-1: none)
+_BEE = struct.Struct("<iiBdddddddq")
+_BEE_V1 = struct.Struct("<iiBdddddd") # Without the scheduler fields
+# target hive index, state, x, y, prev x, prev y, speed, despawn_timer, flee_timer
+_KID = struct.Struct("<iBddddddd")
+# Fields a capture copies (the ones that change after placement). Hive position and capacity and flower
+# type, position and wilting flag never change once placed, so encode_snapshot() reads them from the entities
+_HIVE_FIELDS = attrgetter("honey", "wax", "pollen", "production_timer")
+_FLOWER_HEALTH = attrgetter("health") # is_wilting is only ever set on construction and restore
+_BEE_FIELDS = attrgetter("target_flower", "state", "pos.x", "pos.y", "prev_pos", "forage_timer", "wake_time", "sched_seq")
+_KID_FIELDS = attrgetter("target_hive", "state", "pos.x", "pos.y", "prev_pos", "speed", "despawn_timer", "flee_timer")
+ENCODE_BATCH = 2048 # Records packed between GIL hand-offs when encoding on a worker thread
+
+
+class SaveFormatError(ValueError):
+    """Raised when a snapshot is truncated, corrupt or from an unknown version."""
+
+
+class StateCapture:
+    """A snapshot of one tick's state, copied over that tick and the ones after it.
+
+    Everything the next ticks can change is copied at once: the meta, the
+    entity lists, hives, kids, and the flowers and bees of active chunks.
+    Dormant chunks (systems.sim level of detail) only change when the
+    simulator catches them up, so it hands each one to copy_chunk() first;
+    that spreads their copying over the LOD_INTERVAL_TICKS after the capture.
+    finish() copies whatever is left and returns the snapshot.
+    """
+
+    def __init__(self, game_state, simulator=None, lists=None):
+        gs = game_state
+        self.meta = {
+            "seed": gs.seed,
+            "money": gs.money, "honey": gs.honey, "wax": gs.wax, "pollen": gs.pollen,
+            "game_time_seconds": gs.game_time_seconds, "day_ticks": gs.day_ticks, "day_count": gs.day_count,
+            "sim_time": gs.sim_time,
+            "current_season": gs.current_season,
+            "production_upgrade_level": gs.production_upgrade_level,
+            "production_rate_multiplier": gs.production_rate_multiplier,
+            "flower_types": list(FLOWER_DATA),
+            "rng": gs.rng.getstate(), # Tuple, already immutable
+            "np_rng": gs.np_rng.bit_generator.state if gs.np_rng is not None else None, # Fresh dict per call
+            # Off-screen chunks and the sim_time they're caught up to (systems.sim level of detail)
+            "dormant_chunks": sorted([cx, cy, chunk.sim_time] for (cx, cy), chunk in gs.chunks.chunks.items()
+                                     if chunk.sim_time is not None),
+        }
+        if simulator is not None:
+            self.meta["simulator"] = {
+                "kid_spawn_timer": simulator.kid_spawn_timer,
+                "accumulator": simulator.accumulator,
+                "flowers_wilted": simulator.flowers_wilted,
+                "bee_schedule_seq": simulator.scheduler.next_seq,
+            }
+
+        # lists: four empty lists to fill. Autosaver hands back the previous capture's: old lists sit in the
+        # GC's oldest generation, while fresh 100k-entry ones get traversed by its frequent young collections
+        self.hives, self.flowers, self.bees, self.kids = lists if lists is not None else ([], [], [], [])
+        for copy, entities in zip((self.hives, self.flowers, self.bees, self.kids), (gs.hives, gs.flowers, gs.bees, gs.kids)):
+            copy.extend(entities)
+        self.hive_fields = list(map(_HIVE_FIELDS, self.hives))
+        self.kid_fields = list(map(_KID_FIELDS, self.kids))
+        # id(flower) -> health: int keys keep this dict (100k entries, filled over several ticks)
+        # untracked by the GC, and self.flowers keeps those flowers alive, so the ids stay unique
+        self.flower_health = {}
+        self.bee_fields = {} # Bee -> _BEE_FIELDS
+        self.pending = {} # key -> dormant Chunk not copied yet
+        for chunk in gs.chunks.chunks.values():
+            if chunk.sim_time is None:
+                self._copy(chunk)
+            else:
+                self.pending[chunk.key] = chunk
+
+    def _copy(self, chunk):
+        flowers = chunk.flowers
+        self.flower_health.update(zip(map(id, flowers), map(_FLOWER_HEALTH, flowers)))
+        for hive in chunk.hives:
+            bees = hive.bees
+            self.bee_fields.update(zip(bees, map(_BEE_FIELDS, bees)))
+
+    def copy_chunk(self, chunk):
+        """Copies a dormant chunk's flowers and bees before the simulator changes them (no-op once copied)."""
+        if self.pending.get(chunk.key) is chunk:
+            del self.pending[chunk.key]
+            self._copy(chunk)
+
+    def finish(self):
+        """Copies the chunks still pending; returns the snapshot for encode_snapshot().
+
+        Chunks still pending by now were never caught up, so they haven't
+        changed (or were emptied: see encode_snapshot()).
+        """
+        for chunk in self.pending.values():
+            self._copy(chunk)
+        self.pending.clear()
+        return self.meta, (self.hives, self.hive_fields, self.flowers, self.flower_health,
+                           self.bees, self.bee_fields, self.kids, self.kid_fields)
+
+
+def capture_state(game_state, simulator=None):
+    """Copies the simulation state into a snapshot that later game ticks don't change."""
+    return StateCapture(game_state, simulator).finish()
+
+
+def _slots(entities, yield_gil):
+    """id(entity) -> list index, built a batch at a time (see _section).
+
+    Int keys keep the dict untracked by the GC; the entities list keeps
+    them alive, so their ids can't be reused meanwhile.
+    """
+    slots = {}
+    for start in range(0, len(entities), ENCODE_BATCH):
+        slots.update(zip(map(id, entities[start:start + ENCODE_BATCH]), count(start)))
+        if yield_gil:
+            time.sleep(0)
+    return slots
+
+
+def _section(length, records, yield_gil):
+    """Count plus the packed records (an iterator), joined a batch at a time.
+
+    With yield_gil the main thread gets a turn between batches.
+    """
+    parts = [_COUNT.pack(length)]
+    while True:
+        batch = b"".join(islice(records, ENCODE_BATCH))
+        if not batch:
+            return b"".join(parts)
+        parts.append(batch)
+        if yield_gil:
+            time.sleep(0) # Releases the GIL
+
+
+def encode_snapshot(snapshot, yield_gil=False):
+    """Turns a capture_state() or StateCapture.finish() snapshot into the file bytes. Safe on any thread.
+
+    Pass yield_gil when encoding on a worker thread, so the game's frames
+    don't wait for the whole encode.
+    """
+    meta, (hives, hive_fields, flowers, flower_health, bees, bee_fields, kids, kid_fields) = snapshot
+    hive_slot = _slots(hives, yield_gil)
+    flower_slot = _slots(flowers, yield_gil)
+    type_slot = {name: i for i, name in enumerate(meta["flower_types"])}
+    pack_hive, pack_flower, pack_bee, pack_kid = _HIVE.pack, _FLOWER.pack, _BEE.pack, _KID.pack
+    # Flowers and bees missing from the capture were removed before their dormant chunk was
+    # copied, and nothing changes a removed entity: their current fields are the captured ones
+    health, captured_bee = flower_health.get, bee_fields.get
+
+    sections = (
+        _section(len(hives), (
+            pack_hive(h.pos.x, h.pos.y, honey, wax, pollen, production_timer, h.max_bees)
+            for h, (honey, wax, pollen, production_timer) in zip(hives, hive_fields)), yield_gil),
+        _section(len(flowers), (
+            pack_flower(type_slot[f.type], f.pos.x, f.pos.y, health(id(f), f.health), f.is_wilting)
+            for f in flowers), yield_gil),
+        _section(len(bees), (
+            pack_bee(hive_slot[id(b.hive)], flower_slot.get(id(target), -1), state, x, y, prev_x, prev_y, forage_timer,
+                     b.speed, -1.0 if wake_time is None else wake_time, -1 if sched_seq is None else sched_seq)
+            for b, (target, state, x, y, (prev_x, prev_y), forage_timer, wake_time, sched_seq)
+            in ((b, captured_bee(b) or _BEE_FIELDS(b)) for b in bees)), yield_gil),
+        _section(len(kids), (
+            pack_kid(hive_slot.get(id(target), -1), state, x, y, prev_x, prev_y, speed, despawn_timer, flee_timer)
+            for target, state, x, y, (prev_x, prev_y), speed, despawn_timer, flee_timer in kid_fields), yield_gil),
+    )
+    rng_version, rng_internal, rng_gauss = meta["rng"]
+    meta = dict(meta, rng=[rng_version, list(rng_internal), rng_gauss])
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    return b"".join((_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, len(meta_bytes)), meta_bytes) + sections)
+
+
+def encode_state(game_state, simulator=None):
+    """Packs the full simulation state into bytes (no surfaces, no UI state)."""
+    return encode_snapshot(capture_state(game_state, simulator))
+
+
+def write_atomic(path, data):
+    """Writes via a temp file and rename, so a crash never leaves a half-written save."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _records(data, offset, record):
+    """Returns (unpacked records, offset after the section)."""
+    if offset + _COUNT.size > len(data):
+        raise SaveFormatError("Snapshot is truncated.")
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    end = offset + count * record.size
+    if end > len(data):
+        raise SaveFormatError("Snapshot is truncated.")
+    return list(record.iter_unpack(data[offset:end])), end
+
+
+def restore_state(game_state, data, simulator=None):
+    """Replaces game_state's simulation state in place from encode_state() bytes.
+
+    Entities are rebuilt through their constructors (sprites are shared per
+    class). UI state (mode, selected tool) is kept.
+    """
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("Snapshot is truncated.")
+    magic, version, meta_len = _HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise SaveFormatError("Not a PixelHive snapshot.")
+    if version not in (1, SAVE_VERSION):
+        raise SaveFormatError(f"Unsupported snapshot version {version} (expected {SAVE_VERSION}).")
+    offset = _HEADER.size + meta_len
+    try:
+        meta = json.loads(data[_HEADER.size:offset].decode("utf-8"))
+    except ValueError as e: # Bad UTF-8 or JSON
+        raise SaveFormatError(f"Corrupt snapshot header: {e}") from e
+
+    hive_rows, offset = _records(data, offset, _HIVE)
+    flower_rows, offset = _records(data, offset, _FLOWER)
+    bee_rows, offset = _records(data, offset, _BEE if version == SAVE_VERSION else _BEE_V1)
+    kid_rows, offset = _records(data, offset, _KID)
+
+    gs = game_state
+    gs.clear_entities()
+
+    # Both lists are re-added in order, so index buckets match the saved game and
+    # radius queries (and bee choices) replay. Flowers go first: each hive then
+    # gathers its nearby flowers in one query instead of one query per flower.
+    type_names = meta["flower_types"]
+    for type_index, x, y, health, is_wilting in flower_rows:
+        flower = Flower((x, y), type_names[type_index])
+        flower.health = health
+        flower.is_wilting = bool(is_wilting)
+        gs.add_flower(flower)
+
+    hives = gs.hives
+    for x, y, honey, wax, pollen, production_timer, max_bees in hive_rows:
+        hive = Hive((x, y))
+        hive.honey, hive.wax, hive.pollen = honey, wax, pollen
+        hive.production_timer = production_timer
+        hive.max_bees = max_bees
+        gs.add_hive(hive)
+
+    flowers = gs.flowers
+    for hive_index, target, state, x, y, prev_x, prev_y, forage_timer, speed, *schedule in bee_rows:
+        bee = Bee(hives[hive_index])
+        bee.state = state
+        bee.target_flower = flowers[target] if target >= 0 else None
+        bee.pos.update(x, y)
+        bee.rect.center = bee.pos
+        bee.prev_pos = (prev_x, prev_y)
+        bee.forage_timer = forage_timer
+        bee.speed = speed
+        if schedule: # Version 1 bees get fresh schedules from the simulator
+            wake_time, sched_seq = schedule
+            bee.wake_time = wake_time if wake_time >= 0 else None
+            bee.sched_seq = sched_seq if sched_seq >= 0 else None
+        if bee.target_flower is not None and state == BeeState.FORAGING:
+            bee.target_flower.add_pollinator(bee)
+        gs.add_bee(bee)
+
+    for target, state, x, y, prev_x, prev_y, speed, despawn_timer, flee_timer in kid_rows:
+        kid = Kid([], gs.rng) # Spawn draw is undone when the RNG state is restored below
+        kid.target_hive = hives[target] if target >= 0 else None
+        kid.state = state
+        kid.pos.update(x, y)
+        kid.rect.center = kid.pos
+        kid.prev_pos = (prev_x, prev_y)
+        kid.speed = speed
+        kid.despawn_timer = despawn_timer
+        kid.flee_timer = flee_timer
+        gs.add_kid(kid)
+
+    # Chunks dormant when saved stay dormant until the simulator finds them on screen
+    for cx, cy, sim_time in meta.get("dormant_chunks", ()):
+        chunk = gs.chunks.chunks.get((cx, cy))
+        if chunk is not None:
+            chunk.sim_time = sim_time
+
+    gs.seed = meta["seed"]
+    gs.money, gs.honey, gs.wax, gs.pollen = meta["money"], meta["honey"], meta["wax"], meta["pollen"]
+    # Saves from before the tick-counted day clock only have the seconds
+    gs.day_ticks = meta.get("day_ticks", round(meta["game_time_seconds"] / SIM_TICK_SECONDS))
+    gs.game_time_seconds = gs.day_ticks * SIM_TICK_SECONDS
+    gs.sim_time = meta.get("sim_time", 0.0)
+    gs.day_count = meta["day_count"]
+    gs.current_season = meta["current_season"]
+    gs.production_upgrade_level = meta["production_upgrade_level"]
+    gs.production_rate_multiplier = meta["production_rate_multiplier"]
+    rng_version, rng_internal, rng_gauss = meta["rng"]
+    gs.rng.setstate((rng_version, tuple(rng_internal), rng_gauss)) # In place: systems keep their reference
+    if meta["np_rng"] is not None and gs.np_rng is not None:
+        gs.np_rng.bit_generator.state = meta["np_rng"]
+    gs.needs_redraw = True
+
+    if simulator is not None:
+        sim_meta = meta.get("simulator")
+        if sim_meta is not None:
+            simulator.kid_spawn_timer = sim_meta["kid_spawn_timer"]
+            simulator.accumulator = sim_meta["accumulator"]
+            simulator.flowers_wilted = sim_meta["flowers_wilted"]
+        # The restored bees are adopted (from gs.new_bees) on the next tick
+        simulator.scheduler.reset(sim_meta.get("bee_schedule_seq", 0) if sim_meta else 0)
+        simulator.reset_lod()
+    return gs
+
+
+def save_game(path, game_state, simulator=None):
+    """Writes a snapshot to path. Returns the number of bytes written."""
+    data = encode_state(game_state, simulator)
+    write_atomic(path, data)
+    return len(data)
+
+
+def load_game(path, game_state, simulator=None):
+    """Restores game_state (and simulator timers) from a snapshot file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return restore_state(game_state, data, simulator)
+
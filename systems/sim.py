@@ -1,72 +1,392 @@
+import heapq
 import pygame
-import random
+from entities.bee import BeeState, IDLE_LAUNCH_RATE, FLOWER_SEARCH_RADIUS, BEE_SIZE
 from entities.kid import Kid, KID_DESPAWN_TIME # Import Kid class for spawning
 from game_state import GAME_DAY_SECONDS
+from systems.profiler import profiler
 
 KID_SPAWN_CHANCE_PER_SECOND = 0.05 # Chance a kid will spawn each second
+BEE_ENGINES = ("object", "swarm") # Event-scheduled Bee objects or batched NumPy swarm
+SIM_TICK_SECONDS = 1.0 / 60 # Fixed simulation step, independent of render rate
+TICKS_PER_DAY = round(GAME_DAY_SECONDS / SIM_TICK_SECONDS) # Days are counted in whole ticks: summed 1/60 s floats drift
+MAX_CATCHUP_TICKS = 5 # Max ticks per frame; beyond this the sim slows down instead of spiralling
+# Level of detail: chunks this close to the view are simulated every tick (hives this close can
+# have bees on screen, as in the renderer's BEE_DRAW_MARGIN); the rest are dormant
+LOD_VIEW_MARGIN = FLOWER_SEARCH_RADIUS + BEE_SIZE[0]
+LOD_INTERVAL_TICKS = 30 # Dormant chunks catch up once every this many ticks, a share of them each tick
+
+class BeeScheduler:
+    """Event-driven updates for the object bee engine.
+
+    Bees waiting in the hive or at a flower sleep in a heap keyed by their
+    wake-up time and cost nothing until due: idle launches are a Poisson
+    process (one exponential draw per wait), foraging ends after a time drawn
+    on landing. Only flying bees are moved every tick. Schedules live on the
+    bees (wake_time, sched_seq) so snapshots carry them; heap entries whose
+    seq no longer matches the bee (rescheduled or removed) are skipped.
+    """
+
+    def __init__(self):
+        self.queue = [] # (wake_time, seq, bee) min-heap; seq breaks ties in scheduling order
+        self.flying = {} # Bees in flight, in take-off order (dict as an ordered set)
+        self.next_seq = 0
+
+    def reset(self, next_seq=0):
+        """Forgets every bee (after a restore; the restored bees are adopted again)."""
+        self.queue = []
+        self.flying = {}
+        self.next_seq = next_seq
+
+    def _sleep(self, bee, wake_time):
+        bee.wake_time = wake_time
+        bee.sched_seq = seq = self.next_seq
+        self.next_seq += 1
+        heapq.heappush(self.queue, (wake_time, seq, bee))
+
+    def _take_off(self, bee):
+        bee.wake_time = None
+        bee.sched_seq = self.next_seq
+        self.next_seq += 1
+        self.flying[bee] = None
+
+    def _adopt(self, bees, game_state):
+        """Schedules bees added since the last tick, in the order they were added."""
+        now = game_state.sim_time
+        restored_flying = []
+        for bee in bees:
+            if not bee.alive: # Removed before its first tick
+                continue
+            if game_state.chunks.chunk_at(bee.hive.pos).sim_time is not None:
+                continue # Hive is dormant; the bee stays in it until the hive is woken
+            if bee.sched_seq is not None: # Restored from a snapshot, schedule included
+                self.next_seq = max(self.next_seq, bee.sched_seq + 1)
+                if bee.wake_time is None:
+                    restored_flying.append(bee)
+                else:
+                    heapq.heappush(self.queue, (bee.wake_time, bee.sched_seq, bee))
+            elif bee.state == BeeState.FLYING_OUT or bee.state == BeeState.RETURNING:
+                self._take_off(bee)
+            elif bee.state == BeeState.FORAGING: # e.g. from an older snapshot without schedules
+                self._sleep(bee, now + bee.forage_timer)
+            else:
+                self._sleep(bee, now + game_state.rng.expovariate(IDLE_LAUNCH_RATE))
+        restored_flying.sort(key=lambda bee: bee.sched_seq) # Back into take-off order
+        for bee in restored_flying:
+            self.flying[bee] = None
+
+    def step(self, dt, game_state):
+        """Wakes the bees that are due, then moves every flying bee by dt."""
+        if game_state.new_bees:
+            self._adopt(game_state.new_bees, game_state)
+            game_state.new_bees.clear()
+        now = game_state.sim_time
+        rng = game_state.rng
+
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            _, seq, bee = heapq.heappop(queue)
+            if bee.sched_seq != seq:
+                continue # Stale entry
+            if bee.state == BeeState.FORAGING:
+                bee.finish_foraging()
+                self._take_off(bee)
+            elif bee.launch(game_state):
+                self._take_off(bee)
+            else: # Nothing in range; wait for the next launch
+                self._sleep(bee, now + rng.expovariate(IDLE_LAUNCH_RATE))
+
+        flying = self.flying
+        for bee in list(flying):
+            if bee.sched_seq is None: # Removed along with its hive
+                del flying[bee]
+            elif bee.fly(dt, game_state):
+                del flying[bee]
+                bee.prev_pos = (bee.pos.x, bee.pos.y) # Not moved again while it waits
+                if bee.state == BeeState.FORAGING:
+                    self._sleep(bee, now + bee.forage_timer)
+                else:
+                    self._sleep(bee, now + rng.expovariate(IDLE_LAUNCH_RATE))
+
+
+def _lod_group(key):
+    """Which tick (mod LOD_INTERVAL_TICKS) a dormant chunk catches up on; fixed per chunk."""
+    return (key[0] * 7 + key[1] * 13) % LOD_INTERVAL_TICKS
+
 
 class Simulator:
-    def __init__(self, game_state, asset_manager):
+    def __init__(self, game_state, bee_engine="object", lod=True):
+        if bee_engine not in BEE_ENGINES:
+            raise ValueError(f"Unknown bee engine: {bee_engine}")
         self.game_state = game_state
-        self.asset_manager = asset_manager
-        self.kid_spawn_timer = random.uniform(5.0, 15.0) # Time until first kid check
+        self.kid_spawn_timer = game_state.rng.uniform(5.0, 15.0) # Time until first kid check
+
+        self.accumulator = 0.0 # Frame time not yet simulated
+        self.flowers_wilted = 0 # Running total, for balancing stats
+        self.autosaver = None # Optional Autosaver, started at each day rollover
+
+        # Level of detail: off-screen chunks go dormant. Their hives produce in one coarse
+        # step per LOD_INTERVAL_TICKS (production is a rate, not carried by bees), their
+        # flowers wilt the same way, and their bees wait in the hive until it's on screen again
+        self.lod = lod
+        self.active_chunks = {} # key -> Chunk simulated every tick
+        self.dormant_chunks = [{} for _ in range(LOD_INTERVAL_TICKS)] # By _lod_group(key)
+        self.swarm_bees = None # Active bees for the swarm, rebuilt when the active set changes
+        self.swarm_bee_total = 0
+
+        self.bee_engine = bee_engine
+        self.swarm = None
+        self.scheduler = BeeScheduler()
+        if bee_engine == "swarm":
+            from systems.swarm import BeeSwarm # Imported lazily, needs NumPy
+            self.swarm = BeeSwarm(rng=game_state.np_rng)
+
+    def advance(self, frame_time):
+        """Runs as many fixed ticks as frame_time covers; returns the tick count.
+
+        Leftover time carries over to the next frame and sets
+        GameState.interpolation_alpha for rendering between ticks.
+        """
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= SIM_TICK_SECONDS and ticks < MAX_CATCHUP_TICKS:
+            self.tick(SIM_TICK_SECONDS)
+            self.accumulator -= SIM_TICK_SECONDS
+            ticks += 1
+        if ticks == MAX_CATCHUP_TICKS:
+            self.accumulator = min(self.accumulator, SIM_TICK_SECONDS) # Drop the backlog after a long stall
+        self.game_state.interpolation_alpha = self.accumulator / SIM_TICK_SECONDS
+        return ticks
+
+    def reset_lod(self):
+        """Forgets which chunks are active or dormant (after a restore rebuilt them all)."""
+        self.active_chunks = {}
+        self.dormant_chunks = [{} for _ in range(LOD_INTERVAL_TICKS)]
+        self.swarm_bees = None
+
+    def _remove_wilted(self, flowers):
+        gs = self.game_state
+        flowers.sort(key=lambda flower: flower.dense_index) # List order, whatever order the chunks hold them in
+        for flower in flowers:
+            gs.remove_flower(flower) # Just remove, no refund for wilting
+            self.flowers_wilted += 1
+            print(f"{flower.type} wilted and removed.")
+
+    def _catch_up(self, chunk, now):
+        """Runs a dormant chunk's flowers and hives from chunk.sim_time to now in one step.
+
+        Both are linear in dt (wilting and the production rate), so one big
+        step matches many small ones, up to when a flower's death is noticed.
+        """
+        if self.autosaver is not None:
+            self.autosaver.before_chunk_update(chunk) # An autosave still copying dormant chunks takes this one first
+        elapsed = now - chunk.sim_time
+        chunk.sim_time = now
+        if elapsed <= 0:
+            return
+        wilted = []
+        for flower in chunk.flowers:
+            flower.update(elapsed)
+            if flower.health <= 0:
+                wilted.append(flower)
+        for hive in chunk.hives:
+            hive.update(elapsed, self.game_state)
+        if wilted:
+            self._remove_wilted(wilted)
+
+    def _wake(self, chunk, now):
+        """Dormant -> active: catches the chunk up to now."""
+        self.dormant_chunks[_lod_group(chunk.key)].pop(chunk.key, None)
+        self._catch_up(chunk, now)
+        chunk.sim_time = None
+        self.swarm_bees = None
+
+    def _rematerialize(self, hives):
+        """Scatters the bees of woken hives over their forage cycle and hands them to the bee engine."""
+        gs = self.game_state
+        pending = set(gs.new_bees) # Added while dormant and never scheduled: adopted as new bees
+        hives.sort(key=lambda hive: hive.dense_index) # Same RNG draws whatever order the chunks hold them in
+        for hive in hives:
+            for bee in sorted(hive.bees, key=lambda bee: bee.dense_index):
+                if bee not in pending:
+                    bee.rematerialize(gs)
+                    gs.new_bees.append(bee)
+
+    def _wake_restored(self, start):
+        """Without LOD, chunks restored dormant (from a LOD save) are woken straight away."""
+        chunks = self.game_state.chunks
+        woken = []
+        for chunk in chunks.created:
+            if chunk.sim_time is not None and chunks.chunks.get(chunk.key) is chunk:
+                self._wake(chunk, start)
+                woken.extend(chunk.hives)
+        chunks.created.clear()
+        if woken:
+            self._rematerialize(woken)
+
+    def _update_lod(self, start, end):
+        """Moves chunks between active and dormant to follow the camera, and catches up
+        this tick's share of dormant chunks. Returns the active chunks (key -> Chunk).
+
+        Chunks leave at start (their contents are current up to it) and are
+        woken at start, before this tick's regular update runs on them.
+        """
+        gs = self.game_state
+        chunks = gs.chunks
+        live = chunks.chunks
+        margin = 2 * LOD_VIEW_MARGIN
+        in_view = {chunk.key: chunk for chunk in chunks.chunks_in(gs.camera.view_rect().inflate(margin, margin))}
+        active = self.active_chunks
+        if chunks.created: # Placed or restored since the last tick
+            for chunk in chunks.created:
+                if live.get(chunk.key) is not chunk:
+                    continue # Emptied again already
+                if chunk.sim_time is None:
+                    active[chunk.key] = chunk # Put to sleep below if it's off-screen
+                else: # Restored dormant
+                    self.dormant_chunks[_lod_group(chunk.key)][chunk.key] = chunk
+            chunks.created.clear()
+            self.swarm_bees = None
+
+        for key, chunk in list(active.items()):
+            if live.get(key) is not chunk:
+                del active[key]
+            elif key not in in_view: # Active -> dormant: its bees fold into their hives
+                del active[key]
+                chunk.sim_time = start
+                self.dormant_chunks[_lod_group(key)][key] = chunk
+                for hive in chunk.hives:
+                    for bee in hive.bees:
+                        bee.dematerialize()
+                self.swarm_bees = None
+
+        woken = []
+        for key, chunk in in_view.items():
+            if chunk.sim_time is not None:
+                self._wake(chunk, start)
+                active[key] = chunk
+                woken.extend(chunk.hives)
+        if woken:
+            self._rematerialize(woken)
+
+        group = self.dormant_chunks[round(end / SIM_TICK_SECONDS) % LOD_INTERVAL_TICKS]
+        for key, chunk in list(group.items()):
+            if live.get(key) is not chunk:
+                del group[key]
+            else:
+                self._catch_up(chunk, end)
+        return active
+
+    def _active_bees(self, active):
+        """Bees of active hives in GameState.bees order, for the swarm; rebuilt only when that set may have changed."""
+        gs = self.game_state
+        if self.swarm_bees is None or gs.new_bees or len(gs.bees) != self.swarm_bee_total:
+            self.swarm_bees = sorted((bee for chunk in active.values() for hive in chunk.hives for bee in hive.bees),
+                                     key=lambda bee: bee.dense_index)
+            self.swarm_bee_total = len(gs.bees)
+        return self.swarm_bees
 
     def tick(self, dt):
         """Update the game state for one frame."""
         gs = self.game_state # Shorthand
+        start = gs.sim_time
 
         # --- Time Update ---
-        gs.game_time_seconds += dt
-        if gs.game_time_seconds >= GAME_DAY_SECONDS:
-            gs.game_time_seconds -= GAME_DAY_SECONDS # Reset for next day
+        new_day = False
+        gs.day_ticks += 1
+        gs.sim_time += dt
+        if gs.day_ticks >= TICKS_PER_DAY:
+            new_day = True
+            gs.day_ticks = 0 # Reset for next day
             gs.day_count += 1
             # Potentially trigger seasonal changes here
             print(f"--- Day {gs.day_count} Starting ---")
             # Maybe wilt flowers more overnight? Or reset nectar?
+        gs.game_time_seconds = gs.day_ticks * SIM_TICK_SECONDS
+
+        # Per-system timings: one flag check per section when the profiler is off
+        # (this runs every tick, up to MAX_CATCHUP_TICKS times a frame)
+        timed = profiler.enabled
+        if timed:
+            lap = profiler.lap(None, 0.0)
+
+        # --- Level of Detail ---
+        # Only chunks near the view get the per-tick updates below
+        if self.lod:
+            active = self._update_lod(start, gs.sim_time)
+            flower_sets = [chunk.flowers for chunk in active.values()]
+            hive_sets = [chunk.hives for chunk in active.values()]
+        else:
+            if gs.chunks.created:
+                self._wake_restored(start)
+            flower_sets = (gs.flowers,)
+            hive_sets = (gs.hives,)
+        if timed:
+            lap = profiler.lap("sim.lod", lap)
 
         # --- Entity Updates ---
         # Update Flowers (and handle wilting/removal)
         flowers_to_remove = []
-        for flower in gs.flowers:
-            flower.update(dt)
-            if flower.health <= 0:
-                flowers_to_remove.append(flower)
-        for flower in flowers_to_remove:
-             gs.flowers.remove(flower) # Just remove, no refund for wilting
-             print(f"{flower.type} wilted and removed.")
+        for flowers in flower_sets:
+            for flower in flowers:
+                flower.update(dt)
+                if flower.health <= 0:
+                    flowers_to_remove.append(flower)
+        if flowers_to_remove:
+            self._remove_wilted(flowers_to_remove)
+        if timed:
+            lap = profiler.lap("sim.flowers", lap)
 
         # Update Hives (production handled here or in Hive?)
-        for hive in gs.hives:
-            hive.update(dt, gs) # Pass game_state for access to flowers/rates
+        for hives in hive_sets:
+            for hive in hives:
+                hive.update(dt, gs) # Pass game_state for access to flowers/rates
+        if timed:
+            lap = profiler.lap("sim.hives", lap)
 
         # Update Bees
-        for bee in gs.bees:
-            bee.update(dt, gs.flowers) # Bees need list of flowers
+        if self.swarm:
+            bees = self._active_bees(active) if self.lod else None
+            gs.new_bees.clear() # The swarm picks up new bees by itself
+            self.swarm.step(dt, gs, bees) # All (active) bees in one batched step
+        else:
+            self.scheduler.step(dt, gs) # Only due and flying bees
+        if timed:
+            lap = profiler.lap("sim.bees", lap)
 
         # Update Kids (and handle despawning)
         kids_to_remove = []
-        for kid in gs.kids:
+        for kid in list(gs.kids): # Copy: kids remove themselves, which reorders the list
             kid.update(dt, gs) # Kid update handles despawning timers and state changes
             # Removal is now handled inside kid.update() or via player click in main.py
+        if timed:
+            lap = profiler.lap("sim.kids", lap)
 
         # --- Kid Spawning ---
         self.kid_spawn_timer -= dt
         if self.kid_spawn_timer <= 0:
             # Reset timer for next potential spawn
-            self.kid_spawn_timer = random.uniform(5.0, 20.0) # Time between spawn checks
+            self.kid_spawn_timer = gs.rng.uniform(5.0, 20.0) # Time between spawn checks
 
             # Check if a kid should spawn based on chance
             # Make it less likely if many kids exist? More likely if lots of honey?
             max_kids = 3 # Example limit
-            if len(gs.kids) < max_kids and random.random() < KID_SPAWN_CHANCE_PER_SECOND * (self.kid_spawn_timer + 1): # Approximation
+            if len(gs.kids) < max_kids and gs.rng.random() < KID_SPAWN_CHANCE_PER_SECOND * (self.kid_spawn_timer + 1): # Approximation
                 if gs.hives: # Only spawn if there's something to target
-                     new_kid = Kid(self.asset_manager, gs.hives)
+                     new_kid = Kid(gs.hives, gs.rng)
                      gs.add_kid(new_kid)
                      print("A mischievous kid appeared!")
                 else:
                     # No hives, reset timer longer?
-                    self.kid_spawn_timer = random.uniform(10.0, 25.0)
+                    self.kid_spawn_timer = gs.rng.uniform(10.0, 25.0)
+        if timed:
+            profiler.lap("sim.spawn", lap)
 
 
         # --- Resource Cap / Other Global Checks? ---
-        # e.g., gs.honey = min(gs.honey, MAX_HONEY_STORAGE)
\ No newline at end of file
+        # e.g., gs.honey = min(gs.honey, MAX_HONEY_STORAGE)
+
+        # --- Autosave (end of tick, so the snapshot resumes on a tick boundary) ---
+        if self.autosaver is not None:
+            if new_day:
+                self.autosaver.submit(gs, self) # Copies the on-screen state now, dormant chunks as they catch up
+            self.autosaver.end_tick() # Queues the snapshot for the worker once it's all copied
\ No newline at end of file
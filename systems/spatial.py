@@ -0,0 +1,80 @@
+# Uniform-grid spatial hash for radius queries over static entities (flowers)
+DEFAULT_CELL_SIZE = 100 # Pixels per grid cell; ~ the typical query radius
+
+
+class SpatialHash:
+    """Buckets entities by grid cell so radius queries only visit nearby cells."""
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}        # (cx, cy) -> {entity: (x, y)}, dicts keep insertion order
+        self.entity_cells = {} # entity -> (cx, cy) for O(1) removal
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def __len__(self):
+        return len(self.entity_cells)
+
+    def __contains__(self, entity):
+        return entity in self.entity_cells
+
+    def insert(self, entity, pos):
+        if entity in self.entity_cells:
+            self.remove(entity)
+        x, y = pos
+        key = self._cell(x, y)
+        self.cells.setdefault(key, {})[entity] = (x, y)
+        self.entity_cells[entity] = key
+
+    def remove(self, entity):
+        """Removes entity if indexed. Returns True if it was present."""
+        key = self.entity_cells.pop(entity, None)
+        if key is None:
+            return False
+        bucket = self.cells[key]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[key]
+        return True
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+
+    def _candidate_buckets(self, x, y, radius):
+        cells = self.cells
+        if not cells:
+            return
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query_radius(self, pos, radius):
+        """Returns entities strictly closer than radius to pos."""
+        x, y = pos
+        radius_sq = radius * radius
+        found = []
+        for bucket in self._candidate_buckets(x, y, radius):
+            for entity, (ex, ey) in bucket.items():
+                dx = ex - x
+                dy = ey - y
+                if dx * dx + dy * dy < radius_sq:
+                    found.append(entity)
+        return found
+
+    def any_within(self, pos, radius):
+        """True if at least one entity is strictly closer than radius to pos."""
+        x, y = pos
+        radius_sq = radius * radius
+        for bucket in self._candidate_buckets(x, y, radius):
+            for ex, ey in bucket.values():
+                dx = ex - x
+                dy = ey - y
+                if dx * dx + dy * dy < radius_sq:
+                    return True
+        return False
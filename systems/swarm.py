@@ -0,0 +1,168 @@
+import pygame
+from entities.bee import BeeState, IDLE_LAUNCH_RATE, FORAGE_TIME_RANGE, FLOWER_SEARCH_RADIUS, ARRIVAL_DISTANCE
+from entities.flower import MIN_POLLINATION_HEALTH
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, only needed for the swarm engine
+    np = None
+
+
+class BeeSwarm:
+    """Struct-of-arrays bee engine.
+
+    Mirrors GameState.bees into NumPy arrays and advances every bee's state
+    machine in one batched step per tick. Bee objects stay the source of
+    identity (hive removal, drawing); positions and states are written back
+    only for bees that moved or changed state.
+    """
+
+    def __init__(self, rng):
+        if np is None:
+            raise ImportError("The swarm bee engine requires NumPy (pip install numpy).")
+        self.rng = rng # GameState.np_rng, so swarm runs replay with the seed
+        self.bees = []     # Bee objects, parallel to the arrays below
+        self.flowers = []  # Flower snapshot that target indices refer to
+        self.flower_slot = {} # Flower -> index into the snapshot
+        self._allocate(0)
+        self.flower_pos = np.zeros((0, 2))
+
+    def _allocate(self, count):
+        self.pos = np.zeros((count, 2))
+        self.prev_pos = np.zeros((count, 2))
+        self.vel = np.zeros((count, 2))
+        self.hive_pos = np.zeros((count, 2))
+        self.speed = np.zeros(count)
+        self.state = np.zeros(count, dtype=np.int8)
+        self.target = np.full(count, -1, dtype=np.int32)
+        self.forage_timer = np.zeros(count)
+
+    def _sync_bees(self, bees):
+        """Rebuilds the arrays from the Bee objects when the bee list changed."""
+        self.bees = list(bees)
+        self._allocate(len(self.bees))
+        for i, bee in enumerate(self.bees):
+            self.pos[i] = bee.pos
+            self.prev_pos[i] = bee.prev_pos
+            self.hive_pos[i] = bee.hive.rect.center
+            self.speed[i] = bee.speed
+            self.state[i] = bee.state
+            self.forage_timer[i] = bee.forage_timer
+            if bee.target_flower is not None:
+                self.target[i] = self.flower_slot.get(bee.target_flower, -1)
+
+    def _sync_flowers(self, flowers):
+        """Refreshes the flower snapshot and remaps bee targets onto it."""
+        new_slot = {f: i for i, f in enumerate(flowers)}
+        remap = np.array([new_slot.get(f, -1) for f in self.flowers] + [-1], dtype=np.int32)
+        self.target = remap[self.target] # -1 indexes the trailing -1 sentinel
+        self.flowers = list(flowers)
+        self.flower_slot = new_slot
+        self.flower_pos = np.array([f.pos for f in self.flowers], dtype=float).reshape(-1, 2)
+
+    def _choose_flowers(self, launching, flower_index):
+        """Picks a random pollinatable flower in range for each launching bee (-1 if none)."""
+        choice = np.full(len(launching), -1, dtype=np.int32)
+        if not self.flowers:
+            return choice
+        # Only ~1% of idle bees launch per tick, so per-bee grid queries stay cheap
+        picks = self.rng.random(len(launching))
+        for n, (x, y) in enumerate(self.pos[launching].tolist()):
+            candidates = [f for f in flower_index.query_radius((x, y), FLOWER_SEARCH_RADIUS)
+                          if f.health > MIN_POLLINATION_HEALTH]
+            if candidates:
+                choice[n] = self.flower_slot[candidates[int(picks[n] * len(candidates))]]
+        return choice
+
+    def _move_towards(self, idx, goal, dt):
+        """Moves bees idx towards goal; returns the mask of bees that arrived."""
+        delta = goal - self.pos[idx]
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        arrived = dist < ARRIVAL_DISTANCE
+        moving = ~arrived
+        direction = delta[moving] / dist[moving, None]
+        self.vel[idx[moving]] = direction * self.speed[idx[moving], None]
+        self.pos[idx[moving]] += self.vel[idx[moving]] * dt
+        self.vel[idx[arrived]] = 0.0
+        return arrived
+
+    def step(self, dt, game_state, bees=None):
+        """Advances every bee (or just bees, e.g. the simulator's on-screen ones) by dt seconds in one batched update."""
+        flowers = game_state.flowers
+        if bees is None:
+            bees = game_state.bees
+        if self.flowers != flowers: # Identity compare, runs in C
+            self._sync_flowers(flowers)
+        if self.bees != bees:
+            self._sync_bees(bees)
+        if not self.bees:
+            return
+
+        self.prev_pos = self.pos.copy() # For render interpolation
+        state = self.state.copy() # Transitions below read the state at tick start
+        touched = state != BeeState.IDLE
+
+        # --- IDLE: chance to launch towards a nearby flower ---
+        # Same Poisson launch rate as the object engine's scheduler, whatever dt is
+        idle = np.flatnonzero(state == BeeState.IDLE)
+        launching = idle[self.rng.random(len(idle)) < -np.expm1(-IDLE_LAUNCH_RATE * dt)]
+        if len(launching):
+            choice = self._choose_flowers(launching, game_state.flower_index)
+            found = choice >= 0
+            launched = launching[found]
+            self.target[launched] = choice[found]
+            self.state[launched] = BeeState.FLYING_OUT
+            touched[launched] = True
+
+        # --- FLYING_OUT: head to target, start foraging on arrival ---
+        flying = np.flatnonzero(state == BeeState.FLYING_OUT)
+        lost = flying[self.target[flying] < 0] # Target flower disappeared
+        self.state[lost] = BeeState.RETURNING
+        flying = flying[self.target[flying] >= 0]
+        if len(flying):
+            arrived = self._move_towards(flying, self.flower_pos[self.target[flying]], dt)
+            landed = flying[arrived]
+            self.pos[landed] = self.flower_pos[self.target[landed]]
+            self.state[landed] = BeeState.FORAGING
+            self.forage_timer[landed] = self.rng.uniform(*FORAGE_TIME_RANGE, size=len(landed))
+            for i in landed:
+                self.flowers[self.target[i]].add_pollinator(self.bees[i]) # Notify flower
+
+        # --- FORAGING: wait out the timer, then head home ---
+        foraging = np.flatnonzero(state == BeeState.FORAGING)
+        self.forage_timer[foraging] -= dt
+        done = foraging[self.forage_timer[foraging] <= 0]
+        for i in done:
+            if self.target[i] >= 0:
+                self.flowers[self.target[i]].remove_pollinator(self.bees[i]) # Notify flower we're done
+        self.state[done] = BeeState.RETURNING
+        self.target[done] = -1
+
+        # --- RETURNING: fly back, go idle on arrival ---
+        returning = np.flatnonzero(state == BeeState.RETURNING)
+        if len(returning):
+            arrived = self._move_towards(returning, self.hive_pos[returning], dt)
+            home = returning[arrived]
+            self.pos[home] = self.hive_pos[home]
+            self.state[home] = BeeState.IDLE
+            for i in home:
+                self.bees[i].hive.receive_bee(self.bees[i])
+
+        self._write_back(np.flatnonzero(touched))
+
+    def _write_back(self, indices):
+        """Copies array state back onto the Bee objects that changed this tick."""
+        bees, flowers = self.bees, self.flowers
+        positions = self.pos[indices].tolist()
+        previous = self.prev_pos[indices].tolist()
+        states = self.state[indices].tolist()
+        targets = self.target[indices].tolist()
+        timers = self.forage_timer[indices].tolist()
+        for i, (x, y), prev, state, target, timer in zip(indices.tolist(), positions, previous, states, targets, timers):
+            bee = bees[i]
+            bee.prev_pos = tuple(prev)
+            bee.pos = pygame.Vector2(x, y)
+            bee.rect.center = (x, y)
+            bee.state = state
+            bee.target_flower = flowers[target] if target >= 0 else None
+            bee.forage_timer = timer
@@ -0,0 +1,136 @@
+import pygame
+
+# World layout: fixed-size chunks owning the placed entities, and the camera looking at them
+CHUNK_SIZE = 256 # Pixels per chunk side; a screen-sized view overlaps ~5x4 chunks
+
+
+class Chunk:
+    """One square of the world and the hives and flowers placed in it.
+
+    Bees live in their hive's roster and kids roam the whole world, so
+    neither is stored here. Dicts are used as ordered sets: iteration
+    follows insertion, which is the order the renderer draws in.
+    """
+    __slots__ = ("key", "rect", "hives", "flowers", "sim_time")
+
+    def __init__(self, key, size):
+        self.key = key
+        self.rect = pygame.Rect(key[0] * size, key[1] * size, size, size)
+        self.hives = {}
+        self.flowers = {}
+        # None while the simulator updates this chunk every tick; while it's dormant (off-screen,
+        # see systems.sim level of detail) the GameState.sim_time its contents are current to
+        self.sim_time = None
+
+    def __bool__(self):
+        return bool(self.hives or self.flowers)
+
+
+class ChunkMap:
+    """Sparse grid of chunks: only chunks holding something exist.
+
+    Hives and flowers never move, so an entity's chunk is always the one
+    under its position and needs no back-reference.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks = {} # (cx, cy) -> Chunk
+        self.created = [] # Chunks made since the simulator last looked (it decides which are dormant)
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def key(self, pos):
+        return (int(pos[0] // self.chunk_size), int(pos[1] // self.chunk_size))
+
+    def chunk_at(self, pos):
+        """The chunk under pos, or None if nothing is placed there."""
+        return self.chunks.get(self.key(pos))
+
+    def _chunk_for(self, pos):
+        key = self.key(pos)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = Chunk(key, self.chunk_size)
+            self.created.append(chunk)
+        return chunk
+
+    def _release(self, chunk):
+        if not chunk:
+            del self.chunks[chunk.key]
+
+    def add_hive(self, hive):
+        self._chunk_for(hive.pos).hives[hive] = None
+
+    def add_flower(self, flower):
+        self._chunk_for(flower.pos).flowers[flower] = None
+
+    def remove_hive(self, hive):
+        chunk = self.chunks[self.key(hive.pos)]
+        del chunk.hives[hive]
+        self._release(chunk)
+
+    def remove_flower(self, flower):
+        chunk = self.chunks[self.key(flower.pos)]
+        del chunk.flowers[flower]
+        self._release(chunk)
+
+    def clear(self):
+        self.chunks.clear()
+        self.created.clear()
+
+    def chunks_in(self, rect):
+        """Existing chunks overlapping rect, row by row."""
+        chunks = self.chunks
+        min_cx, min_cy = self.key(rect[:2])
+        max_cx, max_cy = self.key((rect[0] + rect[2] - 1, rect[1] + rect[3] - 1))
+        found = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                chunk = chunks.get((cx, cy))
+                if chunk is not None:
+                    found.append(chunk)
+        return found
+
+
+class Camera:
+    """The screen-sized window onto the world, kept inside the world bounds.
+
+    x, y is the world position of the screen's top-left corner. It moves
+    in fractional pixels; drawing uses the rounded offset() so sprites
+    stay on whole pixels.
+    """
+
+    def __init__(self, view_size, world_size):
+        self.width, self.height = view_size
+        self.world_width, self.world_height = world_size
+        self.x = 0.0
+        self.y = 0.0
+
+    def move_to(self, x, y):
+        self.x = max(0.0, min(float(x), self.world_width - self.width))
+        self.y = max(0.0, min(float(y), self.world_height - self.height))
+
+    def scroll(self, dx, dy):
+        self.move_to(self.x + dx, self.y + dy)
+
+    def center_on(self, pos):
+        self.move_to(pos[0] - self.width / 2, pos[1] - self.height / 2)
+
+    def offset(self):
+        """Whole-pixel world position of the screen's top-left corner."""
+        return (round(self.x), round(self.y))
+
+    def view_rect(self):
+        """World area currently on screen."""
+        ox, oy = self.offset()
+        return pygame.Rect(ox, oy, self.width, self.height)
+
+    def screen_to_world(self, pos):
+        ox, oy = self.offset()
+        return (pos[0] + ox, pos[1] + oy)
+
+    def world_to_screen(self, pos):
+        ox, oy = self.offset()
+        return (pos[0] - ox, pos[1] - oy)
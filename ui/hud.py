@@ -4,24 +4,57 @@ from game_state import GAME_DAY_SECONDS # For time display
 from entities.flower import FLOWER_DATA # For placement costs
 from entities.hive import HIVE_COST
 
-# Store HUD buttons here
-hud_buttons = []
-
 # Re-use Button class from menu.py (or define a similar one here)
 # For simplicity, let's assume menu.Button is accessible or redefined
-from ui.menu import Button
+from ui.menu import Button, RetainedLayout
+
+HUD_BUTTON_SIZE = 60
+TOP_BAR_HEIGHT = 40
+BOTTOM_BAR_HEIGHT = 80
+TOOLTIP_HEIGHT = 40 # Band above the bottom bar where tooltips appear
+
+# Bottom bar actions, built once from FLOWER_DATA
+ACTION_BUTTONS = [
+    {"action": "select", "label": "Select", "icon": None, "cost": None},
+    {"action": "place_hive", "label": f"Hive (${HIVE_COST})", "icon": "hive", "cost": HIVE_COST},
+]
+# Add flower placement buttons
+for name, data in FLOWER_DATA.items():
+     ACTION_BUTTONS.append({
+         "action": f"place_flower_{name.lower()}",
+         "label": f"{name} (${data['cost']})",
+         "icon": data['sprite'],
+         "cost": data['cost']
+     })
+ACTION_BUTTONS.extend([
+    {"action": "water", "label": "Water", "icon": None, "cost": None}, # Add water can icon later
+    {"action": "remove", "label": "Remove", "icon": None, "cost": None}, # Add shovel icon later
+    {"action": "market", "label": "Market", "icon": None, "cost": None},
+])
+
+# Persistent HUD button tree
+hud_layout = RetainedLayout()
+
+def _clock_text(game_state):
+    total_minutes_in_day = 24 * 60
+    current_minute = int((game_state.get_time_of_day_ratio() * total_minutes_in_day) % total_minutes_in_day)
+    hour = (current_minute // 60) % 24
+    minute = current_minute % 60
+    return f"{hour:02d}:{minute:02d}"
 
-def draw_hud(screen, asset_manager, game_state):
-    global hud_buttons
-    hud_buttons = [] # Reset buttons each frame
+def top_bar_key(game_state):
+    """Everything the top bar shows; it only needs repainting when this changes."""
+    return (game_state.money, f"{game_state.honey:.1f}", f"{game_state.wax:.1f}", f"{game_state.pollen:.1f}",
+            game_state.day_count, _clock_text(game_state))
 
+def draw_hud(screen, asset_manager, game_state):
     screen_width = screen.get_width()
     screen_height = screen.get_height()
     font_medium = asset_manager.get_font('comfortaa', 24)
     font_small = asset_manager.get_font('comfortaa', 18)
 
     # --- Top Bar (Resources, Time) ---
-    top_bar_height = 40
+    top_bar_height = TOP_BAR_HEIGHT
     top_bar_rect = pygame.Rect(0, 0, screen_width, top_bar_height)
     pygame.draw.rect(screen, (BLACK + (180,)), top_bar_rect) # Semi-transparent black
 
@@ -30,28 +63,28 @@ def draw_hud(screen, asset_manager, game_state):
 
     # Money
     money_text = f"$ {game_state.money}"
-    money_surf = font_medium.render(money_text, True, YELLOW)
+    money_surf = asset_manager.render_text(font_medium, money_text, True, YELLOW)
     money_rect = money_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(money_surf, money_rect)
     current_x = money_rect.right + 20
 
     # Honey
     honey_text = f"Honey: {game_state.honey:.1f}"
-    honey_surf = font_small.render(honey_text, True, WHITE)
+    honey_surf = asset_manager.render_text(font_small, honey_text, True, WHITE)
     honey_rect = honey_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(honey_surf, honey_rect)
     current_x = honey_rect.right + 15
 
     # Wax
     wax_text = f"Wax: {game_state.wax:.1f}"
-    wax_surf = font_small.render(wax_text, True, WHITE)
+    wax_surf = asset_manager.render_text(font_small, wax_text, True, WHITE)
     wax_rect = wax_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(wax_surf, wax_rect)
     current_x = wax_rect.right + 15
 
     # Pollen
     pollen_text = f"Pollen: {game_state.pollen:.1f}"
-    pollen_surf = font_small.render(pollen_text, True, WHITE)
+    pollen_surf = asset_manager.render_text(font_small, pollen_text, True, WHITE)
     pollen_rect = pollen_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(pollen_surf, pollen_rect)
     current_x = pollen_rect.right + 30 # More space before time
@@ -59,18 +92,14 @@ def draw_hud(screen, asset_manager, game_state):
 
     # Day/Time
     day_text = f"Day: {game_state.day_count}"
-    day_surf = font_small.render(day_text, True, WHITE)
+    day_surf = asset_manager.render_text(font_small, day_text, True, WHITE)
     day_rect = day_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(day_surf, day_rect)
     current_x = day_rect.right + 15
 
     # Time of Day (Simple HH:MM format)
-    total_minutes_in_day = 24 * 60
-    current_minute = int((game_state.get_time_of_day_ratio() * total_minutes_in_day) % total_minutes_in_day)
-    hour = (current_minute // 60) % 24
-    minute = current_minute % 60
-    time_text = f"{hour:02d}:{minute:02d}"
-    time_surf = font_small.render(time_text, True, WHITE)
+    time_text = _clock_text(game_state)
+    time_surf = asset_manager.render_text(font_small, time_text, True, WHITE)
     time_rect = time_surf.get_rect(midleft=(current_x, top_bar_height / 2))
     screen.blit(time_surf, time_rect)
     current_x = time_rect.right + 20
@@ -80,88 +109,28 @@ def draw_hud(screen, asset_manager, game_state):
 
 
     # --- Bottom Bar (Actions) ---
-    bottom_bar_height = 80
+    bottom_bar_height = BOTTOM_BAR_HEIGHT
     bottom_bar_y = screen_height - bottom_bar_height
     bottom_bar_rect = pygame.Rect(0, bottom_bar_y, screen_width, bottom_bar_height)
     pygame.draw.rect(screen, (BLACK + (180,)), bottom_bar_rect)
 
-    button_size = 60
-    button_padding = 10
-    start_x = button_padding
-    button_y = bottom_bar_y + (bottom_bar_height - button_size) / 2
-
-    action_buttons = [
-        {"action": "select", "label": "Select", "icon": None, "cost": None},
-        {"action": "place_hive", "label": f"Hive (${HIVE_COST})", "icon": "hive", "cost": HIVE_COST},
-        # Add flowers dynamically
-    ]
-    # Add flower placement buttons
-    for name, data in FLOWER_DATA.items():
-         action_buttons.append({
-             "action": f"place_flower_{name.lower()}",
-             "label": f"{name} (${data['cost']})",
-             "icon": data['sprite'],
-             "cost": data['cost']
-         })
-
-    action_buttons.extend([
-        {"action": "water", "label": "Water", "icon": None, "cost": None}, # Add water can icon later
-        {"action": "remove", "label": "Remove", "icon": None, "cost": None}, # Add shovel icon later
-        {"action": "market", "label": "Market", "icon": None, "cost": None},
-    ])
-
-
-    for i, btn_data in enumerate(action_buttons):
-        button_x = start_x + i * (button_size + button_padding)
-        is_selected = game_state.selected_action == btn_data["action"]
-        can_afford = True
-        if btn_data["cost"] is not None and game_state.money < btn_data["cost"]:
-             can_afford = False
-
-
-        # Define callback for each button
-        def create_callback(action_name):
-            def callback():
-                # If the same action is clicked again, deselect it (unless it's 'select' or 'market')
-                non_toggle_actions = ["select", "market", "water", "remove"]
-                if game_state.selected_action == action_name and action_name not in non_toggle_actions:
-                    game_state.selected_action = "select" # Default back to select mode
-                    game_state.show_placement_preview = False
-                    print(f"Deselected: {action_name}")
-                elif action_name == "market":
-                     game_state.game_mode = GameMode.MARKET
-                     print("Opening Market via HUD")
-                else:
-                    # Check affordability for placement actions
-                    cost = btn_data.get("cost")
-                    if cost is not None and game_state.money < cost:
-                         print(f"Cannot select {action_name}, not enough money.")
-                         # Maybe flash the money display?
-                         return # Don't select if cannot afford
-
-                    game_state.selected_action = action_name
-                    game_state.show_placement_preview = action_name.startswith("place_")
-                    print(f"Selected action: {action_name}")
-            return callback
-
-        # Create button (simplified text button for now, icons later)
-        btn = Button(button_x, button_y, button_size, button_size,
-                     btn_data["label"].split(" ")[0], # Just use first word as temp label
-                     font_small, create_callback(btn_data["action"]),
-                     bg_color=(YELLOW if is_selected else (BROWN if can_afford else (50,50,50))), # Highlight selected, dim unaffordable
-                     hover_color=GREEN if can_afford else (70,70,70)
-                     )
+    # Rebuild the button tree only when selection or affordability changes
+    affordable = tuple(btn_data["cost"] is None or game_state.money >= btn_data["cost"] for btn_data in ACTION_BUTTONS)
+    key = (screen_width, screen_height, game_state.selected_action, affordable)
+    if hud_layout.needs_rebuild(key):
+        _build_action_buttons(hud_layout, bottom_bar_y, bottom_bar_height, asset_manager, game_state, affordable)
 
+    button_size = HUD_BUTTON_SIZE
+    for btn, btn_data, can_afford in zip(hud_layout.buttons, ACTION_BUTTONS, affordable):
         # Draw icon if available (replace text later)
         if btn_data["icon"]:
-             icon = asset_manager.get_sprite(btn_data["icon"])
+             icon = asset_manager.get_scaled_sprite(btn_data["icon"], (button_size - 10, button_size - 10)) # Cached scaled icon
              if icon:
-                 icon = pygame.transform.scale(icon, (button_size - 10, button_size - 10)) # Scale icon
                  icon_rect = icon.get_rect(center=btn.rect.center)
                  screen.blit(icon, icon_rect)
                  # Optionally render cost text below icon
                  if btn_data["cost"] is not None:
-                     cost_surf = font_small.render(f"${btn_data['cost']}", True, YELLOW if can_afford else RED)
+                     cost_surf = asset_manager.render_text(font_small, f"${btn_data['cost']}", True, YELLOW if can_afford else RED)
                      cost_rect = cost_surf.get_rect(midtop=(btn.rect.centerx, btn.rect.bottom - 18))
                      screen.blit(cost_surf, cost_rect)
 
@@ -171,19 +140,61 @@ def draw_hud(screen, asset_manager, game_state):
         # Tooltip (optional) - Show label on hover
         btn.check_hover(game_state.mouse_pos)
         if btn.is_hovered:
-             tooltip_surf = font_small.render(btn_data["label"], True, BLACK, WHITE) # Black text on white bg
+             tooltip_surf = asset_manager.render_text(font_small, btn_data["label"], True, BLACK, WHITE) # Black text on white bg
              tooltip_rect = tooltip_surf.get_rect(midbottom=(btn.rect.centerx, btn.rect.top - 5))
              screen.blit(tooltip_surf, tooltip_rect)
 
-        hud_buttons.append(btn) # Add button for click handling
+
+def _build_action_buttons(layout, bottom_bar_y, bottom_bar_height, asset_manager, game_state, affordable):
+    """Creates the persistent bottom-bar buttons for the current selection/affordability."""
+    font_small = asset_manager.get_font('comfortaa', 18)
+    button_size = HUD_BUTTON_SIZE
+    button_padding = 10
+    start_x = button_padding
+    button_y = bottom_bar_y + (bottom_bar_height - button_size) / 2
+
+    # Define callback for each button
+    def create_callback(action_name, cost):
+        def callback(game_state):
+            # If the same action is clicked again, deselect it (unless it's 'select' or 'market')
+            non_toggle_actions = ["select", "market", "water", "remove"]
+            if game_state.selected_action == action_name and action_name not in non_toggle_actions:
+                game_state.selected_action = "select" # Default back to select mode
+                game_state.show_placement_preview = False
+                print(f"Deselected: {action_name}")
+            elif action_name == "market":
+                 game_state.game_mode = GameMode.MARKET
+                 print("Opening Market via HUD")
+            else:
+                # Check affordability for placement actions
+                if cost is not None and game_state.money < cost:
+                     print(f"Cannot select {action_name}, not enough money.")
+                     # Maybe flash the money display?
+                     return # Don't select if cannot afford
+
+                game_state.selected_action = action_name
+                game_state.show_placement_preview = action_name.startswith("place_")
+                print(f"Selected action: {action_name}")
+        return callback
+
+    for i, (btn_data, can_afford) in enumerate(zip(ACTION_BUTTONS, affordable)):
+        button_x = start_x + i * (button_size + button_padding)
+        is_selected = game_state.selected_action == btn_data["action"]
+
+        # Create button (simplified text button for now, icons later)
+        btn = Button(button_x, button_y, button_size, button_size,
+                     btn_data["label"].split(" ")[0], # Just use first word as temp label
+                     font_small, create_callback(btn_data["action"], btn_data["cost"]),
+                     bg_color=(YELLOW if is_selected else (BROWN if can_afford else (50,50,50))), # Highlight selected, dim unaffordable
+                     hover_color=GREEN if can_afford else (70,70,70)
+                     )
+        layout.buttons.append(btn) # Add button for click handling
 
 
-def handle_hud_click(mouse_pos):
+def handle_hud_click(mouse_pos, game_state):
     # Check clicks on bottom bar buttons first
-    for button in hud_buttons:
-        if button.rect.collidepoint(mouse_pos):
-            button.click()
-            return True # Click handled by HUD
+    if hud_layout.handle_click(mouse_pos, game_state):
+        return True # Click handled by HUD
 
     # Add checks for clicking top bar elements if needed (e.g., info popups)
 
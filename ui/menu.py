@@ -7,8 +7,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-from game_state import GameMode, WHITE, BLACK, YELLOW, GREEN, BLUE # Import colors etc
+from game_state import GameMode, HONEY_PRICE, WHITE, BLACK, YELLOW, GREEN, BLUE # Import colors etc
 from entities.flower import FLOWER_DATA # For market/instructions
+from systems.render import text_cache # Shared rendered-text cache
 
 # Simple Button Class (Example)
 class Button:
@@ -29,60 +30,82 @@ class Button:
             pygame.draw.rect(screen, BLACK, self.rect, width=1, border_radius=5) # Border
 
         if self.text:  # Only draw text if there is any
-            text_surf = self.font.render(self.text, True, self.text_color)
+            text_surf = text_cache.render(self.font, self.text, True, self.text_color)
             text_rect = text_surf.get_rect(center=self.rect.center)
             screen.blit(text_surf, text_rect)
 
     def check_hover(self, mouse_pos):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
 
-    def click(self):
+    def click(self, game_state):
         if self.is_hovered and self.callback:
-            self.callback()
+            self.callback(game_state)
             return True
         return False
 
-# --- Menu Drawing Functions ---
 
-# Store buttons globally within the module or pass them around
-intro_buttons = []
-instruction_buttons = []
-market_buttons = []
+class RetainedLayout:
+    """Keeps a screen's buttons (and other layout data) until its inputs change.
+
+    Draw functions call needs_rebuild() with a key built from everything the
+    layout depends on; the button tree is only rebuilt when that key changes,
+    and click handling runs against the same persistent tree. Layouts are
+    shared by every Game in the process, so callbacks take the game_state
+    being clicked rather than keeping the one they were built with.
+    """
+    def __init__(self):
+        self.key = None
+        self.buttons = []
+        self.data = {} # Extra per-screen layout values (rects, text lines, ...)
+
+    def needs_rebuild(self, key):
+        if key == self.key:
+            return False
+        self.key = key
+        self.buttons = []
+        self.data = {}
+        return True
+
+    def invalidate(self):
+        self.key = None
+
+    def hover_key(self, mouse_pos):
+        """Which buttons the mouse is over; hover highlights only change with this."""
+        return tuple(button.rect.collidepoint(mouse_pos) for button in self.buttons)
+
+    def handle_click(self, mouse_pos, game_state):
+        for button in self.buttons:
+            if button.rect.collidepoint(mouse_pos):
+                button.click(game_state)
+                return True # Indicate click was handled
+        return False
 
-def draw_intro_screen(screen, asset_manager, game_state):
-    global intro_buttons
-    intro_buttons = [] # Reset buttons each draw call
+# --- Menu Drawing Functions ---
 
-    screen_width = screen.get_width()
-    screen_height = screen.get_height()
-    font_medium = asset_manager.get_font('comfortaa', 24)
+# Persistent button trees, one per screen
+intro_layout = RetainedLayout()
+instructions_layout = RetainedLayout()
+market_layout = RetainedLayout()
 
-    # Draw the title screen background
-    title_bg = asset_manager.get_sprite('title_screen')
-    if title_bg:
-        # Scale to fit screen if needed
-        scaled_bg = pygame.transform.scale(title_bg, (screen_width, screen_height))
-        screen.blit(scaled_bg, (0, 0))
-    else:
-        # Fallback to solid color if image not found
-        screen.fill((135, 206, 235))  # Sky blue fallback
+def _build_intro(layout, screen_width, screen_height, asset_manager, game_state):
+    font_medium = asset_manager.get_font('comfortaa', 24)
 
     # Create invisible buttons that match the image's button positions
     button_w, button_h = 200, 50
     button_x = (screen_width / 2 - button_w / 2) - 150  # Moved left 150 pixels
 
-    def start_game():
+    def start_game(game_state):
         game_state.game_mode = GameMode.GAMEPLAY
         game_state.selected_action = "select"  # Set default action to select
         game_state.show_placement_preview = False
         print("Starting Game")
 
-    def open_instructions():
+    def open_instructions(game_state):
         game_state.game_mode = GameMode.INSTRUCTIONS
         game_state.active_instruction_tab = "Basics" # Reset to first tab
         print("Opening Instructions")
 
-    def quit_game():
+    def quit_game(game_state):
         game_state.running = False
 
     # Create invisible buttons that match the image's button positions
@@ -91,91 +114,52 @@ def draw_intro_screen(screen, asset_manager, game_state):
         "", font_medium, start_game,
         bg_color=(0,0,0,0), hover_color=(255,255,255,30)
     )
-    
+
     instr_button = Button(
         button_x, 500, button_w, button_h,  # Moved up 50 pixels from 550
         "", font_medium, open_instructions,
         bg_color=(0,0,0,0), hover_color=(255,255,255,30)
     )
-    
+
     quit_button = Button(
         button_x, 570, button_w, button_h,  # Moved up 50 pixels from 620
         "", font_medium, quit_game,
         bg_color=(0,0,0,0), hover_color=(255,255,255,30)
     )
 
-    intro_buttons.extend([start_button, instr_button, quit_button])
-
-    # Draw button hover effects (subtle highlight when mouse over)
-    for button in intro_buttons:
-        button.check_hover(game_state.mouse_pos)
-        if button.is_hovered:
-            hover_surface = pygame.Surface((button_w, button_h), pygame.SRCALPHA)
-            hover_surface.fill((255, 255, 255, 30))  # White with 30 alpha
-            screen.blit(hover_surface, button.rect)
-
-def handle_intro_click(mouse_pos):
-    for button in intro_buttons:
-        if button.rect.collidepoint(mouse_pos):
-            button.click()
-            return True # Indicate click was handled
-    return False
+    layout.buttons.extend([start_button, instr_button, quit_button])
 
+    hover_surface = pygame.Surface((button_w, button_h), pygame.SRCALPHA)
+    hover_surface.fill((255, 255, 255, 30))  # White with 30 alpha
+    layout.data["hover_surface"] = hover_surface
 
-def draw_instructions_screen(screen, asset_manager, game_state):
-    global instruction_buttons
-    instruction_buttons = []
-
+def draw_intro_screen(screen, asset_manager, game_state):
     screen_width = screen.get_width()
     screen_height = screen.get_height()
-    font_large = asset_manager.get_font('comfortaa', 36)
-    font_medium = asset_manager.get_font('comfortaa', 24)
-    font_small = asset_manager.get_font('comfortaa', 18)
+    if intro_layout.needs_rebuild((screen_width, screen_height)):
+        _build_intro(intro_layout, screen_width, screen_height, asset_manager, game_state)
 
-    # Background Panel
-    panel_rect = pygame.Rect(screen_width * 0.1, screen_height * 0.1, screen_width * 0.8, screen_height * 0.8)
-    pygame.draw.rect(screen, (50, 50, 70, 220), panel_rect, border_radius=10) # Semi-transparent dark blue/grey
-    pygame.draw.rect(screen, WHITE, panel_rect, width=2, border_radius=10)
-
-    # Title
-    title_surf = font_large.render("How to Play", True, WHITE)
-    title_rect = title_surf.get_rect(center=(screen_width / 2, panel_rect.top + 40))
-    screen.blit(title_surf, title_rect)
-
-    # Tabs
-    tab_names = ["Basics", "Flowers", "Upgrades"]
-    tab_width = panel_rect.width / len(tab_names)
-    tab_height = 40
-    tab_y = panel_rect.top + 80
-
-    for i, name in enumerate(tab_names):
-        tab_rect = pygame.Rect(panel_rect.left + i * tab_width, tab_y, tab_width, tab_height)
-        is_active = game_state.active_instruction_tab == name
-
-        # Tab Button - Reuse Button class or draw manually
-        bg_color = BLUE if is_active else (80, 80, 100)
-        hover_color = (100, 100, 200)
-        text_color = WHITE
-
-        # Create a simple button function for tabs
-        def set_tab_callback(tab_name):
-             def callback():
-                 game_state.active_instruction_tab = tab_name
-                 print(f"Switched to tab: {tab_name}")
-             return callback
+    # Draw the title screen background
+    # Scaled to fit the screen once, then served from the sprite cache
+    scaled_bg = asset_manager.get_scaled_sprite('title_screen', (screen_width, screen_height))
+    if scaled_bg:
+        screen.blit(scaled_bg, (0, 0))
+    else:
+        # Fallback to solid color if image not found
+        screen.fill((135, 206, 235))  # Sky blue fallback
 
-        tab_button = Button(tab_rect.x, tab_rect.y, tab_rect.width, tab_rect.height, name, font_medium,
-                            set_tab_callback(name), text_color=text_color, bg_color=bg_color, hover_color=hover_color)
-        instruction_buttons.append(tab_button)
-        tab_button.check_hover(game_state.mouse_pos)
-        tab_button.draw(screen)
+    # Draw button hover effects (subtle highlight when mouse over)
+    for button in intro_layout.buttons:
+        button.check_hover(game_state.mouse_pos)
+        if button.is_hovered:
+            screen.blit(intro_layout.data["hover_surface"], button.rect)
 
+def handle_intro_click(mouse_pos, game_state):
+    return intro_layout.handle_click(mouse_pos, game_state)
 
-    # Content Area
-    content_y = tab_y + tab_height + 20
-    content_rect = pygame.Rect(panel_rect.left + 20, content_y, panel_rect.width - 40, panel_rect.bottom - content_y - 70) # Space for back button
 
-    # Draw content based on active tab
+def _instruction_lines(game_state):
+    """Text for the active instructions tab."""
     text_lines = []
     if game_state.active_instruction_tab == "Basics":
         text_lines = [
@@ -225,100 +209,133 @@ def draw_instructions_screen(screen, asset_manager, game_state):
              "Purchase upgrades in the Market screen.",
              "(More upgrades might be added later!)",
          ]
+    return text_lines
 
+def _build_instructions(layout, screen_width, screen_height, asset_manager, game_state):
+    font_medium = asset_manager.get_font('comfortaa', 24)
+    font_small = asset_manager.get_font('comfortaa', 18)
 
-    # Render text lines
+    # Background Panel
+    panel_rect = pygame.Rect(screen_width * 0.1, screen_height * 0.1, screen_width * 0.8, screen_height * 0.8)
+    layout.data["panel_rect"] = panel_rect
+
+    # Tabs
+    tab_names = ["Basics", "Flowers", "Upgrades"]
+    tab_width = panel_rect.width / len(tab_names)
+    tab_height = 40
+    tab_y = panel_rect.top + 80
+
+    # Create a simple button function for tabs
+    def set_tab_callback(tab_name):
+         def callback(game_state):
+             game_state.active_instruction_tab = tab_name
+             print(f"Switched to tab: {tab_name}")
+         return callback
+
+    for i, name in enumerate(tab_names):
+        tab_rect = pygame.Rect(panel_rect.left + i * tab_width, tab_y, tab_width, tab_height)
+        is_active = game_state.active_instruction_tab == name
+
+        # Tab Button - Reuse Button class or draw manually
+        bg_color = BLUE if is_active else (80, 80, 100)
+        hover_color = (100, 100, 200)
+        text_color = WHITE
+
+        tab_button = Button(tab_rect.x, tab_rect.y, tab_rect.width, tab_rect.height, name, font_medium,
+                            set_tab_callback(name), text_color=text_color, bg_color=bg_color, hover_color=hover_color)
+        layout.buttons.append(tab_button)
+
+    # Content Area
+    content_y = tab_y + tab_height + 20
+    content_rect = pygame.Rect(panel_rect.left + 20, content_y, panel_rect.width - 40, panel_rect.bottom - content_y - 70) # Space for back button
+
+    # Lay out text lines once; stop at the first one that doesn't fit
+    placed_lines = []
     line_height = font_small.get_linesize()
-    for i, line in enumerate(text_lines):
-        line_surf = font_small.render(line, True, WHITE)
+    for i, line in enumerate(_instruction_lines(game_state)):
+        line_surf = asset_manager.render_text(font_small, line, True, WHITE)
         line_rect = line_surf.get_rect(topleft=(content_rect.left + 10, content_rect.top + 10 + i * line_height))
         if line_rect.bottom < content_rect.bottom - 10: # Check if it fits
-             screen.blit(line_surf, line_rect)
+             placed_lines.append((line_surf, line_rect))
         else:
              break # Stop rendering if text overflows
-
+    layout.data["lines"] = placed_lines
 
     # Back Button
-    def back_to_intro():
+    def back_to_intro(game_state):
         game_state.game_mode = GameMode.INTRO
 
     back_button = Button(
         panel_rect.centerx - 75, panel_rect.bottom - 60, 150, 40,
         "Back", font_medium, back_to_intro
     )
-    instruction_buttons.append(back_button)
-    back_button.check_hover(game_state.mouse_pos)
-    back_button.draw(screen)
-
-def handle_instructions_click(mouse_pos):
-     for button in instruction_buttons:
-         if button.rect.collidepoint(mouse_pos):
-             button.click()
-             return True
-     return False
-
-
-def draw_market_screen(screen, asset_manager, game_state):
-    global market_buttons
-    market_buttons = []
+    layout.buttons.append(back_button)
 
+def draw_instructions_screen(screen, asset_manager, game_state):
     screen_width = screen.get_width()
     screen_height = screen.get_height()
-    font_large = asset_manager.get_font('comfortaa', 36)
-    font_medium = asset_manager.get_font('comfortaa', 24)
-    font_small = asset_manager.get_font('comfortaa', 18)
+    # The Upgrades tab shows level/cost, so the upgrade level is part of the key
+    key = (screen_width, screen_height, game_state.active_instruction_tab, game_state.production_upgrade_level)
+    if instructions_layout.needs_rebuild(key):
+        _build_instructions(instructions_layout, screen_width, screen_height, asset_manager, game_state)
 
-    # Background Panel (similar to instructions)
-    panel_rect = pygame.Rect(screen_width * 0.15, screen_height * 0.15, screen_width * 0.7, screen_height * 0.7)
-    pygame.draw.rect(screen, (60, 80, 60, 230), panel_rect, border_radius=10) # Semi-transparent green
+    font_large = asset_manager.get_font('comfortaa', 36)
+    panel_rect = instructions_layout.data["panel_rect"]
+    pygame.draw.rect(screen, (50, 50, 70, 220), panel_rect, border_radius=10) # Semi-transparent dark blue/grey
     pygame.draw.rect(screen, WHITE, panel_rect, width=2, border_radius=10)
 
     # Title
-    title_surf = font_large.render("Market", True, WHITE)
+    title_surf = asset_manager.render_text(font_large, "How to Play", True, WHITE)
     title_rect = title_surf.get_rect(center=(screen_width / 2, panel_rect.top + 40))
     screen.blit(title_surf, title_rect)
 
+    # Render text lines
+    for line_surf, line_rect in instructions_layout.data["lines"]:
+        screen.blit(line_surf, line_rect)
+
+    for button in instructions_layout.buttons:
+        button.check_hover(game_state.mouse_pos)
+        button.draw(screen)
+
+def handle_instructions_click(mouse_pos, game_state):
+     return instructions_layout.handle_click(mouse_pos, game_state)
+
+
+def _build_market(layout, screen_width, screen_height, asset_manager, game_state):
+    font_medium = asset_manager.get_font('comfortaa', 24)
+    font_small = asset_manager.get_font('comfortaa', 18)
+
+    # Background Panel (similar to instructions)
+    panel_rect = pygame.Rect(screen_width * 0.15, screen_height * 0.15, screen_width * 0.7, screen_height * 0.7)
+    layout.data["panel_rect"] = panel_rect
+
     # Sections: Sell Resources | Buy Upgrades
     section_y = panel_rect.top + 90
     section_height = panel_rect.height - 150 # Reserve space for title and close button
     sell_rect = pygame.Rect(panel_rect.left + 20, section_y, panel_rect.width * 0.4 - 30, section_height)
     buy_rect = pygame.Rect(sell_rect.right + 20, section_y, panel_rect.width * 0.6 - 30, section_height)
+    layout.data["sell_rect"] = sell_rect
+    layout.data["buy_rect"] = buy_rect
 
     # --- Sell Section ---
-    sell_title_surf = font_medium.render("Sell Resources", True, WHITE)
+    sell_title_surf = asset_manager.render_text(font_medium, "Sell Resources", True, WHITE)
     sell_title_rect = sell_title_surf.get_rect(midtop=(sell_rect.centerx, sell_rect.top + 10))
-    screen.blit(sell_title_surf, sell_title_rect)
+    layout.data["sell_y"] = sell_title_rect.bottom + 20
+    honey_line_height = font_small.get_height()
 
-    # Example: Sell Honey (add Wax, Pollen later)
-    honey_price = 1.50 # $ per unit of honey (adjust)
-    sell_y = sell_title_rect.bottom + 20
-
-    honey_text = f"Honey: {game_state.honey:.2f} units"
-    honey_surf = font_small.render(honey_text, True, WHITE)
-    honey_rect = honey_surf.get_rect(topleft=(sell_rect.left + 10, sell_y))
-    screen.blit(honey_surf, honey_rect)
-
-    def sell_all_honey():
-        amount = game_state.honey
-        if amount > 0:
-            earnings = amount * honey_price
-            game_state.money += earnings
-            game_state.honey = 0
-            print(f"Sold {amount:.2f} honey for ${earnings:.2f}")
-        else:
-            print("No honey to sell.")
+    def sell_all_honey(game_state):
+        game_state.sell_honey()
 
     sell_honey_button = Button(
-        sell_rect.left + 10, honey_rect.bottom + 10, sell_rect.width - 20, 40,
-        f"Sell All (${honey_price:.2f}/unit)", font_small, sell_all_honey, bg_color=GREEN
+        sell_rect.left + 10, layout.data["sell_y"] + honey_line_height + 10, sell_rect.width - 20, 40,
+        f"Sell All (${HONEY_PRICE:.2f}/unit)", font_small, sell_all_honey, bg_color=GREEN
     )
-    market_buttons.append(sell_honey_button)
+    layout.buttons.append(sell_honey_button)
     # Add buttons for Wax and Pollen...
 
     # --- Buy Section ---
-    buy_title_surf = font_medium.render("Buy Upgrades", True, WHITE)
+    buy_title_surf = asset_manager.render_text(font_medium, "Buy Upgrades", True, WHITE)
     buy_title_rect = buy_title_surf.get_rect(midtop=(buy_rect.centerx, buy_rect.top + 10))
-    screen.blit(buy_title_surf, buy_title_rect)
 
     buy_y = buy_title_rect.bottom + 20
     upgrade_cost = game_state.get_upgrade_cost()
@@ -326,9 +343,9 @@ def draw_market_screen(screen, asset_manager, game_state):
     can_afford = game_state.money >= upgrade_cost
 
     upgrade_text = f"Prod. Rate Lvl {current_level+1}"
-    cost_text = f"Cost: ${upgrade_cost}"
+    layout.data["cost_text"] = f"Cost: ${upgrade_cost}"
 
-    def purchase_rate_upgrade():
+    def purchase_rate_upgrade(game_state):
         success = game_state.purchase_upgrade()
         if success:
              # Maybe play a sound effect
@@ -340,16 +357,12 @@ def draw_market_screen(screen, asset_manager, game_state):
         bg_color=BLUE if can_afford else (100, 100, 100), # Dim if cannot afford
         text_color=WHITE if can_afford else (180, 180, 180)
     )
-    # Add cost text below or beside button
-    cost_surf = font_small.render(cost_text, True, WHITE)
-    cost_rect = cost_surf.get_rect(midtop=(buy_upgrade_button.rect.centerx, buy_upgrade_button.rect.bottom + 5))
-    screen.blit(cost_surf, cost_rect)
-
-    market_buttons.append(buy_upgrade_button)
+    layout.data["upgrade_button"] = buy_upgrade_button
+    layout.buttons.append(buy_upgrade_button)
     # Add more upgrades here...
 
     # --- Close Button ---
-    def close_market():
+    def close_market(game_state):
         game_state.game_mode = GameMode.GAMEPLAY
         print("Closing Market")
 
@@ -357,23 +370,65 @@ def draw_market_screen(screen, asset_manager, game_state):
         panel_rect.centerx - 75, panel_rect.bottom - 60, 150, 40,
         "Close", font_medium, close_market
     )
-    market_buttons.append(close_button)
+    layout.buttons.append(close_button)
+
+def draw_market_screen(screen, asset_manager, game_state):
+    screen_width = screen.get_width()
+    screen_height = screen.get_height()
+    upgrade_cost = game_state.get_upgrade_cost()
+    key = (screen_width, screen_height, game_state.production_upgrade_level, game_state.money >= upgrade_cost)
+    if market_layout.needs_rebuild(key):
+        _build_market(market_layout, screen_width, screen_height, asset_manager, game_state)
+    data = market_layout.data
+
+    font_large = asset_manager.get_font('comfortaa', 36)
+    font_medium = asset_manager.get_font('comfortaa', 24)
+    font_small = asset_manager.get_font('comfortaa', 18)
+
+    panel_rect = data["panel_rect"]
+    pygame.draw.rect(screen, (60, 80, 60, 230), panel_rect, border_radius=10) # Semi-transparent green
+    pygame.draw.rect(screen, WHITE, panel_rect, width=2, border_radius=10)
 
+    # Title
+    title_surf = asset_manager.render_text(font_large, "Market", True, WHITE)
+    title_rect = title_surf.get_rect(center=(screen_width / 2, panel_rect.top + 40))
+    screen.blit(title_surf, title_rect)
+
+    # --- Sell Section ---
+    sell_rect = data["sell_rect"]
+    sell_title_surf = asset_manager.render_text(font_medium, "Sell Resources", True, WHITE)
+    screen.blit(sell_title_surf, sell_title_surf.get_rect(midtop=(sell_rect.centerx, sell_rect.top + 10)))
+
+    # Example: Sell Honey (add Wax, Pollen later)
+    honey_text = f"Honey: {game_state.honey:.2f} units"
+    honey_surf = asset_manager.render_text(font_small, honey_text, True, WHITE)
+    screen.blit(honey_surf, honey_surf.get_rect(topleft=(sell_rect.left + 10, data["sell_y"])))
+
+    # --- Buy Section ---
+    buy_rect = data["buy_rect"]
+    buy_title_surf = asset_manager.render_text(font_medium, "Buy Upgrades", True, WHITE)
+    screen.blit(buy_title_surf, buy_title_surf.get_rect(midtop=(buy_rect.centerx, buy_rect.top + 10)))
+
+    # Add cost text below or beside button
+    upgrade_button = data["upgrade_button"]
+    cost_surf = asset_manager.render_text(font_small, data["cost_text"], True, WHITE)
+    cost_rect = cost_surf.get_rect(midtop=(upgrade_button.rect.centerx, upgrade_button.rect.bottom + 5))
+    screen.blit(cost_surf, cost_rect)
 
     # Draw all buttons
-    for button in market_buttons:
+    for button in market_layout.buttons:
         button.check_hover(game_state.mouse_pos)
         button.draw(screen)
 
 
-def handle_market_click(mouse_pos):
-     for button in market_buttons:
+def handle_market_click(mouse_pos, game_state):
+     for button in market_layout.buttons:
          if button.rect.collidepoint(mouse_pos):
              # Special check for disabled buttons (like unaffordable upgrade)
              if isinstance(button, Button) and button.bg_color != (100, 100, 100): # Crude check for disabled color
-                 button.click()
+                 button.click(game_state)
                  return True
              elif not isinstance(button, Button): # Handle non-Button clickables if any
-                 button.click()
+                 button.click(game_state)
                  return True
-     return False
\ No newline at end of file
+     return False